@@ -0,0 +1,100 @@
+"""
+AppendBenchmark
+---------------
+
+Compare building a content piece by piece with `MutableString.append`, for each storage
+engine, against `io.StringIO` and a list of strings joined at the end: for each number of
+pieces, the time to append all of them and to read the result as a `str` is measured.
+
+Run from the root of the repository with:
+
+    python benchmarks/bench_append.py
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import io
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+# third party library imports
+
+# local library specific imports
+sys.path.insert(0, str(Path(__file__).parents[1] / "sw_core_data_types" / "src"))
+from sw_core.data_types.mutable_string import MutableString  # noqa: E402
+
+
+PIECE_COUNTS = [10_000, 100_000, 1_000_000]
+
+PIECE = "key = value\n"
+
+STORAGES = ["str", "array", "gap", "rope"]
+
+
+def build_with_join(count: int) -> str:
+    """Return the content built by appending `count` pieces to a list.
+    """
+    pieces = []
+    for _ in range(count):
+        pieces.append(PIECE)
+
+    return "".join(pieces)
+
+
+def build_with_mutable_string(storage: str) -> Callable[[int], str]:
+    """Return the function building the content by appending the pieces to a
+    `MutableString` held by `storage`.
+    """
+    def build(count: int) -> str:
+        string = MutableString(storage=storage)
+        for _ in range(count):
+            string.append(PIECE)
+
+        return string.to_string()
+
+    return build
+
+
+def build_with_string_io(count: int) -> str:
+    """Return the content built by writing `count` pieces to a `io.StringIO`.
+    """
+    buffer = io.StringIO()
+    for _ in range(count):
+        buffer.write(PIECE)
+
+    return buffer.getvalue()
+
+
+def run(build: Callable[[int], str], count: int) -> float:
+    """Return the seconds spent by `build` to build the content of `count` pieces.
+    """
+    start = perf_counter()
+    build(count)
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Print the time per appended piece for each builder and number of pieces.
+    """
+    builders = {"join": build_with_join, "StringIO": build_with_string_io}
+    for storage in STORAGES:
+        builders[storage] = build_with_mutable_string(storage)
+
+    print(f"{'pieces':>12}" + "".join(f"{name:>12}" for name in builders))
+    for count in PIECE_COUNTS:
+        timings = [run(build, count) / count for build in builders.values()]
+        print(f"{count:>12}" + "".join(f"{timing * 1e9:>9.0f} ns" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
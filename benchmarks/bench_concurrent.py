@@ -0,0 +1,119 @@
+"""
+ConcurrentBenchmark
+-------------------
+
+Measure the throughput of `ConcurrentMutableString` under contention: 1, 2, 4, ... reader
+threads call `find`, `__getitem__` and `split` while a writer thread replaces ranges of
+the content, and the operations done by each side in a fixed time are compared with the
+ones of a `MutableString` guarded by a single `threading.Lock`, shared by readers and
+writers.
+
+Run from the root of the repository with:
+
+    python benchmarks/bench_concurrent.py
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import os
+import sys
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+# third party library imports
+
+# local library specific imports
+sys.path.insert(0, str(Path(__file__).parents[1] / "sw_core_data_types" / "src"))
+from sw_core.data_types.concurrent_mutable_string import (  # noqa: E402
+    ConcurrentMutableString)
+from sw_core.data_types.mutable_string import MutableString  # noqa: E402
+
+
+DURATION = 2.0
+
+LINE = "node_1 = load, element_7 = beam, material = steel\n"
+
+CONTENT = LINE * 2_000
+
+READER_COUNTS = (1, 2, 4, 8)
+
+# The storage engine, editing the content in place.
+STORAGE = "array"
+
+
+def run(string: MutableString,
+        guard: Callable[[], AbstractContextManager[object]],
+        readers: int) -> tuple[float, float]:
+    """Return the operations per second done by the `readers` threads altogether and by
+    the writer thread, with each operation on `string` done within `guard()`.
+    """
+    done = threading.Event()
+    counts = [0] * (readers + 1)
+
+    def read(slot: int) -> None:
+        count = 0
+        while not done.is_set():
+            with guard():
+                string.find("material", count % len(CONTENT))
+            with guard():
+                string[count % len(CONTENT):count % len(CONTENT) + len(LINE)]
+            with guard():
+                string.split("\n", 10)
+            count += 3
+
+        counts[slot] = count
+
+    def write() -> None:
+        count = 0
+        while not done.is_set():
+            start = (count * len(LINE)) % len(CONTENT)
+            with guard():
+                string[start:start + 6] = "NODE_1" if count % 2 else "node_1"
+            count += 1
+
+        counts[-1] = count
+
+    threads = [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+    threads.append(threading.Thread(target=write))
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+
+    done.wait(DURATION)
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    elapsed = perf_counter() - start
+    return sum(counts[:-1]) / elapsed, counts[-1] / elapsed
+
+
+def main() -> None:
+    """Print the reads and the writes per second for each number of reader threads, with
+    the reader/writer lock and with a single lock.
+    """
+    mutex = threading.Lock()
+    print(f"{len(CONTENT) / 1e3:.0f} k characters, {os.cpu_count()} processors, "
+          f"{DURATION:.0f} s per run")
+    print(f"{'readers':>8}{'rw reads/s':>14}{'rw writes/s':>14}"
+          f"{'lock reads/s':>14}{'lock writes/s':>14}")
+    for readers in READER_COUNTS:
+        concurrent = run(ConcurrentMutableString(CONTENT, STORAGE), nullcontext, readers)
+        locked = run(MutableString(CONTENT, STORAGE), lambda: mutex, readers)
+        rates = concurrent + locked
+        print(f"{readers:>8}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
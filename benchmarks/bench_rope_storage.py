@@ -0,0 +1,74 @@
+"""
+RopeStorageBenchmark
+--------------------
+
+Compare the scaling of `MutableString` edits with the "str", "array" and "rope" storage
+engines: for each content length, a fixed number of variable-length edits (insertions,
+deletions and slice replacements) at random positions is timed.
+
+Run from the root of the repository with:
+
+    python benchmarks/bench_rope_storage.py
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+# third party library imports
+
+# local library specific imports
+sys.path.insert(0, str(Path(__file__).parents[1] / "sw_core_data_types" / "src"))
+from sw_core.data_types.mutable_string import MutableString  # noqa: E402
+
+
+LENGTHS = [100_000, 1_000_000, 10_000_000]
+
+EDITS = 1_000
+
+STORAGES = ["str", "array", "rope"]
+
+
+def run(storage: str, length: int) -> float:
+    """Return the seconds spent applying `EDITS` random edits to a `MutableString` of the
+    given `length` held by `storage`.
+    """
+    generator = random.Random(length)
+    string = MutableString("abcdefghi\n" * (length // 10), storage=storage)
+
+    start = perf_counter()
+    for _ in range(EDITS):
+        position = generator.randrange(len(string))
+        operation = generator.randrange(3)
+        if operation == 0:
+            string.insert(position, "inserted")
+        elif operation == 1:
+            string.delete(position, position + 8)
+        else:
+            string[position:position + 4] = "replaced"
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Print the time per edit for each storage engine and content length.
+    """
+    print(f"{'length':>12}" + "".join(f"{storage:>14}" for storage in STORAGES))
+    for length in LENGTHS:
+        timings = [run(storage, length) / EDITS for storage in STORAGES]
+        print(f"{length:>12}" + "".join(f"{timing * 1e6:>11.1f} us" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+StringArrayBenchmark
+--------------------
+
+Compare converting to uppercase and searching many short labels held by a single
+`MutableStringArray` against the same labels held by individual `MutableString` objects,
+processed in a Python loop.
+
+Run from the root of the repository with:
+
+    python benchmarks/bench_string_array.py
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+# third party library imports
+
+# local library specific imports
+sys.path.insert(0, str(Path(__file__).parents[1] / "sw_core_data_types" / "src"))
+from sw_core.data_types.mutable_string import MutableString  # noqa: E402
+from sw_core.data_types.mutable_string_array import MutableStringArray  # noqa: E402
+
+
+LABEL_COUNTS = [10_000, 100_000, 500_000]
+
+
+def labels(count: int) -> list[str]:
+    """Return `count` short labels.
+    """
+    return [f"node_{index}_elem" for index in range(count)]
+
+
+def run(function: Callable[[], object]) -> float:
+    """Return the seconds spent by `function`.
+    """
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Print the time per label of `upper` and `find` for each number of labels.
+    """
+    print(f"{'labels':>12}{'loop upper':>14}{'array upper':>14}"
+          f"{'loop find':>14}{'array find':>14}")
+    for count in LABEL_COUNTS:
+        strings = [MutableString(label) for label in labels(count)]
+        string_array = MutableStringArray(labels(count))
+
+        timings = [
+            run(lambda: [string.upper() for string in strings]),
+            run(string_array.upper),
+            run(lambda: [string.find("ELEM") for string in strings]),
+            run(lambda: string_array.find("ELEM")),
+        ]
+        print(f"{count:>12}" + "".join(f"{timing / count * 1e9:>11.0f} ns"
+                                       for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
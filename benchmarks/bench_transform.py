@@ -0,0 +1,82 @@
+"""
+TransformBenchmark
+------------------
+
+Measure how `MutableString.transform` scales with the number of worker processes: a large
+content is converted to uppercase, and its keywords are replaced by a multi-pattern
+regular expression, with 1, 2, 4, ... workers up to the number of processors.
+
+Run from the root of the repository with:
+
+    python benchmarks/bench_transform.py
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import os
+import re
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+# third party library imports
+
+# local library specific imports
+sys.path.insert(0, str(Path(__file__).parents[1] / "sw_core_data_types" / "src"))
+from sw_core.data_types.mutable_string import MutableString  # noqa: E402
+
+
+CONTENT_LENGTH = 1 << 27
+
+LINE = "node_1 = load, element_7 = beam, material = steel\n"
+
+KEYWORDS = {"node": "NODE", "element": "ELEMENT", "material": "MATERIAL", "load": "LOAD"}
+
+KEYWORD = re.compile("|".join(KEYWORDS))
+
+
+def replace_keywords(text: str) -> str:
+    """Return `text` with the keywords replaced at once.
+    """
+    return KEYWORD.sub(lambda match: KEYWORDS[match.group()], text)
+
+
+def run(content: str, function: Callable[[str], str], workers: int) -> float:
+    """Return the seconds spent by `transform` to apply `function` to `content`.
+    """
+    string = MutableString(content)
+    start = perf_counter()
+    string.transform(function, workers)
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Print the time and the speedup over 1 worker of each transform, for each number of
+    workers.
+    """
+    content = LINE * (CONTENT_LENGTH // len(LINE))
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+
+    print(f"{len(content) / 1e6:.0f} M characters, {os.cpu_count()} processors")
+    print(f"{'workers':>8}{'upper':>12}{'speedup':>10}{'keywords':>12}{'speedup':>10}")
+    baseline = [run(content, function, 1) for function in (str.upper, replace_keywords)]
+    for workers in counts:
+        timings = [run(content, function, workers)
+                   for function in (str.upper, replace_keywords)]
+        print(f"{workers:>8}" + "".join(f"{timing:>10.2f} s{base / timing:>9.1f}x"
+                                        for timing, base in zip(timings, baseline)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+ConcurrentMutableString
+-----------------------
+
+The `ConcurrentMutableString` class is a `MutableString` shared by many threads.
+
+The content is guarded by a `ReadWriteLock`: the methods reading the content, e.g. `find`,
+`__getitem__` and `split`, run at the same time in any number of threads, while the
+methods editing it run one at a time, with no reader in between. `batch` holds the lock
+for a whole sequence of edits, which the readers see all at once.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterator, TypeVar
+
+# third party library imports
+
+# local library specific imports
+from .mutable_string import MutableString
+from .string_storage import StrStorage
+
+
+Method = TypeVar("Method", bound=Callable[..., Any])
+
+
+class ReadWriteLock:
+    """A lock held either by any number of readers or by a single writer.
+
+    The writers take precedence: once a writer is waiting, new readers wait for it, so
+    that a steady flow of readers cannot starve the writers. Both kinds of access are
+    reentrant, and the writer can also read, but a reader cannot become a writer without
+    releasing the lock first.
+    """
+    def __init__(self) -> None:
+        # The readers and the writers mostly acquire the mutex alone, waiting on the
+        # condition only when the lock is held by the other side.
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+
+        # The number of threads reading, and the number of writers waiting for them.
+        self._readers = 0
+        self._waiting_writers = 0
+
+        # The identifier of the thread writing, None if none, and its reentrant depth.
+        self._writer: int | None = None
+        self._writer_depth = 0
+
+        # The reentrant read depth of each thread reading, by thread identifier.
+        self._depths: dict[int, int] = {}
+
+    def acquire_read(self) -> None:
+        """Hold the lock for reading, waiting for the writers to release it.
+        """
+        ident = threading.get_ident()
+        depth = self._depths.get(ident, 0)
+        if not depth and self._writer != ident:
+            with self._mutex:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+
+                self._readers += 1
+
+        self._depths[ident] = depth + 1
+
+    def acquire_write(self) -> None:
+        """Hold the lock for writing, waiting for the readers and the other writers to
+        release it.
+        """
+        ident = threading.get_ident()
+        if self._writer == ident:
+            self._writer_depth += 1
+            return
+
+        if ident in self._depths:
+            raise RuntimeError("The lock cannot be held for writing by a reader!")
+
+        with self._mutex:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+
+            self._writer = ident
+            self._writer_depth = 1
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Return a context manager holding the lock for reading, shared with the other
+        readers.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    def release_read(self) -> None:
+        """Release the lock held by `acquire_read`.
+        """
+        ident = threading.get_ident()
+        depth = self._depths.pop(ident) - 1
+        if depth:
+            self._depths[ident] = depth
+        elif self._writer != ident:
+            with self._mutex:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    def release_write(self) -> None:
+        """Release the lock held by `acquire_write`.
+        """
+        self._writer_depth -= 1
+        if not self._writer_depth:
+            with self._mutex:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Return a context manager holding the lock for writing, excluding any other
+        reader and writer.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def _reading(method: Method) -> Method:
+    """Return `method` holding the lock of the `ConcurrentMutableString` for reading.
+    """
+    @wraps(method)
+    def wrapper(self: "ConcurrentMutableString", *args: Any, **kwargs: Any) -> Any:
+        self._lock.acquire_read()
+        try:
+            self._join_pending()
+            return method(self, *args, **kwargs)
+        finally:
+            self._lock.release_read()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _writing(method: Method) -> Method:
+    """Return `method` holding the lock of the `ConcurrentMutableString` for writing.
+    """
+    @wraps(method)
+    def wrapper(self: "ConcurrentMutableString", *args: Any, **kwargs: Any) -> Any:
+        self._lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._lock.release_write()
+
+    return wrapper  # type: ignore[return-value]
+
+
+class ConcurrentMutableString(MutableString):
+    """A `MutableString` whose methods can be called by many threads at the same time:
+    the ones reading the content run concurrently, the ones editing it one at a time. Any
+    storage engine can be used.
+
+    The generators (`iter_lines`, `iter_split`) and the views returned by `view` do not
+    hold the lock while they are consumed: they must be used within `batch`, or while no
+    other thread edits the content.
+    """
+    def __init__(self, string: str = "", storage: str = "str") -> None:
+        super().__init__(string, storage)
+        self._lock = ReadWriteLock()
+
+        # Serializes the readers joining the appends the "str" storage keeps pending.
+        self._pending_lock = threading.Lock()
+
+    __add__ = _reading(MutableString.__add__)
+    __eq__ = _reading(MutableString.__eq__)
+    __getitem__ = _reading(MutableString.__getitem__)
+    __hash__ = _reading(MutableString.__hash__)
+    __iadd__ = _writing(MutableString.__iadd__)
+    __len__ = _reading(MutableString.__len__)
+    __mul__ = _reading(MutableString.__mul__)
+    __repr__ = _reading(MutableString.__repr__)
+    __setitem__ = _writing(MutableString.__setitem__)
+
+    append = _writing(MutableString.append)
+    apply_diff = _writing(MutableString.apply_diff)
+    apply_patches = _writing(MutableString.apply_patches)
+    capitalize = _writing(MutableString.capitalize)
+    checkpoint = _writing(MutableString.checkpoint)
+    close = _writing(MutableString.close)
+    copy = _reading(MutableString.copy)
+    count = _reading(MutableString.count)
+    delete = _writing(MutableString.delete)
+    diff = _reading(MutableString.diff)
+    dirty_ranges = _reading(MutableString.dirty_ranges)
+    extend = _writing(MutableString.extend)
+    find = _reading(MutableString.find)
+    find_all = _reading(MutableString.find_all)
+    find_many = _reading(MutableString.find_many)
+    finditer = _reading(MutableString.finditer)
+    flush = _writing(MutableString.flush)
+    insert = _writing(MutableString.insert)
+    line_column = _reading(MutableString.line_column)
+    line_offset = _reading(MutableString.line_offset)
+    lower = _writing(MutableString.lower)
+    lstrip = _writing(MutableString.lstrip)
+    memory_usage = _reading(MutableString.memory_usage)
+    range_equals = _reading(MutableString.range_equals)
+    range_hash = _reading(MutableString.range_hash)
+    readinto = _writing(MutableString.readinto)
+    redo = _writing(MutableString.redo)
+    restore = _writing(MutableString.restore)
+    rstrip = _writing(MutableString.rstrip)
+    search = _reading(MutableString.search)
+    share = _reading(MutableString.share)
+    snapshot = _reading(MutableString.snapshot)
+    split = _reading(MutableString.split)
+    strip = _writing(MutableString.strip)
+    sub = _writing(MutableString.sub)
+    subscribe = _writing(MutableString.subscribe)
+    to_string = _reading(MutableString.to_string)
+    transform = _writing(MutableString.transform)
+    undo = _writing(MutableString.undo)
+    unsubscribe = _writing(MutableString.unsubscribe)
+    upper = _writing(MutableString.upper)
+    use_journal = _writing(MutableString.use_journal)
+    use_search_index = _writing(MutableString.use_search_index)
+    write = _writing(MutableString.write)
+    write_range = _reading(MutableString.write_range)
+    write_to = _reading(MutableString.write_to)
+
+    @contextmanager
+    def batch(self) -> Iterator["ConcurrentMutableString"]:
+        """Return a context manager holding the lock for writing during the edits done
+        within it, so that the other threads see either none or all of them, and
+        recording them as a single step of the edit journal, if enabled. If an exception
+        is raised within it, the edits done so far are kept.
+
+        Returns
+        -------
+        Iterator[ConcurrentMutableString]
+        """
+        with self._lock.write(), self._journal_step():
+            yield self
+
+    def _join_pending(self) -> None:
+        """Join the appends the "str" storage keeps pending, which it would otherwise do
+        lazily while several readers are using it.
+        """
+        if isinstance(self._storage, StrStorage) and self._storage._pending:
+            with self._pending_lock:
+                self._storage.to_string()
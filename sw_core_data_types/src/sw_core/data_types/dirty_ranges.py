@@ -0,0 +1,78 @@
+"""
+DirtyRanges
+-----------
+
+The `DirtyRanges` class tracks the ranges of a `MutableString` edited since a checkpoint.
+
+The ranges are kept sorted, disjoint and coalesced: an edit overlapping or touching other
+dirty ranges is merged with them, and the ranges after an edit are shifted by the change
+of length, so that they always refer to the current content.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from bisect import bisect_left, bisect_right
+
+# third party library imports
+
+# local library specific imports
+
+
+class DirtyRanges:
+    """The coalesced ranges [start, stop) of a content edited since the last `clear`. A
+    deletion leaves an empty range at the position of the deleted characters.
+    """
+    def __init__(self) -> None:
+        # The starts and the stops of the ranges, both sorted.
+        self._starts: list[int] = []
+        self._stops: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def add(self, start: int, stop: int, new_stop: int) -> None:
+        """Add the edit replacing the characters in the range [`start`, `stop`) with the
+        ones in [`start`, `new_stop`).
+
+        Parameters
+        ----------
+        start : int
+        stop : int
+        new_stop : int
+        """
+        delta = new_stop - stop
+        starts = self._starts
+        stops = self._stops
+
+        # The ranges overlapping or touching the edit are [first, last).
+        first = bisect_left(stops, start)
+        last = bisect_right(starts, stop)
+        if first < last:
+            start = min(start, starts[first])
+            new_stop = max(new_stop, stops[last - 1] + delta)
+
+        starts[first:] = [start] + [index + delta for index in starts[last:]]
+        stops[first:] = [new_stop] + [index + delta for index in stops[last:]]
+
+    def clear(self) -> None:
+        """Remove all the ranges.
+        """
+        self._starts.clear()
+        self._stops.clear()
+
+    def ranges(self) -> list[tuple[int, int]]:
+        """Return the ranges as sorted (start, stop) tuples.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+        """
+        return list(zip(self._starts, self._stops))
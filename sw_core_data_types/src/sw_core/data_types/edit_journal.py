@@ -0,0 +1,208 @@
+"""
+EditJournal
+-----------
+
+The `EditJournal` class records the edits of a `MutableString`, so that they can be undone
+and redone.
+
+Each edit is recorded as a delta: the index of the edited range, the text it held before
+the edit and the text it holds after it, both trimmed of the characters that the edit did
+not change. Therefore the history costs memory proportional to the size of the edits, not
+to the length of the content, and a configurable cap evicts the oldest edits.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+# third party library imports
+
+# local library specific imports
+
+
+# Default maximum number of characters held by the deltas of an `EditJournal`.
+DEFAULT_MAX_SIZE = 1 << 20
+
+# An edit, as (index, old text, new text): the text at index was old and it is new.
+Delta = tuple[int, str, str]
+
+
+class EditJournal:
+    """The undo and redo history of the edits of a `MutableString`.
+
+    The history is a sequence of steps, each one made of the deltas of the edits to be
+    undone or redone together. Recording a step discards the steps undone so far.
+    """
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if not isinstance(max_size, int) or max_size < 0:
+            err_msg = (f"The maximum size of an EditJournal must be a non-negative "
+                       f"integer, given \"{max_size}\"!")
+            raise RuntimeError(err_msg)
+
+        # Maximum number of characters held by the deltas of the steps.
+        self.max_size = max_size
+
+        # The steps which can be undone, the oldest first, and the ones which can be
+        # redone, the most recently undone last.
+        self._undo_steps: deque[tuple[Delta, ...]] = deque()
+        self._redo_steps: list[tuple[Delta, ...]] = []
+
+        # Number of characters held by the deltas of all the steps.
+        self._size = 0
+
+        # The deltas of the step being recorded by `group`, None outside of it.
+        self._group: list[Delta] | None = None
+
+    @property
+    def redo_count(self) -> int:
+        """The number of steps which can be redone.
+        """
+        return len(self._redo_steps)
+
+    @property
+    def size(self) -> int:
+        """The number of characters held by the deltas of all the steps.
+        """
+        return self._size
+
+    @property
+    def undo_count(self) -> int:
+        """The number of steps which can be undone.
+        """
+        return len(self._undo_steps)
+
+    def clear(self) -> None:
+        """Discard all the steps.
+        """
+        self._undo_steps.clear()
+        self._redo_steps.clear()
+        self._size = 0
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        """Return a context manager recording all the edits done within it as a single
+        step. Nested groups are part of the outermost one.
+        """
+        if self._group is not None:
+            yield
+            return
+
+        self._group = []
+        try:
+            yield
+        finally:
+            deltas, self._group = self._group, None
+            if deltas:
+                self._push(tuple(deltas))
+
+    def record(self, index: int, old: str, new: str) -> None:
+        """Record the edit replacing the text `old` at `index` with `new`, as a step of
+        its own unless it is done within `group`.
+
+        Parameters
+        ----------
+        index : int
+        old : str
+        new : str
+        """
+        prefix_length = _common_prefix_length(old, new)
+        if prefix_length == len(old) == len(new):
+            return
+
+        suffix_length = _common_suffix_length(old[prefix_length:], new[prefix_length:])
+
+        delta = (index + prefix_length,
+                 old[prefix_length:len(old) - suffix_length],
+                 new[prefix_length:len(new) - suffix_length])
+        if self._group is not None:
+            self._group.append(delta)
+        else:
+            self._push((delta,))
+
+    def redo(self) -> tuple[Delta, ...] | None:
+        """Return the deltas of the most recently undone step, in the order in which they
+        were recorded, and mark it as done. None if there is no step to redo.
+
+        Returns
+        -------
+        tuple[Delta, ...] | None
+        """
+        if not self._redo_steps:
+            return None
+
+        step = self._redo_steps.pop()
+        self._undo_steps.append(step)
+        return step
+
+    def undo(self) -> tuple[Delta, ...] | None:
+        """Return the deltas of the most recent step, in the order in which they were
+        recorded, and mark it as undone. None if there is no step to undo.
+
+        Returns
+        -------
+        tuple[Delta, ...] | None
+        """
+        if not self._undo_steps:
+            return None
+
+        step = self._undo_steps.pop()
+        self._redo_steps.append(step)
+        return step
+
+    def _push(self, step: tuple[Delta, ...]) -> None:
+        """Record `step` as the most recent one, evicting the oldest ones if needed.
+        """
+        self._size -= sum(_step_size(redo_step) for redo_step in self._redo_steps)
+        self._redo_steps.clear()
+
+        self._undo_steps.append(step)
+        self._size += _step_size(step)
+        while self._size > self.max_size:
+            self._size -= _step_size(self._undo_steps.popleft())
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Return the length of the longest common prefix of `first` and `second`, comparing
+    slices with a binary search so that long strings are not scanned one character at a
+    time in Python.
+    """
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[low:middle] == second[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def _common_suffix_length(first: str, second: str) -> int:
+    """Return the length of the longest common suffix of `first` and `second`.
+    """
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        first_tail = first[len(first) - middle:len(first) - low]
+        if first_tail == second[len(second) - middle:len(second) - low]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def _step_size(step: tuple[Delta, ...]) -> int:
+    """Return the number of characters held by the deltas of `step`.
+    """
+    return sum(len(old) + len(new) for _, old, new in step)
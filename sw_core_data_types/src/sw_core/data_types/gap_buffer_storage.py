@@ -0,0 +1,188 @@
+"""
+GapBufferStorage
+----------------
+
+The gap buffer storage engine of the `MutableString` class.
+
+The content is held by an array of code points with a block of free items (the gap) at the
+position of the last edit (the cursor):
+
+    [content before the cursor][gap][content after the cursor]
+
+An edit at the cursor only writes into the gap, while an edit elsewhere first moves the
+gap, copying the items in between. Edits close to each other, as when a template is
+patched from the beginning to the end, are therefore amortized O(1).
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from array import array
+from sys import getsizeof
+
+# third party library imports
+
+# local library specific imports
+from .string_storage import StringStorage, decode_code_points, encode_code_points
+
+
+# Minimum number of free items allocated when the gap is full.
+MIN_GAP_LENGTH = 256
+
+
+class GapBufferStorage(StringStorage):
+    """Storage engine holding the content in a gap buffer, so that consecutive edits close
+    to each other are amortized O(1). The width of the items is chosen from the content as
+    for `ArrayStorage`. The `str` returned by `to_string` is built lazily and cached until
+    the next mutation.
+
+    The copies share the buffer until one of them is edited (copy-on-write).
+    """
+    def __init__(self, string: str = "") -> None:
+        self._array = array("B")
+
+        # Whether the buffer may be shared with a copy, and then it must be copied before
+        # being edited.
+        self._shared = False
+
+        # The gap is the range [self._gap_start, self._gap_end) of self._array.
+        self._gap_start = 0
+        self._gap_end = 0
+
+        # The materialized content, None if it has to be rebuilt.
+        self._string: str | None = None
+
+        self.load(string)
+
+    def __len__(self) -> int:
+        return len(self._array) - self._gap_end + self._gap_start
+
+    @property
+    def cursor(self) -> int:
+        """The position of the gap in the content.
+        """
+        return self._gap_start
+
+    def copy(self) -> "GapBufferStorage":
+        copy = GapBufferStorage()
+        copy._array = self._array
+        copy._gap_start = self._gap_start
+        copy._gap_end = self._gap_end
+        copy._shared = self._shared = True
+        copy._string = self._string
+        return copy
+
+    def get_item(self, index: int) -> str:
+        if self._string is not None:
+            return self._string[index]
+
+        if index >= self._gap_start:
+            index += self._gap_end - self._gap_start
+
+        return chr(self._array[index])
+
+    def get_range(self, start: int, stop: int) -> str:
+        if self._string is not None:
+            return self._string[start:stop]
+
+        gap_length = self._gap_end - self._gap_start
+        buffer = memoryview(self._array)
+        if stop <= self._gap_start:
+            return decode_code_points(buffer[start:stop], self._array.typecode)
+
+        if start >= self._gap_start:
+            return decode_code_points(buffer[start + gap_length:stop + gap_length],
+                                      self._array.typecode)
+
+        return (decode_code_points(buffer[start:self._gap_start], self._array.typecode) +
+                decode_code_points(buffer[self._gap_end:stop + gap_length],
+                                   self._array.typecode))
+
+    def load(self, string: str) -> None:
+        self._array = encode_code_points(string)
+        self._gap_start = self._gap_end = len(self._array)
+        self._shared = False
+        self._string = None
+
+    def memory_usage(self) -> int:
+        cache = 0 if self._string is None else getsizeof(self._string)
+        return getsizeof(self._array) + cache
+
+    def replace(self, start: int, stop: int, value: str) -> None:
+        try:
+            encoded = encode_code_points(value, self._array.typecode)
+        except UnicodeEncodeError:
+            # The content is re-encoded with wider items, an empty gap goes after the edit.
+            string = self.to_string()
+            self.load(string[:start] + value + string[stop:])
+            self._gap_start = self._gap_end = start + len(value)
+            return
+
+        if self._shared:
+            self._array = self._array[:]
+            self._shared = False
+
+        self._string = None
+
+        # Replacements of the same length not across the gap are written in place.
+        if stop - start == len(encoded) and (stop <= self._gap_start or
+                                             start >= self._gap_start):
+            if start >= self._gap_start:
+                start += self._gap_end - self._gap_start
+                stop += self._gap_end - self._gap_start
+
+            self._array[start:stop] = encoded
+            return
+
+        self._move_gap(start)
+        self._gap_end += stop - start
+        self._reserve(len(encoded))
+        self._array[self._gap_start:self._gap_start + len(encoded)] = encoded
+        self._gap_start += len(encoded)
+
+    def to_string(self) -> str:
+        if self._string is None:
+            buffer = memoryview(self._array)
+            self._string = (
+                decode_code_points(buffer[:self._gap_start], self._array.typecode) +
+                decode_code_points(buffer[self._gap_end:], self._array.typecode)
+            )
+
+        return self._string
+
+    def _move_gap(self, position: int) -> None:
+        """Move the gap before the character at `position`.
+        """
+        if position < self._gap_start:
+            count = self._gap_start - position
+            self._array[self._gap_end - count:self._gap_end] = \
+                self._array[position:self._gap_start]
+            self._gap_start -= count
+            self._gap_end -= count
+
+        elif position > self._gap_start:
+            count = position - self._gap_start
+            self._array[self._gap_start:self._gap_start + count] = \
+                self._array[self._gap_end:self._gap_end + count]
+            self._gap_start += count
+            self._gap_end += count
+
+    def _reserve(self, length: int) -> None:
+        """Grow the gap, if needed, to hold at least `length` items. The gap grows in
+        proportion to the content, so that a sequence of insertions is amortized O(1).
+        """
+        gap_length = self._gap_end - self._gap_start
+        if gap_length >= length:
+            return
+
+        growth = max(length - gap_length, len(self) // 2, MIN_GAP_LENGTH)
+        self._array[self._gap_end:self._gap_end] = \
+            array(self._array.typecode, bytes(growth * self._array.itemsize))
+        self._gap_end += growth
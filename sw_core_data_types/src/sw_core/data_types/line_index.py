@@ -0,0 +1,118 @@
+"""
+LineIndex
+---------
+
+The `LineIndex` class converts the offsets of a text to (line, column) positions and back.
+
+The index holds the sorted offsets at which the lines of the text start, so that both
+conversions are a binary search or a lookup, O(log n). When the text is edited, the index
+is updated incrementally: only the lines touched by the edit are scanned again, while the
+offsets of the lines after the edit are shifted at once.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import re
+
+# third party library imports
+import numpy as np
+import numpy.typing as npt
+
+# local library specific imports
+from .string_storage import StringStorage
+
+
+# Matches the line boundaries of a string, as split by `str.splitlines`.
+LINE_BREAK = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+class LineIndex:
+    """The index of the lines of the content of a `StringStorage`. Lines and columns are
+    counted from 0, and the lines are broken at the same boundaries as `str.splitlines`,
+    except that a line break at the end of the content starts an empty last line.
+    """
+    def __init__(self, storage: StringStorage) -> None:
+        # The offsets at which the lines start, the first one being always 0.
+        self._starts = LineIndex._line_starts(storage.to_string(), 0, True)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line_column(self, offset: int) -> tuple[int, int]:
+        """Return the (line, column) position of the character at index `offset`, which
+        may also be the length of the content, i.e. the position after the last character.
+
+        Parameters
+        ----------
+        offset : int
+
+        Returns
+        -------
+        tuple[int, int]
+        """
+        line = int(np.searchsorted(self._starts, offset, side="right")) - 1
+        return line, offset - int(self._starts[line])
+
+    def line_offset(self, line: int) -> int:
+        """Return the index of the first character of `line`.
+
+        Parameters
+        ----------
+        line : int
+
+        Returns
+        -------
+        int
+        """
+        return int(self._starts[line])
+
+    def update(self,
+               storage: StringStorage,
+               start: int,
+               stop: int,
+               new_stop: int) -> None:
+        """Update the index after the characters in the range [`start`, `stop`) of the
+        content of `storage` have been replaced with the ones in [`start`, `new_stop`).
+
+        The lines from the one holding the character before the edit, which may be half of
+        a "\\r\\n" line break, up to the one holding the character after the edit are
+        scanned again.
+        """
+        starts = self._starts
+        first = int(np.searchsorted(starts, max(start - 1, 0), side="right")) - 1
+        last = int(np.searchsorted(starts, stop + 1, side="right"))
+
+        scan_start = int(starts[first])
+        if last < len(starts):
+            # The line break before the line starting at starts[last] is not touched.
+            scan_stop = int(starts[last]) + new_stop - stop
+            text = storage.get_range(scan_start, scan_stop)
+            scanned = LineIndex._line_starts(text, scan_start, False)
+        else:
+            text = storage.get_range(scan_start, len(storage))
+            scanned = LineIndex._line_starts(text, scan_start, True)
+
+        self._starts = np.concatenate((starts[:first + 1],
+                                       scanned[1:],
+                                       starts[last:] + (new_stop - stop)))
+
+    @staticmethod
+    def _line_starts(text: str, offset: int, last_break: bool) -> npt.NDArray[np.int64]:
+        """Return the offsets at which the lines of `text` start, `offset` being the index
+        of `text` in the content, including the line started by a line break at the end of
+        `text` only if `last_break` is True.
+        """
+        starts = [0]
+        starts.extend(match.end() for match in LINE_BREAK.finditer(text))
+        if not last_break and len(starts) > 1 and starts[-1] == len(text):
+            starts.pop()
+
+        return np.array(starts, dtype=np.int64) + offset
@@ -0,0 +1,188 @@
+"""
+MmapStorage
+-----------
+
+The memory-mapped file storage engine of the `MutableString` class.
+
+The content is the content of a file mapped in memory by `mmap`: reading and writing
+characters go directly to the mapped pages, so that a file larger than the available
+memory can be searched and patched without being read into a Python `str`. The changes
+are written back to the file by the operating system, or explicitly by `flush`.
+
+Since each character must be a single byte of the file, the file is decoded as Latin-1:
+ASCII and Latin-1 files are read as they are, while the multi-byte characters of other
+encodings (e.g. UTF-8) appear as sequences of Latin-1 characters. Since the length of a
+file cannot change while it is mapped, only the edits keeping the length are possible.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import mmap
+from os import PathLike
+from typing import Callable
+
+# third party library imports
+
+# local library specific imports
+from .string_storage import StringStorage
+
+
+# Number of characters converted at a time by `MmapStorage.convert`.
+CONVERSION_CHUNK_LENGTH = 1 << 20
+
+# The modes in which a file can be mapped, with the corresponding `mmap` access.
+ACCESS_MODES = {
+    "r": mmap.ACCESS_READ,
+    "r+": mmap.ACCESS_WRITE,
+}
+
+
+class MmapStorage(StringStorage):
+    """Storage engine holding the content in a memory-mapped file, decoded as Latin-1.
+    """
+    def __init__(self, path: str | PathLike[str], mode: str = "r+") -> None:
+        if mode not in ACCESS_MODES:
+            err_msg = (f"Unknown mode \"{mode}\", available ones are: "
+                       f"{', '.join(ACCESS_MODES)}!")
+            raise RuntimeError(err_msg)
+
+        self._readonly = mode == "r"
+        self._file = open(path, "rb" if self._readonly else "r+b")
+
+        # An empty file cannot be mapped, but there is nothing to map anyway.
+        self._map: mmap.mmap | None = None
+        try:
+            self._file.seek(0, 2)
+            if self._file.tell():
+                self._map = mmap.mmap(self._file.fileno(), 0, access=ACCESS_MODES[mode])
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __len__(self) -> int:
+        return 0 if self._map is None else len(self._map)
+
+    def close(self) -> None:
+        """Flush the changes and release the mapping and the file.
+        """
+        if self._map is not None:
+            if not self._readonly:
+                self._map.flush()
+
+            self._map.close()
+            self._map = None
+
+        self._file.close()
+
+    def convert(self, start: int, stop: int, function: Callable[[str], str]) -> int:
+        """Apply `function`, which must convert each character independently of the others
+        (as `str.lower` and `str.upper` do), to the characters in the range [`start`,
+        `stop`), one chunk of the file at a time. The characters that `function` would
+        convert to more characters or to characters not in Latin-1 are left unchanged.
+        """
+        for chunk_start in range(start, stop, CONVERSION_CHUNK_LENGTH):
+            chunk_stop = min(chunk_start + CONVERSION_CHUNK_LENGTH, stop)
+            chunk = self.get_range(chunk_start, chunk_stop)
+            converted = MmapStorage._convert_chunk(chunk, function)
+            if converted != chunk:
+                self._write(chunk_start, converted.encode("latin-1"))
+
+        return stop
+
+    def find(self, substr: str, start: int | None = None, end: int | None = None) -> int:
+        # As for `str.find`, nothing is found past the end, not even an empty string.
+        if start is not None and start > len(self):
+            return -1
+
+        start, end, _ = slice(start, end).indices(len(self))
+        try:
+            encoded = substr.encode("latin-1")
+        except UnicodeEncodeError:
+            return -1
+
+        if self._map is None:
+            return 0 if not encoded and start == 0 else -1
+
+        return self._map.find(encoded, start, end)
+
+    def flush(self) -> None:
+        """Write the changes back to the file.
+        """
+        if self._map is not None and not self._readonly:
+            self._map.flush()
+
+    def get_item(self, index: int) -> str:
+        assert self._map is not None
+        return chr(self._map[index])
+
+    def get_range(self, start: int, stop: int) -> str:
+        if self._map is None:
+            return ""
+
+        return self._map[start:stop].decode("latin-1")
+
+    def load(self, string: str) -> None:
+        self.replace(0, len(self), string)
+
+    def memory_usage(self) -> int:
+        """Return 0, since the content stays in the mapped file, whose pages are loaded
+        and released by the operating system.
+        """
+        return 0
+
+    def replace(self, start: int, stop: int, value: str) -> None:
+        if len(value) != stop - start:
+            err_msg = ("The length of memory-mapped MutableString objects cannot change, "
+                       "the replacement string must have the same length of the range!")
+            raise RuntimeError(err_msg)
+
+        try:
+            encoded = value.encode("latin-1")
+        except UnicodeEncodeError as error:
+            err_msg = ("Memory-mapped MutableString objects can hold only Latin-1 "
+                       f"characters, given \"{value[error.start:error.end]}\"!")
+            raise RuntimeError(err_msg) from error
+
+        self._write(start, encoded)
+
+    def to_string(self) -> str:
+        return self.get_range(0, len(self))
+
+    def _write(self, start: int, encoded: bytes) -> None:
+        """Write the `encoded` characters to the file, starting at index `start`.
+        """
+        if not encoded:
+            return
+
+        if self._readonly:
+            raise RuntimeError("The MutableString is mapped to a file in read-only mode!")
+
+        assert self._map is not None
+        self._map[start:start + len(encoded)] = encoded
+
+    @staticmethod
+    def _convert_chunk(chunk: str, function: Callable[[str], str]) -> str:
+        """Return `function(chunk)`, leaving unchanged the characters that `function`
+        would convert to more characters or to characters not in Latin-1.
+        """
+        converted = function(chunk)
+        if len(converted) == len(chunk) and (not converted or max(converted) <= "\xff"):
+            return converted
+
+        characters = []
+        for character in chunk:
+            converted = function(character)
+            if len(converted) == 1 and converted <= "\xff":
+                characters.append(converted)
+            else:
+                characters.append(character)
+
+        return "".join(characters)
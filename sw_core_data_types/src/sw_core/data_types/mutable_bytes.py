@@ -0,0 +1,348 @@
+"""
+MutableBytes
+------------
+
+The `MutableBytes` class represents a mutable sequence of bytes.
+
+This class is the binary companion of `MutableString`: it provides the same methods, but
+holding bytes instead of characters, so that binary payloads do not need to be decoded
+into text. The content is held by a `bytearray` and `to_memoryview` returns a view of it,
+so that it can be handed to `socket.send`, `file.write` or `numpy.frombuffer` without
+being copied. With Python >= 3.12, the `MutableBytes` object itself can be handed to them,
+since it implements the buffer protocol.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from typing import Union
+
+# third party library imports
+
+# local library specific imports
+from .mutable_string import STRIP_CHUNK_LENGTH
+
+
+# The objects that `MutableBytes` accepts as content.
+BytesLike = Union[bytes, bytearray, memoryview, "MutableBytes"]
+
+
+class MutableBytes:
+    """This class mimics a Python `bytes` object, but being mutable at the same time. It
+    provides the same methods as `MutableString`, where `lower`, `upper` and `capitalize`
+    only convert ASCII letters, as for `bytes`.
+
+    `to_memoryview` gives direct access to the content, as `memoryview(MutableBytes(...))`
+    does with Python >= 3.12 only, where the buffer protocol can be implemented in Python.
+    As for `bytearray`, the length of the content cannot change while such views exist.
+    """
+    def __add__(self, value: BytesLike) -> bytes:
+        return bytes(self._data) + MutableBytes._to_bytes_like(value, "Sum")
+
+    def __init__(self, data: BytesLike = b"") -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview, MutableBytes)):
+            err_msg = (f"MutableBytes objects can be created only from bytes-like "
+                       f"objects, given of type \"{type(data)}\"!")
+            raise RuntimeError(err_msg)
+
+        self._data = bytearray(data)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MutableBytes):
+            other = other._data
+
+        return self._data == other
+
+    def __getitem__(self, value: int | slice) -> int | bytes:
+        if isinstance(value, int):
+            if value < 0:
+                value += len(self._data)
+
+            if value < 0 or value >= len(self._data):
+                raise IndexError(f"The given index {value} is out of range!")
+
+            return self._data[value]
+
+        if isinstance(value, slice):
+            return bytes(self._data[value])
+
+        raise TypeError(f"Slicing cannot be done with type of \"{type(value)}\"!")
+
+    def __hash__(self) -> int:
+        return hash(bytes(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __mul__(self, value: int) -> bytes:
+        if not isinstance(value, int):
+            err_msg = (f"Multiplication operation for MutableBytes objects is possible "
+                       f"only from integers, given of type \"{type(value)}\"!")
+            raise RuntimeError(err_msg)
+
+        return bytes(self._data) * value
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        view.release()
+
+    def __repr__(self) -> str:
+        return f"MutableBytes({bytes(self._data)!r})"
+
+    def __setitem__(self, item: int | slice, value: BytesLike | int) -> None:
+        if isinstance(value, int) and isinstance(item, int):
+            value = bytes((value,))
+
+        value = MutableBytes._to_bytes_like(value, "Set")
+
+        if isinstance(item, slice):
+            indices = item.indices(len(self._data))
+            if indices[2] != 1:
+                raise RuntimeError("Slice with step != 1 is not supported!")
+
+            # As for lists, the replacement may have a different length than the slice.
+            self._data[indices[0]:max(indices[0], indices[1])] = value
+
+            return
+
+        length = len(self._data)
+        if item == -1:
+            item += length
+
+        elif item < 0:
+            err_msg = f"Trying to set a value to an unknown position: {item}!"
+            raise RuntimeError(err_msg)
+
+        # Bytes past the end of the content are appended.
+        start = max(0, min(item, length))
+        self._data[start:max(start, min(item + len(value), length))] = value
+
+    def capitalize(self, start: int | None = None, end: int | None = None) -> None:
+        """Convert the first byte to uppercase and the others to lowercase, ASCII letters
+        only. Only the bytes of `MutableBytes[start:end]` are converted, as if they were a
+        sequence of their own. Optional arguments `start` and `end` are interpreted as in
+        slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        self._data[start:end] = self._data[start:end].capitalize()
+
+    def delete(self, start: int | None = None, end: int | None = None) -> None:
+        """Remove the bytes of `MutableBytes[start:end]`. Optional arguments `start` and
+        `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        del self._data[start:end]
+
+    def find(self,
+             sub: BytesLike | int,
+             start: int | None = None,
+             end: int | None = None) -> int:
+        """Return the lowest index in the `MutableBytes` where `sub` is found, such that
+        `sub` is contained within `MutableBytes[start:end]`. Optional arguments `start`
+        and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        sub: BytesLike | int
+            The subsequence to look for, or the value of a single byte.
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+            -1 on failure.
+        """
+        if isinstance(sub, MutableBytes):
+            sub = sub._data
+
+        return self._data.find(sub, start, end)
+
+    def insert(self, position: int, data: BytesLike) -> None:
+        """Insert `data` before the byte at index `position`. As for lists, a negative
+        `position` is counted from the end and positions out of range are clipped to the
+        content.
+
+        Parameters
+        ----------
+        position : int
+        data : BytesLike
+        """
+        data = MutableBytes._to_bytes_like(data, "Insert")
+        position, _, _ = slice(position, None).indices(len(self._data))
+        self._data[position:position] = data
+
+    def lower(self, start: int | None = None, end: int | None = None) -> None:
+        """Convert the ASCII letters of `MutableBytes[start:end]` to lowercase. Optional
+        arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        self._data[start:end] = self._data[start:end].lower()
+
+    def lstrip(self, chars: BytesLike | None = None) -> tuple[int, int]:
+        """Remove leading ASCII whitespaces, see `strip`.
+
+        Parameters
+        ----------
+        chars : BytesLike | None, optional default to None
+
+        Returns
+        -------
+        tuple[int, int]
+        """
+        return self._strip(chars, True, False)
+
+    def rstrip(self, chars: BytesLike | None = None) -> tuple[int, int]:
+        """Remove trailing ASCII whitespaces, see `strip`.
+
+        Parameters
+        ----------
+        chars : BytesLike | None, optional default to None
+
+        Returns
+        -------
+        tuple[int, int]
+        """
+        return self._strip(chars, False, True)
+
+    def split(self, sep: BytesLike | None = None, maxsplit: int = -1) -> list[bytes]:
+        """Return a list of the subsequences of the content, using `sep` as separator.
+
+        Parameters
+        ----------
+        sep : BytesLike | None, optional
+            The separator used to split the content. When set to None (the default value),
+            it will split on any ASCII whitespace and it will discard empty subsequences
+            from the result.
+        maxsplit : int, optional
+            Maximum number of splits (starting from the left). -1 (the default value)
+            means no limit.
+
+        Returns
+        -------
+        list[bytes]
+        """
+        if isinstance(sep, MutableBytes):
+            sep = sep._data
+
+        return [bytes(item) for item in self._data.split(sep, maxsplit)]
+
+    def strip(self, chars: BytesLike | None = None) -> tuple[int, int]:
+        """Remove leading and trailing ASCII whitespaces, deleting only the stripped
+        ranges.
+
+        Parameters
+        ----------
+        chars : BytesLike | None, optional default to None
+            The bytes to be removed instead of whitespaces, as for `bytes.strip`.
+
+        Returns
+        -------
+        tuple[int, int]
+            The range [start, end) of the content before stripping which was kept.
+        """
+        return self._strip(chars, True, True)
+
+    def to_bytes(self) -> bytes:
+        """Return a copy of the content of this `MutableBytes` as `bytes`.
+
+        Returns
+        -------
+        bytes
+        """
+        return bytes(self._data)
+
+    def to_memoryview(self) -> memoryview:
+        """Return a `memoryview` of the content of this `MutableBytes`, sharing it without
+        copying: this is the same object returned by `memoryview(MutableBytes(...))` with
+        Python >= 3.12. As for `bytearray`, the length of the content cannot change until
+        the view is released.
+
+        Returns
+        -------
+        memoryview
+        """
+        return memoryview(self._data)
+
+    def upper(self, start: int | None = None, end: int | None = None) -> None:
+        """Convert the ASCII letters of `MutableBytes[start:end]` to uppercase. Optional
+        arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        self._data[start:end] = self._data[start:end].upper()
+
+    def _strip(self,
+               chars: BytesLike | None,
+               leading: bool,
+               trailing: bool) -> tuple[int, int]:
+        """Remove the leading and/or the trailing `chars` (ASCII whitespaces if None) and
+        return the range of the content before stripping which was kept.
+        """
+        if isinstance(chars, MutableBytes):
+            chars = chars._data
+
+        data = self._data
+        length = len(data)
+
+        start = 0
+        while leading and start < length:
+            chunk = data[start:start + STRIP_CHUNK_LENGTH]
+            stripped = len(chunk) - len(chunk.lstrip(chars))
+            start += stripped
+            if stripped < len(chunk):
+                break
+
+        stop = length
+        while trailing and stop > start:
+            chunk = data[max(stop - STRIP_CHUNK_LENGTH, start):stop]
+            stripped = len(chunk) - len(chunk.rstrip(chars))
+            stop -= stripped
+            if stripped < len(chunk):
+                break
+
+        del data[stop:]
+        del data[:start]
+        return start, stop
+
+    @staticmethod
+    def _to_bytes_like(value: object, operation: str) -> bytes | bytearray | memoryview:
+        """Return `value` as an object supported by the `bytearray` methods.
+
+        Raises
+        ------
+        RuntimeError
+            If `value` is not a bytes-like object.
+        """
+        if isinstance(value, MutableBytes):
+            return value._data
+
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            err_msg = (f"{operation} operation for MutableBytes objects is possible only "
+                       f"with bytes-like objects, given value of type \"{type(value)}\"!")
+            raise RuntimeError(err_msg)
+
+        return value
@@ -19,16 +19,108 @@ __email__ = "studio.w.engineers@gmail.com"
 __status__ "Release to manufacturing"
 """
 # standard library imports
+import codecs
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import repeat
+from os import PathLike
+from types import TracebackType
+from typing import BinaryIO, Callable, ContextManager, Iterable, Iterator, TextIO
 
 # third party library imports
 
 # local library specific imports
+from .dirty_ranges import DirtyRanges
+from .edit_journal import DEFAULT_MAX_SIZE, EditJournal
+from .gap_buffer_storage import GapBufferStorage
+from .line_index import LINE_BREAK, LineIndex
+from .mmap_storage import MmapStorage
+from .myers_diff import DEFAULT_MAX_DISTANCE, Hunk, diff
+from .pattern_matcher import PatternMatcher, compile_patterns
+from .rolling_hash import RollingHash
+from .rope_storage import RopeStorage
+from .shared_memory_storage import SharedMemoryStorage
+from .string_storage import ArrayStorage, StringStorage, StrStorage
+from .suffix_array import SuffixArray
+
+
+# Number of characters read or written at a time by `MutableString.readinto`, `write_to`
+# and `write_range`.
+FILE_CHUNK_LENGTH = 1 << 20
+
+# The encodings taking one byte per character, for which `MutableString.write_range` finds
+# the position of a range in the file without encoding the characters before it.
+SINGLE_BYTE_ENCODINGS = ("ascii", "iso8859-1")
+
+# Number of characters read at a time by `MutableStringView.iter_lines` and `iter_split`
+# looking for the line breaks and the words.
+ITER_CHUNK_LENGTH = 1 << 16
+
+# Number of characters read at a time by `MutableString.strip` looking for the first and
+# the last characters to be kept.
+STRIP_CHUNK_LENGTH = 1 << 12
+
+# The minimum number of characters of the chunks processed in parallel by
+# `MutableString.transform`.
+TRANSFORM_CHUNK_LENGTH = 1 << 20
+
+# The number of chunks per worker process of `MutableString.transform`, so that the faster
+# workers take over the chunks of the slower ones.
+TRANSFORM_CHUNKS_PER_WORKER = 4
+
+# The storage engines available for `MutableString` objects, by name.
+STORAGE_TYPES: dict[str, type[StringStorage]] = {
+    "array": ArrayStorage,
+    "gap": GapBufferStorage,
+    "rope": RopeStorage,
+    "str": StrStorage,
+}
+
+
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str | re.Pattern[str], flags: int = 0) -> re.Pattern[str]:
+    """Return the compiled regular expression of `pattern`, reusing the most recently
+    compiled ones, so that the regular expressions used by `search`, `finditer` and `sub`
+    are compiled once for all the `MutableString` objects.
+
+    Parameters
+    ----------
+    pattern : str | re.Pattern[str]
+        A regular expression, or an already compiled one, which is returned as it is.
+    flags : int, optional default to 0
+        The flags of `re.compile`, which cannot be given with a compiled pattern.
+
+    Returns
+    -------
+    re.Pattern[str]
+    """
+    return re.compile(pattern, flags)
 
 
 class MutableString:
     """This class mimics a Python string object, but being mutable at the same time.
     It stores the content of the string and provides some of the methods that the original
     Python `str` class provides.
+
+    The content is held by a storage engine, chosen by name at construction time among the
+    `STORAGE_TYPES`:
+        - "str" (the default) keeps an immutable `str`, every edit copies the content;
+        - "array" keeps a mutable array of code points, edits are done in place and
+          `to_string` builds the `str` lazily, caching it until the next edit;
+        - "gap" keeps an array of code points with free space at the last edit position,
+          consecutive edits close to each other are amortized O(1);
+        - "rope" keeps a balanced tree of chunks, replacing, inserting and deleting ranges
+          of any length is O(log n), which suits edits scattered over large contents.
+
+    A `MutableString` can also hold the content of a memory-mapped file, see `open`.
+
+    `copy` and `snapshot` are cheap: the copies share the content of the storage engine
+    until one of them is edited, see `snapshot`. The edits can be undone and redone once
+    the edit journal is enabled, see `use_journal`.
     """
     def __add__(self, value: str) -> str:
         if not isinstance(value, str):
@@ -36,37 +128,94 @@ class MutableString:
                        f"strings, given of type \"{type(value)}\"!")
             raise RuntimeError(err_msg)
 
-        return self._data + value
+        return self.to_string() + value
 
-    def __init__(self, string: str = "") -> None:
+    def __iadd__(self, value: str) -> "MutableString":
+        self.append(value)
+        return self
+
+    def __init__(self, string: str = "", storage: str = "str") -> None:
         if not isinstance(string, str):
             err_msg = (f"MutableString objects can be created only from strings, given "
                        f"of type \"{type(string)}\"!")
             raise RuntimeError(err_msg)
 
-        self._data = string
+        if storage not in STORAGE_TYPES:
+            err_msg = (f"Unknown storage \"{storage}\", available ones are: "
+                       f"{', '.join(STORAGE_TYPES)}!")
+            raise RuntimeError(err_msg)
+
+        self._storage = STORAGE_TYPES[storage](string)
+
+        # Whether `find`, `find_all` and `count` use the substring search index.
+        self._use_search_index = False
+
+        # The substring search index, built lazily and dropped at each edit.
+        self._search_index: SuffixArray | None = None
+
+        # The undo and redo history, None if disabled.
+        self._journal: EditJournal | None = None
+
+        # The index of the lines, built lazily and then kept up to date at each edit.
+        self._line_index: LineIndex | None = None
+
+        # The ranges edited since the last checkpoint, None before the first one.
+        self._dirty_ranges: DirtyRanges | None = None
+
+        # The functions called after each edit.
+        self._subscribers: list[Callable[[int, int, int], None]] = []
+
+        # The hash of the content and the table of the prefix hashes, computed lazily and
+        # dropped at each edit.
+        self._hash: int | None = None
+        self._rolling_hash: RollingHash | None = None
+
+    def __copy__(self) -> "MutableString":
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "MutableString":
+        # The content is made of characters only, with no other objects to be copied.
+        return self.copy()
+
+    def __enter__(self) -> "MutableString":
+        return self
 
     def __eq__(self, other: object) -> bool:
-        return self._data == other
+        return self.to_string() == other
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
 
     def __getitem__(self, value: int | slice) -> str:
         if isinstance(value, int):
             if value < 0:
-                value += len(self._data)
+                value += len(self._storage)
 
-            if value < 0 or value >= len(self._data):
+            if value < 0 or value >= len(self._storage):
                 raise IndexError(f"The given index {value} is out of range!")
 
-            return self._data[value]
+            return self._storage.get_item(value)
 
         if isinstance(value, slice):
-            return "".join(self._data[item]
-                           for item in range(*value.indices(len(self._data))))
+            start, stop, step = value.indices(len(self._storage))
+            if step == 1:
+                return self._storage.get_range(start, max(start, stop))
+
+            return self._storage.to_string()[value]
 
         raise TypeError(f"Slicing cannot be done with type of \"{type(value)}\"!")
 
     def __hash__(self) -> int:
-        return hash(self._data)
+        if self._hash is None:
+            self._hash = hash(self.to_string())
+
+        return self._hash
+
+    def __len__(self) -> int:
+        return len(self._storage)
 
     def __mul__(self, value: int) -> str:
         if not isinstance(value, int):
@@ -74,10 +223,15 @@ class MutableString:
                        f"only from integers, given of type \"{type(value)}\"!")
             raise RuntimeError(err_msg)
 
-        return self._data * value
+        return self.to_string() * value
+
+    def __reduce__(self) -> tuple[Callable[..., "MutableString"], tuple[object, ...]]:
+        # Only the storage is pickled, e.g. the name of the block of shared memory: the
+        # indexes, the hashes, the edit journal and the subscribers are left behind.
+        return _unpickle, (type(self), self._storage)
 
     def __repr__(self) -> str:
-        return self._data
+        return self.to_string()
 
     def __setitem__(self, item: int | slice, value: str) -> None:
         if not isinstance(value, str):
@@ -86,37 +240,360 @@ class MutableString:
             raise RuntimeError(err_msg)
 
         if isinstance(item, slice):
-            indices = item.indices(len(self._data))
+            indices = item.indices(len(self._storage))
             if indices[2] != 1:
                 raise RuntimeError("Slice with step != 1 is not supported!")
 
-            if indices[1] - indices[0] != len(value):
-                err_msg = "The replacement string must have the same length of the slice!"
-                raise RuntimeError(err_msg)
-
-            self._data = (
-                self._data[:indices[0]] +
-                value +
-                self._data[indices[0] +
-                len(value):]
-            )
+            # As for lists, the replacement may have a different length than the slice.
+            self._replace(indices[0], max(indices[0], indices[1]), value)
 
             return
 
+        length = len(self._storage)
         if item == -1:
-            item += len(self._data)
+            item += length
 
         elif item < 0:
             err_msg = f"Trying to set a value to an unknown position: {item}!"
             raise RuntimeError(err_msg)
 
-        self._data = self._data[:item] + value + self._data[item + len(value):]
+        # Characters past the end of the content are appended.
+        start = max(0, min(item, length))
+        self._replace(start, max(start, min(item + len(value), length)), value)
+
+    @property
+    def shared_memory_name(self) -> str | None:
+        """The name of the block of shared memory holding the content, by which `attach`
+        gives access to it from other processes, None if the content is not in shared
+        memory.
+        """
+        if isinstance(self._storage, SharedMemoryStorage):
+            return self._storage.name
+
+        return None
+
+    def append(self, string: str) -> None:
+        """Append `string` to the end of the `MutableString`, in place. Appending takes
+        amortized O(len(string)) time with any storage engine, so that a `MutableString`
+        can be used to build a large content piece by piece, as `io.StringIO` or a list of
+        strings joined at the end.
+
+        Parameters
+        ----------
+        string : str
+        """
+        if not isinstance(string, str):
+            err_msg = ("Append operation for MutableString objects is possible only with "
+                       f"strings, given value of type \"{type(string)}\"!")
+            raise RuntimeError(err_msg)
+
+        if string:
+            length = len(self._storage)
+            self._replace(length, length, string)
+
+    def apply_diff(self, hunks: Iterable[Hunk]) -> None:
+        """Apply the edit script returned by `diff`, turning this `MutableString` into the
+        other one. The hunks are applied at once by `apply_patches`, in a single pass, and
+        they are undone and redone together.
+
+        Parameters
+        ----------
+        hunks : Iterable[Hunk]
+            The hunks (`start`, `end`, `replacement`), sorted and not overlapping.
+        """
+        hunks = list(hunks)
+        previous_end = 0
+        for start, end, replacement in hunks:
+            if not isinstance(replacement, str):
+                err_msg = ("Diffs for MutableString objects are possible only with "
+                           f"strings, given value of type \"{type(replacement)}\"!")
+                raise RuntimeError(err_msg)
+
+            if not previous_end <= start <= end <= len(self._storage):
+                err_msg = (f"The hunk range [{start}, {end}) is out of range, or not "
+                           "sorted!")
+                raise RuntimeError(err_msg)
+
+            previous_end = end
+
+        self.apply_patches(hunks)
+
+    def apply_patches(self, patches: Iterable[tuple[int, int, str]]) -> None:
+        """Replace many ranges of the `MutableString` at once. Each patch is a tuple
+        (`start`, `end`, `replacement`) replacing `MutableString[start:end]` with
+        `replacement`, of any length. All the indices refer to the content before the
+        patches are applied, so the patches must not overlap.
+
+        Only the range from the first patch to the last one is rebuilt, in a single pass,
+        that is, in O(range length + total patch size). The edit journal, the
+        `dirty_ranges` and the subscribers are told about each patch, as if the patches
+        were applied one at a time from the first one; they are undone and redone
+        together. The patches of memory-mapped and shared memory `MutableString` objects
+        must keep the length of their range, and are written in place.
+
+        Parameters
+        ----------
+        patches : Iterable[tuple[int, int, str]]
+            The patches, in any order. Patches inserting text at the same index are
+            applied in the given order.
+        """
+        length = len(self._storage)
+        patches = sorted(patches, key=lambda patch: (patch[0], patch[1]))
+        fixed_length = isinstance(self._storage, (MmapStorage, SharedMemoryStorage))
+
+        previous_end = 0
+        for start, end, replacement in patches:
+            if not isinstance(replacement, str):
+                err_msg = ("Patches for MutableString objects are possible only with "
+                           f"strings, given value of type \"{type(replacement)}\"!")
+                raise RuntimeError(err_msg)
+
+            if not 0 <= start <= end <= length:
+                err_msg = f"The patch range [{start}, {end}) is out of range!"
+                raise RuntimeError(err_msg)
+
+            if start < previous_end:
+                err_msg = f"The patch range [{start}, {end}) overlaps another patch!"
+                raise RuntimeError(err_msg)
+
+            if fixed_length and len(replacement) != end - start:
+                err_msg = ("The length of memory-mapped and shared memory MutableString "
+                           "objects cannot change, the patch range "
+                           f"[{start}, {end}) must keep its length!")
+                raise RuntimeError(err_msg)
+
+            previous_end = end
+
+        if not patches:
+            return
+
+        if fixed_length:
+            with self._journal_step():
+                for start, end, replacement in patches:
+                    self._replace(start, end, replacement)
+
+            return
+
+        olds = [""] * len(patches)
+        if self._journal is not None:
+            olds = [self._storage.get_range(start, end) for start, end, _ in patches]
+
+        pieces = []
+        previous_end = patches[0][0]
+        for start, end, replacement in patches:
+            pieces.append(self._storage.get_range(previous_end, start))
+            pieces.append(replacement)
+            previous_end = end
+
+        value = "".join(pieces)
+        self._store(patches[0][0], previous_end, value)
 
-    def capitalize(self) -> None:
+        # The ranges of the patches, shifted by the length changes of the previous ones.
+        edits = []
+        offset = 0
+        with self._journal_step():
+            for (start, end, replacement), old in zip(patches, olds):
+                start, end = start + offset, end + offset
+                if self._journal is not None:
+                    self._journal.record(start, old, replacement)
+
+                edits.append((start, end, start + len(replacement)))
+                offset += len(replacement) - end + start
+
+        self._changed(patches[0][0], previous_end, patches[0][0] + len(value), edits)
+
+    @classmethod
+    def attach(cls,
+               name: str,
+               mode: str = "r",
+               start: int | None = None,
+               end: int | None = None) -> "MutableString":
+        """Return a `MutableString` attached to the content placed in shared memory by
+        `share`, possibly by another process, without copying it.
+
+        In mode "r" the content can only be read. In mode "r+" the characters of
+        `MutableString[start:end]` can be replaced as well, by same-length edits, so that
+        several processes can write disjoint ranges of the same content at the same time:
+        the edits are seen at once by all the processes attached to the content, which
+        are in charge of not writing the same range concurrently. The returned object is a
+        context manager releasing the shared memory on exit.
+
+        Parameters
+        ----------
+        name : str
+            The `shared_memory_name` of the shared `MutableString`.
+        mode : str, optional default to "r"
+            "r" to attach in read-only mode, "r+" to attach in read-write mode.
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+        MutableString
+        """
+        string = cls()
+        string._storage = SharedMemoryStorage.attach(name, mode, start, end)
+        return string
+
+    def capitalize(self, start: int | None = None, end: int | None = None) -> None:
         """Capitalize the first character and the rest convert to lowercase.
         If Python >= 3.8: the first character is put into titlecase rather than uppercase.
+
+        Only the characters of `MutableString[start:end]` are converted, as if they were a
+        string of their own. Optional arguments `start` and `end` are interpreted as in
+        slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        if start >= end:
+            return
+
+        # The first character is converted alone, so that a memory-mapped file can convert
+        # the others one chunk at a time.
+        with self._journal_step():
+            stop = self._convert(start, start + 1, str.title)
+            self._convert(stop, stop + end - start - 1, str.lower)
+
+    def checkpoint(self) -> None:
+        """Start tracking the ranges edited from now on, see `dirty_ranges`.
+        """
+        if self._dirty_ranges is None:
+            self._dirty_ranges = DirtyRanges()
+        else:
+            self._dirty_ranges.clear()
+
+    def close(self) -> None:
+        """Release the resources held by this `MutableString`, that is, the file mapped by
+        `open` or the shared memory of `share` and `attach`. For the others, this method
+        does nothing.
+        """
+        self._storage.close()
+
+    def copy(self) -> "MutableString":
+        """Return a copy of this `MutableString`, with the same storage engine, sharing
+        the content until one of the two is edited (copy-on-write). The copy of a
+        memory-mapped `MutableString` holds its content in memory.
+
+        Returns
+        -------
+        MutableString
+        """
+        copy = type(self)()
+        copy._storage = self._storage.copy()
+        copy._use_search_index = self._use_search_index
+        copy._search_index = self._search_index
+        copy._hash = self._hash
+        copy._rolling_hash = self._rolling_hash
+        return copy
+
+    def count(self, substr: str, start: int | None = None, end: int | None = None) -> int:
+        """Return the number of non-overlapping occurrences of `substr` in
+        `MutableString[start:end]`. Optional arguments `start` and `end` are interpreted
+        as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+        int
+        """
+        if not substr or not self._use_search_index:
+            return self._storage.to_string().count(substr, start, end)
+
+        count = 0
+        next_start = 0
+        for index in self.find_all(substr, start, end):
+            if index >= next_start:
+                count += 1
+                next_start = index + len(substr)
+
+        return count
+
+    def dirty_ranges(self) -> list[tuple[int, int]]:
+        """Return the ranges of the content edited since the last `checkpoint`, so that
+        whatever is computed from the content can be recomputed over the changed spans
+        only. The ranges are sorted and coalesced, and they refer to the current content:
+        a deletion leaves an empty range at the position of the deleted characters.
+        Before the first checkpoint, the whole content is dirty.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The (start, stop) tuples of the ranges.
         """
-        self._data = self._data.capitalize()
+        if self._dirty_ranges is None:
+            return [(0, len(self._storage))]
+
+        return self._dirty_ranges.ranges()
+
+    def delete(self, start: int | None = None, end: int | None = None) -> None:
+        """Remove the characters of `MutableString[start:end]`. Optional arguments `start`
+        and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        if start < end:
+            self._replace(start, end, "")
+
+    def diff(self,
+             other: "MutableString | str",
+             max_distance: int = DEFAULT_MAX_DISTANCE) -> list[Hunk]:
+        """Return the edit script turning this `MutableString` into `other`, as the list
+        of the hunks (`start`, `end`, `replacement`), sorted and not overlapping, each one
+        replacing `MutableString[start:end]` with `replacement`: the script is applied by
+        `apply_diff` or `apply_patches`.
+
+        The script is the shortest one, found by the O(ND) algorithm of Myers, so that the
+        cost grows with the number D of changed characters rather than with the length of
+        the content. If more than `max_distance` characters should be inserted and
+        deleted, the range between the common prefix and suffix is replaced by a single
+        hunk instead.
+
+        Parameters
+        ----------
+        other : MutableString | str
+        max_distance : int, optional default to DEFAULT_MAX_DISTANCE
+
+        Returns
+        -------
+        list[Hunk]
+        """
+        if isinstance(other, MutableString):
+            other = other.to_string()
+
+        if not isinstance(other, str):
+            err_msg = ("Diff operation for MutableString objects is possible only with "
+                       f"strings, given value of type \"{type(other)}\"!")
+            raise RuntimeError(err_msg)
+
+        return diff(self._storage.to_string(), other, max_distance)
+
+    def extend(self, strings: Iterable[str]) -> None:
+        """Append all the `strings` to the end of the `MutableString`, in place.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+        """
+        strings = list(strings)
+        for string in strings:
+            if not isinstance(string, str):
+                err_msg = ("Extend operation for MutableString objects is possible only "
+                           f"with strings, given value of type \"{type(string)}\"!")
+                raise RuntimeError(err_msg)
+
+        self.append("".join(strings))
 
     def find(self, substr: str, start: int | None = None, end: int | None = None) -> int:
         """Return the lowest index in the `MutableString` where `substr` is found, such
@@ -132,52 +609,1301 @@ class MutableString:
         -------
             -1 on failure.
         """
-        return self._data.find(substr, start, end)
+        if substr and self._use_search_index:
+            start, end, _ = slice(start, end).indices(len(self._storage))
+            return self._get_search_index().find(substr, start, end)
+
+        return self._storage.find(substr, start, end)
+
+    def find_all(self,
+                 substr: str,
+                 start: int | None = None,
+                 end: int | None = None) -> list[int]:
+        """Return the sorted indices of all the occurrences of `substr`, overlapping ones
+        included, contained within `MutableString[start:end]`. Optional arguments `start`
+        and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+        list[int]
+        """
+        if not substr:
+            err_msg = "MutableString objects cannot look for the empty string!"
+            raise RuntimeError(err_msg)
+
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        if self._use_search_index:
+            return self._get_search_index().find_all(substr, start, end)
+
+        indices = []
+        index = self._storage.find(substr, start, end)
+        while index >= 0:
+            indices.append(index)
+            index = self._storage.find(substr, index + 1, end)
+
+        return indices
+
+    def find_many(self,
+                  patterns: Iterable[str] | PatternMatcher,
+                  start: int | None = None,
+                  end: int | None = None) -> list[tuple[int, str]]:
+        """Return all the occurrences, overlapping ones included, of all the `patterns`
+        within `MutableString[start:end]`, found in a single pass over the content.
+        Optional arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        patterns : Iterable[str] | PatternMatcher
+            The patterns to look for, or their compiled `PatternMatcher`, which can be
+            reused across many `MutableString` objects. The matchers compiled here from
+            the patterns are cached, too.
+        start: int | None, optional default to None
+        end: int | None, optional default to None
 
-    def lower(self) -> None:
-        """Convert the string to lowercase.
+        Returns
+        -------
+        list[tuple[int, str]]
+            The (index, pattern) tuples, sorted by index and then by length of the
+            pattern.
         """
-        self._data = self._data.lower()
+        if not isinstance(patterns, PatternMatcher):
+            patterns = compile_patterns(tuple(patterns))
+
+        return patterns.find_all(self._storage.to_string(), start, end)
+
+    def finditer(self,
+                 pattern: str | re.Pattern[str],
+                 start: int | None = None,
+                 end: int | None = None,
+                 flags: int = 0) -> Iterator[re.Match[str]]:
+        """Return an iterator over the non-overlapping matches of the regular expression
+        `pattern` within `MutableString[start:end]`, as `re.Pattern.finditer` with `pos`
+        and `endpos`. Optional arguments `start` and `end` are interpreted as in slice
+        notation.
+
+        The content must not be edited while iterating over the matches.
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            The regular expression, compiled through `compile_regex`.
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        flags : int, optional default to 0
 
-    def lstrip(self) -> None:
-        """Remove leading whitespaces.
+        Returns
+        -------
+        Iterator[re.Match[str]]
         """
-        self._data = self._data.lstrip()
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        regex = compile_regex(pattern, flags)
+        return regex.finditer(self._storage.to_string(), start, max(start, end))
 
-    def rstrip(self) -> None:
-        """Remove trailing whitespaces.
+    def flush(self) -> None:
+        """Write the changes back to the file mapped by `open`. For the others, this method
+        does nothing.
         """
-        self._data = self._data.rstrip()
+        self._storage.flush()
 
-    def split(self, sep: str | None = None, maxsplit: int = -1) -> list[str]:
-        """Return a list of the substrings in the string, using `sep` as string separator.
+    @classmethod
+    def from_file(cls,
+                  path: str | PathLike[str],
+                  chunk_size: int = FILE_CHUNK_LENGTH,
+                  storage: str = "str",
+                  encoding: str = "utf-8") -> "MutableString":
+        """Return a `MutableString` holding the content of the text file at `path`, read
+        `chunk_size` characters at a time straight into the storage engine, see
+        `readinto`. Unlike `open`, the file is decoded with any `encoding` and the content
+        is held in memory, so that it can be edited freely. The line breaks are kept as
+        they are in the file.
+
+        Parameters
+        ----------
+        path : str | PathLike[str]
+        chunk_size : int, optional default to FILE_CHUNK_LENGTH
+        storage : str, optional default to "str"
+            The name of the storage engine, one of the `STORAGE_TYPES`.
+        encoding : str, optional default to "utf-8"
+
+        Returns
+        -------
+        MutableString
+        """
+        string = cls(storage=storage)
+        with open(path, encoding=encoding, newline="") as fileobj:
+            string.readinto(fileobj, chunk_size)
+
+        return string
+
+    def insert(self, position: int, string: str) -> None:
+        """Insert `string` before the character at index `position`. As for lists, a
+        negative `position` is counted from the end and positions out of range are clipped
+        to the content.
+
+        Parameters
+        ----------
+        position : int
+        string : str
+        """
+        if not isinstance(string, str):
+            err_msg = ("Insert operation for MutableString objects is possible "
+                       f"only with strings, given value of type \"{type(string)}\"!")
+            raise RuntimeError(err_msg)
+
+        position, _, _ = slice(position, None).indices(len(self._storage))
+        self._replace(position, position, string)
+
+    def iter_lines(self, keepends: bool = False) -> Iterator[str]:
+        """Yield the lines of the string one at a time, breaking at the same line
+        boundaries as `str.splitlines`, so that large contents can be processed without
+        holding all the lines at once.
+
+        Parameters
+        ----------
+        keepends : bool, optional default to False
+            Whether the line breaks are included in the yielded lines.
+        """
+        return self.view().iter_lines(keepends)
+
+    def iter_split(self, sep: str | None = None, maxsplit: int = -1) -> Iterator[str]:
+        """Yield the substrings of `split` one at a time, so that large contents can be
+        processed without holding all the substrings at once. The arguments are the same
+        as for `split`.
 
         Parameters
         ----------
         sep : str | None, optional
-            The separator used to split the string. When set to None (the default value),
-            it will split on any whitespace character (including \\n \\r \\t \\f and
-            spaces) and it will discard empty strings from the result.
         maxsplit : int, optional
-            Maximum number of splits (starting from the left). -1 (the default value)
-            means no limit.
+        """
+        return self.view().iter_split(sep, maxsplit)
+
+    def line_column(self, offset: int) -> tuple[int, int]:
+        """Return the (line, column) position of the character at index `offset`, both
+        counted from 0. `offset` may also be the length of the content, i.e. the position
+        after the last character. The lines are broken as by `str.splitlines`.
+
+        The first call builds the index of the lines, which is then kept up to date at
+        each edit by scanning again only the edited lines, so that the positions are
+        found in O(log n) however the content is edited.
+
+        Parameters
+        ----------
+        offset : int
 
         Returns
         -------
-        list[str]
+        tuple[int, int]
+
+        Raises
+        ------
+        IndexError
+            If `offset` is out of range.
         """
-        return self._data.split(sep, maxsplit)
+        if not 0 <= offset <= len(self._storage):
+            raise IndexError(f"The given offset {offset} is out of range!")
 
-    def to_string(self) -> str:
-        """Return the content of this `MutableString` as `str`.
+        return self._get_line_index().line_column(offset)
+
+    def line_offset(self, line: int) -> int:
+        """Return the index of the first character of `line`, counted from 0, see
+        `line_column`.
+
+        Parameters
+        ----------
+        line : int
 
         Returns
         -------
-        str
+        int
+
+        Raises
+        ------
+        IndexError
+            If `line` is out of range.
+        """
+        line_index = self._get_line_index()
+        if not 0 <= line < len(line_index):
+            raise IndexError(f"The given line {line} is out of range!")
+
+        return line_index.line_offset(line)
+
+    def lower(self, start: int | None = None, end: int | None = None) -> None:
+        """Convert the string to lowercase. Only the characters of
+        `MutableString[start:end]` are converted, the others are not even read. Optional
+        arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        if start < end:
+            self._convert(start, end, str.lower)
+
+    def lstrip(self, chars: str | None = None) -> tuple[int, int]:
+        """Remove leading whitespaces, see `strip`.
+
+        Parameters
+        ----------
+        chars : str | None, optional default to None
+
+        Returns
+        -------
+        tuple[int, int]
         """
-        return self._data
+        return self._strip(chars, True, False)
+
+    def memory_usage(self) -> int:
+        """Return the number of bytes of memory taken by the content, as held by the
+        storage engine. With the "array" and "gap" storages, the content takes 1, 2 or 4
+        bytes per character, as a Python `str`, depending on the widest character.
 
-    def upper(self) -> None:
-        """Convert the string to uppercase.
+        Returns
+        -------
+        int
         """
-        self._data = self._data.upper()
+        return self._storage.memory_usage()
+
+    @classmethod
+    def open(cls, path: str | PathLike[str], mode: str = "r+") -> "MutableString":
+        """Return a `MutableString` holding the content of the file at `path`, mapped in
+        memory. Reading, searching, same-length edits and case conversions work directly
+        on the mapped pages of the file, without reading it into a `str`: the content is
+        read only by the methods returning the whole of it, e.g. `to_string` and `split`.
+
+        Each byte of the file is a character, decoded as Latin-1, and the length of the
+        content cannot change. The edits are written back to the file by the operating
+        system, or explicitly by `flush` and `close`. The returned object is a context
+        manager closing the file on exit.
+
+        Parameters
+        ----------
+        path : str | PathLike[str]
+        mode : str, optional default to "r+"
+            "r" to map the file in read-only mode, "r+" to map it in read-write mode.
+
+        Returns
+        -------
+        MutableString
+        """
+        string = cls()
+        string._storage = MmapStorage(path, mode)
+        return string
+
+    def range_equals(self,
+                     other: "MutableString",
+                     start: int | None = None,
+                     end: int | None = None,
+                     other_start: int | None = None) -> bool:
+        """Return whether `MutableString[start:end]` is equal to the range of the same
+        length of `other` starting at index `other_start`, comparing the fingerprints of
+        the two ranges (see `range_hash`) in O(1). Optional arguments `start` and `end`
+        are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        other : MutableString
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        other_start: int | None, optional default to None
+            The index of the range in `other`, the same as `start` if None.
+
+        Returns
+        -------
+        bool
+            False if the range of `other` exceeds its content.
+        """
+        if not isinstance(other, MutableString):
+            err_msg = (f"Ranges of MutableString objects can be compared only with other "
+                       f"MutableString objects, given of type \"{type(other)}\"!")
+            raise RuntimeError(err_msg)
+
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        end = max(start, end)
+        if other_start is None:
+            other_start = start
+        elif other_start < 0:
+            other_start += len(other._storage)
+
+        other_end = other_start + end - start
+        if other_start < 0 or other_end > len(other._storage):
+            return False
+
+        return (self._get_rolling_hash().range_hash(start, end) ==
+                other._get_rolling_hash().range_hash(other_start, other_end))
+
+    def range_hash(self, start: int | None = None, end: int | None = None) -> int:
+        """Return the fingerprint of `MutableString[start:end]`, computed in O(1).
+        Optional arguments `start` and `end` are interpreted as in slice notation.
+
+        The fingerprint is a polynomial hash of the characters: equal strings have equal
+        fingerprints, whatever their position and `MutableString`, while different
+        strings of length m have equal fingerprints with probability about m / 2^62.
+        The fingerprints can be compared within the same process only. The first call
+        after an edit builds the table of the prefix hashes of the content, in O(n).
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+        int
+        """
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        return self._get_rolling_hash().range_hash(start, max(start, end))
+
+    def readinto(self, fileobj: TextIO, chunk_size: int = FILE_CHUNK_LENGTH) -> int:
+        """Append the content read from the text file `fileobj` up to its end, reading
+        `chunk_size` characters at a time and appending each chunk to the storage engine,
+        so that the whole file is never held in a single `str` besides the content. The
+        appended chunks are undone and redone together.
+
+        Parameters
+        ----------
+        fileobj : TextIO
+            A file object opened in text mode, or any object with a `read(size)` method
+            returning strings.
+        chunk_size : int, optional default to FILE_CHUNK_LENGTH
+
+        Returns
+        -------
+        int
+            The number of characters read.
+        """
+        MutableString._check_chunk_size(chunk_size)
+        count = 0
+        with self._journal_step():
+            while chunk := fileobj.read(chunk_size):
+                if not isinstance(chunk, str):
+                    err_msg = ("Read operation for MutableString objects is possible "
+                               "only from text files, given chunk of type "
+                               f"\"{type(chunk)}\"!")
+                    raise RuntimeError(err_msg)
+
+                self.append(chunk)
+                count += len(chunk)
+
+        return count
+
+    def redo(self) -> bool:
+        """Redo the most recently undone edit, see `use_journal`.
+
+        Returns
+        -------
+        bool
+            False if there is no edit to redo.
+        """
+        step = None if self._journal is None else self._journal.redo()
+        if step is None:
+            return False
+
+        self._replay([(start, start + len(old), new) for start, old, new in step])
+        return True
+
+    def restore(self, snapshot: "MutableStringSnapshot") -> None:
+        """Restore the content saved by `snapshot`. The snapshot can be restored any
+        number of times.
+
+        Parameters
+        ----------
+        snapshot : MutableStringSnapshot
+        """
+        if not isinstance(snapshot, MutableStringSnapshot):
+            err_msg = (f"Only MutableStringSnapshot objects can be restored, given of "
+                       f"type \"{type(snapshot)}\"!")
+            raise RuntimeError(err_msg)
+
+        length = len(self._storage)
+        storage = snapshot._storage.copy()
+        if type(storage) is not type(self._storage):
+            # E.g. a memory-mapped file, which keeps holding the content.
+            self._replace(0, length, storage.to_string())
+            return
+
+        if self._journal is not None:
+            self._journal.record(0, self._storage.to_string(), storage.to_string())
+
+        self._storage = storage
+        self._changed(0, length, len(storage))
+
+    def rstrip(self, chars: str | None = None) -> tuple[int, int]:
+        """Remove trailing whitespaces, see `strip`.
+
+        Parameters
+        ----------
+        chars : str | None, optional default to None
+
+        Returns
+        -------
+        tuple[int, int]
+        """
+        return self._strip(chars, False, True)
+
+    def search(self,
+               pattern: str | re.Pattern[str],
+               start: int | None = None,
+               end: int | None = None,
+               flags: int = 0) -> re.Match[str] | None:
+        """Return the first match of the regular expression `pattern` within
+        `MutableString[start:end]`, as `re.Pattern.search` with `pos` and `endpos`.
+        Optional arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            The regular expression, compiled through `compile_regex`.
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        flags : int, optional default to 0
+
+        Returns
+        -------
+        re.Match[str] | None
+            None if there is no match.
+        """
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        regex = compile_regex(pattern, flags)
+        return regex.search(self._storage.to_string(), start, max(start, end))
+
+    def share(self, name: str | None = None) -> "MutableString":
+        """Return a `MutableString` holding a copy of the content in a new block of
+        shared memory, which other processes access without copying it, by `attach` with
+        its `shared_memory_name` or by receiving the returned object itself, which is
+        pickled as the name of the block only.
+
+        As for memory-mapped files, the length of the shared content cannot change, and
+        the characters hold the number of bytes (1, 2 or 4) of the widest one of the
+        content, so that only the edits keeping the length and not writing wider
+        characters are possible. The returned object owns the shared memory and removes
+        it when closed, after the other processes are done with it; it is a context
+        manager closing it on exit.
+
+        Parameters
+        ----------
+        name : str | None, optional default to None
+            The name of the block of shared memory, chosen at random if None.
+
+        Returns
+        -------
+        MutableString
+        """
+        string = type(self)()
+        string._storage = SharedMemoryStorage(self._storage.to_string(), name)
+        return string
+
+    def snapshot(self) -> "MutableStringSnapshot":
+        """Return a read-only copy of the current content, which `restore` brings back.
+
+        The snapshot shares the content of the storage engine, which is copied only when
+        it is edited, and only as much as needed: with the "rope" storage an edit copies
+        the touched chunk and the O(log n) nodes above it, so that the memory taken by
+        many snapshots is proportional to the edits between them; with the "array" and
+        "gap" storages the first edit after a snapshot copies the whole array; the "str"
+        storage copies the content at each edit anyway. Taking the snapshot of a
+        memory-mapped `MutableString` reads its content in memory.
+
+        Returns
+        -------
+        MutableStringSnapshot
+        """
+        return MutableStringSnapshot(self._storage.copy())
+
+    def split(self, sep: str | None = None, maxsplit: int = -1) -> list[str]:
+        """Return a list of the substrings in the string, using `sep` as string separator.
+
+        Parameters
+        ----------
+        sep : str | None, optional
+            The separator used to split the string. When set to None (the default value),
+            it will split on any whitespace character (including \\n \\r \\t \\f and
+            spaces) and it will discard empty strings from the result.
+        maxsplit : int, optional
+            Maximum number of splits (starting from the left). -1 (the default value)
+            means no limit.
+
+        Returns
+        -------
+        list[str]
+        """
+        return self._storage.to_string().split(sep, maxsplit)
+
+    def strip(self, chars: str | None = None) -> tuple[int, int]:
+        """Remove leading and trailing whitespaces.
+
+        Only the stripped characters are read, from the ends of the content inwards, and
+        only the stripped ranges are deleted: the rest of the content is neither copied
+        nor rewritten (apart from the shift of the characters after a deletion, for the
+        array-based storage engines).
+
+        Parameters
+        ----------
+        chars : str | None, optional default to None
+            The characters to be removed instead of whitespaces, as for `str.strip`.
+
+        Returns
+        -------
+        tuple[int, int]
+            The range [start, end) of the content before stripping which was kept.
+        """
+        return self._strip(chars, True, True)
+
+    def sub(self,
+            pattern: str | re.Pattern[str],
+            repl: str | Callable[[re.Match[str]], str],
+            count: int = 0,
+            flags: int = 0) -> int:
+        """Replace in place the leftmost non-overlapping matches of the regular expression
+        `pattern` with `repl`, as `re.sub`. The matches are replaced at once (see
+        `apply_patches`), and the edit journal undoes them as a single step.
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            The regular expression, compiled through `compile_regex`.
+        repl : str | Callable[[re.Match[str]], str]
+            The replacement, either a template expanded as by `re.sub` or a function
+            returning the replacement of a match.
+        count : int, optional default to 0
+            The maximum number of matches to be replaced, 0 meaning all of them.
+        flags : int, optional default to 0
+
+        Returns
+        -------
+        int
+            The number of matches replaced.
+        """
+        patches = []
+        replaced = 0
+        for match in self.finditer(pattern, flags=flags):
+            if count and replaced == count:
+                break
+
+            replaced += 1
+            if callable(repl):
+                replacement = repl(match)
+            elif "\\" in repl:
+                replacement = match.expand(repl)
+            else:
+                replacement = repl
+
+            # The matches replaced with themselves are left untouched.
+            if replacement != match.group():
+                patches.append((match.start(), match.end(), replacement))
+
+        self.apply_patches(patches)
+        return replaced
+
+    def subscribe(self, callback: Callable[[int, int, int], None]) -> None:
+        """Call `callback(start, stop, new_stop)` after each edit, which replaced the
+        characters in the range [start, stop) with the ones now in [start, new_stop).
+
+        Parameters
+        ----------
+        callback : Callable[[int, int, int], None]
+        """
+        self._subscribers.append(callback)
+
+    def to_string(self) -> str:
+        """Return the content of this `MutableString` as `str`.
+
+        Returns
+        -------
+        str
+        """
+        return self._storage.to_string()
+
+    def transform(self,
+                  function: Callable[[str], str],
+                  workers: int | None = None,
+                  separator: str = "\n") -> None:
+        """Replace the content with `function` applied to it one chunk at a time, the
+        chunks being processed in parallel by `workers` processes. `function` may change
+        the length of the chunks, e.g. `str.upper` or a `re.Pattern.sub` bound method, and
+        it must be picklable, that is, defined at the top level of a module.
+
+        The content is split into chunks ending right after an occurrence of `separator`,
+        so that `function` is never applied to part of a line (or of whatever `separator`
+        delimits), and the chunks are placed in shared memory, where the workers read them
+        without copies. The results are sent back to this process and stitched together.
+
+        Parameters
+        ----------
+        function : Callable[[str], str]
+        workers : int | None, optional default to None
+            The number of worker processes, the number of processors if None. With 1
+            worker, or if the content fits a single chunk, the chunks are processed by
+            this process.
+        separator : str, optional default to "\n"
+            The string after which the chunks may end.
+        """
+        if not callable(function):
+            err_msg = ("Transform operation for MutableString objects is possible only "
+                       f"with functions, given value of type \"{type(function)}\"!")
+            raise RuntimeError(err_msg)
+
+        if not isinstance(separator, str) or not separator:
+            err_msg = ("Transform operation for MutableString objects is possible only "
+                       f"with non-empty string separators, given \"{separator!r}\"!")
+            raise RuntimeError(err_msg)
+
+        workers = (os.cpu_count() or 1) if workers is None else max(workers, 1)
+        length = len(self._storage)
+        chunk_length = -(-length // (workers * TRANSFORM_CHUNKS_PER_WORKER))
+        bounds = self._chunk_bounds(max(chunk_length, TRANSFORM_CHUNK_LENGTH), separator)
+        if workers == 1 or len(bounds) < 2:
+            results = [function(self._storage.get_range(start, stop))
+                       for start, stop in bounds]
+        else:
+            if isinstance(self._storage, SharedMemoryStorage):
+                shared = self._storage
+            else:
+                shared = SharedMemoryStorage(self._storage.to_string())
+
+            try:
+                with ProcessPoolExecutor(min(workers, len(bounds))) as executor:
+                    results = list(executor.map(_transform_chunk,
+                                                repeat(shared.name),
+                                                (start for start, _ in bounds),
+                                                (stop for _, stop in bounds),
+                                                repeat(function)))
+            finally:
+                if shared is not self._storage:
+                    shared.close()
+
+        self.apply_patches((start, stop, result)
+                           for (start, stop), result in zip(bounds, results))
+
+    def undo(self) -> bool:
+        """Undo the most recent edit, see `use_journal`.
+
+        Returns
+        -------
+        bool
+            False if there is no edit to undo.
+        """
+        step = None if self._journal is None else self._journal.undo()
+        if step is None:
+            return False
+
+        self._replay([(start, start + len(new), old)
+                      for start, old, new in reversed(step)])
+        return True
+
+    def unsubscribe(self, callback: Callable[[int, int, int], None]) -> None:
+        """Stop calling `callback` after each edit, see `subscribe`.
+
+        Parameters
+        ----------
+        callback : Callable[[int, int, int], None]
+
+        Raises
+        ------
+        RuntimeError
+            If `callback` is not subscribed.
+        """
+        if callback not in self._subscribers:
+            raise RuntimeError(f"The callback \"{callback}\" is not subscribed!")
+
+        self._subscribers.remove(callback)
+
+    def upper(self, start: int | None = None, end: int | None = None) -> None:
+        """Convert the string to uppercase. Only the characters of
+        `MutableString[start:end]` are converted, the others are not even read. Optional
+        arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        if start < end:
+            self._convert(start, end, str.upper)
+
+    def use_journal(self, enabled: bool = True, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Enable or disable the edit journal used by `undo` and `redo`.
+
+        The journal records each edit as a delta, the index and the old and new text of
+        the edited range trimmed of the unchanged characters, so that each step of the
+        history costs memory proportional to the size of the edit rather than to the
+        length of the content. When the deltas exceed `max_size` characters the oldest
+        ones are evicted. Enabling the journal again, or disabling it, drops the history.
+
+        Parameters
+        ----------
+        enabled : bool, optional default to True
+        max_size : int, optional default to DEFAULT_MAX_SIZE
+            The maximum number of characters held by the deltas.
+        """
+        self._journal = EditJournal(max_size) if enabled else None
+
+    def use_search_index(self, enabled: bool = True) -> None:
+        """Enable or disable the substring search index used by `find`, `find_all` and
+        `count`.
+
+        The index is a suffix array of the content: it is built at the first search after
+        it is enabled or after an edit, in O(n log^2 n), and then it finds all the
+        occurrences of a substring in O(m log n), m being the length of the substring.
+        Therefore it pays off when many searches are run on a content rarely edited.
+
+        Parameters
+        ----------
+        enabled : bool, optional default to True
+        """
+        self._use_search_index = enabled
+        if not enabled:
+            self._search_index = None
+
+    def view(self,
+             start: int | None = None,
+             stop: int | None = None) -> "MutableStringView":
+        """Return a view on `MutableString[start:stop]`, that is, a window sharing the
+        content of this `MutableString` without copying it. Optional arguments `start` and
+        `stop` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        stop: int | None, optional default to None
+
+        Returns
+        -------
+        MutableStringView
+        """
+        start, stop, _ = slice(start, stop).indices(len(self._storage))
+        return MutableStringView(self, start, max(start, stop))
+
+    def write(self, string: str) -> int:
+        """Append `string` to the end of the `MutableString`, as the `write` method of
+        text files, so that a `MutableString` can be given to `print(..., file=...)` and
+        to the other functions writing to files.
+
+        Parameters
+        ----------
+        string : str
+
+        Returns
+        -------
+        int
+            The number of characters written.
+        """
+        self.append(string)
+        return len(string)
+
+    def write_range(self,
+                    fileobj: BinaryIO,
+                    start: int | None = None,
+                    end: int | None = None,
+                    encoding: str = "utf-8") -> int:
+        """Write the characters of `MutableString[start:end]` to the binary file
+        `fileobj` at the position they take in the file, leaving the rest of the file
+        untouched. Optional arguments `start` and `end` are interpreted as in slice
+        notation.
+
+        This writes back same-length edits of a file loaded by `from_file`, e.g. each of
+        the `dirty_ranges` since a `checkpoint`, without rewriting the whole file: the
+        file must hold the content before the edits, and the edits must not change the
+        number of bytes the characters before and within the range are encoded to, which
+        holds for any same-length edit with "ascii" and "latin-1". With the other
+        encodings, the characters before the range are encoded to find its position in the
+        file. The `encoding` must not write a byte order mark, e.g. "utf-16-le" instead of
+        "utf-16".
+
+        Parameters
+        ----------
+        fileobj : BinaryIO
+            A seekable file object opened in binary mode, e.g. "r+b".
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        encoding : str, optional default to "utf-8"
+
+        Returns
+        -------
+        int
+            The number of characters written.
+        """
+        if isinstance(fileobj, io.TextIOBase):
+            err_msg = ("Write range operation for MutableString objects is possible only "
+                       f"to binary files, given file of type \"{type(fileobj)}\"!")
+            raise RuntimeError(err_msg)
+
+        start, end, _ = slice(start, end).indices(len(self._storage))
+        fileobj.seek(self._byte_offset(start, encoding))
+        for chunk_start in range(start, end, FILE_CHUNK_LENGTH):
+            chunk_stop = min(chunk_start + FILE_CHUNK_LENGTH, end)
+            chunk = self._storage.get_range(chunk_start, chunk_stop)
+            fileobj.write(chunk.encode(encoding))
+
+        return max(0, end - start)
+
+    def write_to(self, fileobj: TextIO, chunk_size: int = FILE_CHUNK_LENGTH) -> int:
+        """Write the content to the text file `fileobj`, `chunk_size` characters at a time
+        taken straight from the storage engine, so that the whole content is never built
+        as a single `str`, e.g. with the "rope" and "gap" storages.
+
+        Parameters
+        ----------
+        fileobj : TextIO
+            A file object opened in text mode, or any object with a `write(string)`
+            method.
+        chunk_size : int, optional default to FILE_CHUNK_LENGTH
+
+        Returns
+        -------
+        int
+            The number of characters written.
+        """
+        MutableString._check_chunk_size(chunk_size)
+        length = len(self._storage)
+        for start in range(0, length, chunk_size):
+            fileobj.write(self._storage.get_range(start, min(start + chunk_size, length)))
+
+        return length
+
+    def _byte_offset(self, index: int, encoding: str) -> int:
+        """Return the number of bytes the characters before `index` are encoded to.
+        """
+        if codecs.lookup(encoding).name in SINGLE_BYTE_ENCODINGS:
+            return index
+
+        return sum(len(self._storage.get_range(start, min(start + FILE_CHUNK_LENGTH,
+                                                          index)).encode(encoding))
+                   for start in range(0, index, FILE_CHUNK_LENGTH))
+
+    def _changed(self,
+                 start: int,
+                 stop: int,
+                 new_stop: int,
+                 edits: list[tuple[int, int, int]] | None = None) -> None:
+        """Keep up to date whatever depends on the content, after the characters in the
+        range [`start`, `stop`) have been replaced with the ones in [`start`, `new_stop`).
+        If the replacement is made of several `edits` (start, stop, new_stop), done one
+        after the other, the `dirty_ranges` and the subscribers are told about each one.
+        """
+        self._search_index = None
+        self._hash = None
+        self._rolling_hash = None
+
+        # The line index is scanned again once, since the content is already edited.
+        if self._line_index is not None:
+            self._line_index.update(self._storage, start, stop, new_stop)
+
+        for edit in [(start, stop, new_stop)] if edits is None else edits:
+            if self._dirty_ranges is not None:
+                self._dirty_ranges.add(*edit)
+
+            for callback in self._subscribers:
+                callback(*edit)
+
+    @staticmethod
+    def _check_chunk_size(chunk_size: int) -> None:
+        """Check that `chunk_size` is a positive number of characters.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            err_msg = ("The chunk size must be a positive integer, given "
+                       f"\"{chunk_size}\"!")
+            raise RuntimeError(err_msg)
+
+    def _chunk_bounds(self, chunk_length: int, separator: str) -> list[tuple[int, int]]:
+        """Return the ranges [start, stop) of the consecutive chunks of at least
+        `chunk_length` characters covering the content, each one ending right after an
+        occurrence of `separator` or at the end of the content.
+        """
+        length = len(self._storage)
+        bounds = []
+        start = 0
+        while start < length:
+            stop = min(start + chunk_length, length)
+            if stop < length:
+                index = self._storage.find(separator, stop)
+                stop = length if index == -1 else index + len(separator)
+
+            bounds.append((start, stop))
+            start = stop
+
+        return bounds
+
+    def _convert(self, start: int, stop: int, function: Callable[[str], str]) -> int:
+        """Replace the characters in the range [`start`, `stop`) with the result of
+        `function` applied to them and return the index after the last replaced character.
+        """
+        old = "" if self._journal is None else self._storage.get_range(start, stop)
+        new_stop = self._storage.convert(start, stop, function)
+        if self._journal is not None:
+            self._journal.record(start, old, self._storage.get_range(start, new_stop))
+
+        self._changed(start, stop, new_stop)
+        return new_stop
+
+    def _get_search_index(self) -> SuffixArray:
+        """Return the substring search index, building it if needed.
+        """
+        if self._search_index is None:
+            self._search_index = SuffixArray(self._storage.to_string())
+
+        return self._search_index
+
+    def _get_line_index(self) -> LineIndex:
+        """Return the index of the lines, building it if needed.
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex(self._storage)
+
+        return self._line_index
+
+    def _get_rolling_hash(self) -> RollingHash:
+        """Return the table of the prefix hashes, building it if needed.
+        """
+        if self._rolling_hash is None:
+            self._rolling_hash = RollingHash(self._storage.to_string())
+
+        return self._rolling_hash
+
+    def _journal_step(self) -> ContextManager[None]:
+        """Return a context manager recording the edits done within it as a single step of
+        the edit journal.
+        """
+        return nullcontext() if self._journal is None else self._journal.group()
+
+    def _replace(self, start: int, stop: int, value: str) -> None:
+        """Replace the characters in the range [`start`, `stop`) with `value`. All the
+        edits of the content go through this method or `_convert`, which keep up to date
+        whatever depends on the content.
+        """
+        old = ""
+        if self._journal is not None and start < stop:
+            old = self._storage.get_range(start, stop)
+
+        # The edit is recorded only once the storage has accepted it.
+        self._store(start, stop, value)
+        if self._journal is not None:
+            self._journal.record(start, old, value)
+
+        self._changed(start, stop, start + len(value))
+
+    def _replay(self, edits: list[tuple[int, int, str]]) -> None:
+        """Replace the characters in the range [start, stop) with value for each (start,
+        stop, value) of `edits`, in order, without recording them in the edit journal.
+        """
+        journal, self._journal = self._journal, None
+        try:
+            for start, stop, value in edits:
+                self._replace(start, stop, value)
+        finally:
+            self._journal = journal
+
+    def _store(self, start: int, stop: int, value: str) -> None:
+        """Replace the characters in the range [`start`, `stop`) of the storage with
+        `value`, loading or appending it when possible.
+        """
+        length = len(self._storage)
+        if start == 0 and stop == length:
+            self._storage.load(value)
+        elif start == length:
+            self._storage.append(value)
+        else:
+            self._storage.replace(start, stop, value)
+
+    def _strip(self, chars: str | None, leading: bool, trailing: bool) -> tuple[int, int]:
+        """Remove the leading and/or the trailing `chars` (whitespaces if None) and return
+        the range of the content before stripping which was kept.
+        """
+        storage = self._storage
+        length = len(storage)
+
+        start = 0
+        while leading and start < length:
+            chunk = storage.get_range(start, min(start + STRIP_CHUNK_LENGTH, length))
+            stripped = len(chunk) - len(chunk.lstrip(chars))
+            start += stripped
+            if stripped < len(chunk):
+                break
+
+        stop = length
+        while trailing and stop > start:
+            chunk = storage.get_range(max(stop - STRIP_CHUNK_LENGTH, start), stop)
+            stripped = len(chunk) - len(chunk.rstrip(chars))
+            stop -= stripped
+            if stripped < len(chunk):
+                break
+
+        with self._journal_step():
+            if stop < length:
+                self._replace(stop, length, "")
+
+            if start > 0:
+                self._replace(0, start, "")
+
+        return start, stop
+
+
+# Matches the words of a string, as split by `str.split` with no separator.
+_WORD = re.compile(r"\S+")
+
+
+class MutableStringView:
+    """A read-only window on the range [`start`, `stop`) of a `MutableString`.
+
+    The view shares the content of the `MutableString`, so it reflects its later edits:
+    the window keeps the same indices, clipped to the length of the content.
+    """
+    def __init__(self, owner: MutableString, start: int, stop: int) -> None:
+        self._owner = owner
+        self._start = start
+        self._stop = stop
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MutableString, MutableStringView)):
+            other = other.to_string()
+
+        if not isinstance(other, str):
+            return NotImplemented
+
+        start, stop = self._bounds()
+        return (stop - start == len(other) and
+                self._owner._storage.startswith(other, start, stop))
+
+    def __getitem__(self, value: int | slice) -> str:
+        # The indices are mapped to the content, so that only the requested characters
+        # are read from the storage.
+        storage = self._owner._storage
+        start, stop = self._bounds()
+        if isinstance(value, int):
+            if value < 0:
+                value += stop - start
+
+            if value < 0 or value >= stop - start:
+                raise IndexError(f"The given index {value} is out of range!")
+
+            return storage.get_item(start + value)
+
+        if isinstance(value, slice):
+            first, last, step = value.indices(stop - start)
+            if step == 1:
+                return storage.get_range(start + first, start + max(first, last))
+
+            return storage.get_range(start, stop)[value]
+
+        raise TypeError(f"Slicing cannot be done with type of \"{type(value)}\"!")
+
+    def __len__(self) -> int:
+        start, stop = self._bounds()
+        return stop - start
+
+    def __repr__(self) -> str:
+        return self.to_string()
+
+    @property
+    def start(self) -> int:
+        """The index of the first character of the window in the `MutableString`.
+        """
+        return self._start
+
+    @property
+    def stop(self) -> int:
+        """The index after the last character of the window in the `MutableString`.
+        """
+        return self._stop
+
+    def find(self, substr: str, start: int | None = None, end: int | None = None) -> int:
+        """Return the lowest index in the view where `substr` is found, such that `substr`
+        is contained within `view[start:end]`. Optional arguments `start` and `end` are
+        interpreted as in slice notation.
+
+        Parameters
+        ----------
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+            -1 on failure.
+        """
+        offset, stop = self._bounds()
+        if start is not None and start > stop - offset:
+            return -1
+
+        start, end, _ = slice(start, end).indices(stop - offset)
+        index = self._owner._storage.find(substr, offset + start, offset + end)
+        return index if index < 0 else index - offset
+
+    def iter_lines(self, keepends: bool = False) -> Iterator[str]:
+        """Yield the lines of the view one at a time, breaking at the same line boundaries
+        as `str.splitlines`.
+
+        Parameters
+        ----------
+        keepends : bool, optional default to False
+            Whether the line breaks are included in the yielded lines.
+        """
+        storage = self._owner._storage
+        start, stop = self._bounds()
+
+        # The line breaks are looked for one chunk at a time, so that the content is never
+        # read as a whole.
+        chunk_start = start
+        while chunk_start < stop:
+            chunk_stop = min(chunk_start + max(ITER_CHUNK_LENGTH, 2), stop)
+            chunk = storage.get_range(chunk_start, chunk_stop)
+            if chunk_stop < stop and chunk.endswith("\r"):
+                # It may be the first half of a "\r\n" line break.
+                chunk, chunk_stop = chunk[:-1], chunk_stop - 1
+
+            for match in LINE_BREAK.finditer(chunk):
+                end = chunk_start + match.end()
+                yield storage.get_range(start, end if keepends else chunk_start +
+                                        match.start())
+                start = end
+
+            chunk_start = chunk_stop
+
+        if start < stop:
+            yield storage.get_range(start, stop)
+
+    def iter_split(self, sep: str | None = None, maxsplit: int = -1) -> Iterator[str]:
+        """Yield the substrings of `split` one at a time, reading them from the content
+        only when requested. The arguments are the same as for `split`.
+
+        Parameters
+        ----------
+        sep : str | None, optional
+        maxsplit : int, optional
+        """
+        storage = self._owner._storage
+        start, stop = self._bounds()
+
+        if sep is None:
+            # The words are looked for one chunk at a time, so that the content is never
+            # read as a whole. A word reaching the end of a chunk may go on in the next
+            # one, which starts with it; the chunk is doubled while a word fills it.
+            length = ITER_CHUNK_LENGTH
+            while start < stop:
+                chunk_stop = min(start + length, stop)
+                chunk = storage.get_range(start, chunk_stop)
+                matches = list(_WORD.finditer(chunk))
+                next_start = chunk_stop
+                if chunk_stop < stop and matches and matches[-1].end() == len(chunk):
+                    next_start = start + matches.pop().start()
+
+                for match in matches:
+                    if maxsplit == 0:
+                        # The remainder keeps its whitespaces, as for `str.split`.
+                        yield storage.get_range(start + match.start(), stop)
+                        return
+
+                    yield match.group()
+                    maxsplit -= 1
+
+                length = length * 2 if next_start == start else ITER_CHUNK_LENGTH
+                start = next_start
+
+            return
+
+        if not sep:
+            raise ValueError("empty separator")
+
+        while maxsplit != 0:
+            index = storage.find(sep, start, stop)
+            if index < 0:
+                break
+
+            yield storage.get_range(start, index)
+            start = index + len(sep)
+            maxsplit -= 1
+
+        yield storage.get_range(start, stop)
+
+    def split(self, sep: str | None = None, maxsplit: int = -1) -> list[str]:
+        """Return a list of the substrings in the view, using `sep` as string separator.
+
+        Parameters
+        ----------
+        sep : str | None, optional
+            The separator used to split the string. When set to None (the default value),
+            it will split on any whitespace character (including \\n \\r \\t \\f and
+            spaces) and it will discard empty strings from the result.
+        maxsplit : int, optional
+            Maximum number of splits (starting from the left). -1 (the default value)
+            means no limit.
+
+        Returns
+        -------
+        list[str]
+        """
+        return list(self.iter_split(sep, maxsplit))
+
+    def to_string(self) -> str:
+        """Return the content of this view as `str`.
+
+        Returns
+        -------
+        str
+        """
+        start, stop = self._bounds()
+        return self._owner._storage.get_range(start, stop)
+
+    def _bounds(self) -> tuple[int, int]:
+        """Return the range of the window, clipped to the current length of the content.
+        """
+        length = len(self._owner._storage)
+        return min(self._start, length), min(self._stop, length)
+
+
+class MutableStringSnapshot:
+    """A read-only copy of the content of a `MutableString`, as returned by
+    `MutableString.snapshot`.
+    """
+    def __init__(self, storage: StringStorage) -> None:
+        # Never edited: `MutableString.restore` edits copies of it.
+        self._storage = storage
+
+    def __eq__(self, other: object) -> bool:
+        return self._storage.to_string() == other
+
+    def __hash__(self) -> int:
+        return hash(self._storage.to_string())
+
+    def __len__(self) -> int:
+        return len(self._storage)
+
+    def __repr__(self) -> str:
+        return f"MutableStringSnapshot({self._storage.to_string()!r})"
+
+    def to_string(self) -> str:
+        """Return the content of this snapshot as `str`.
+
+        Returns
+        -------
+        str
+        """
+        return self._storage.to_string()
+
+
+def _transform_chunk(name: str,
+                     start: int,
+                     stop: int,
+                     function: Callable[[str], str]) -> str:
+    """Return `function` applied to the characters in the range [`start`, `stop`) of the
+    content in the shared memory `name`, in a worker process of `MutableString.transform`.
+    """
+    storage = SharedMemoryStorage.attach(name)
+    try:
+        return function(storage.get_range(start, stop))
+    finally:
+        storage.close()
+
+
+def _unpickle(cls: type[MutableString], storage: StringStorage) -> MutableString:
+    """Return a `cls` object holding `storage`, as pickled by `MutableString.__reduce__`.
+    """
+    string = cls()
+    string._storage = storage
+    return string
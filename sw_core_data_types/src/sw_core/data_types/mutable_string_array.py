@@ -0,0 +1,195 @@
+"""
+MutableStringArray
+------------------
+
+The `MutableStringArray` class holds many short strings in a single `numpy` array, so that
+the same operation is applied to all of them at once.
+
+The strings are held in a fixed-width array of Unicode characters (`numpy.str_`), as wide
+as the longest string: the case conversions and the searches run over the whole array in
+compiled loops, instead of one Python call per string. The case conversions flip the ASCII
+letters directly in the code points of the array, leaving to `numpy.char` the strings
+holding other characters. Assigning a string longer than the current width widens the
+array, while a string never shrinks it.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from typing import Any, Callable, Iterable
+
+# third party library imports
+import numpy as np
+import numpy.typing as npt
+
+# local library specific imports
+
+
+# The largest number of characters to which `str.upper` and `str.lower` convert a single
+# character, e.g. "ﬃ".upper() == "FFI".
+MAX_CASE_EXPANSION = 3
+
+
+class MutableStringArray:
+    """A mutable array of strings held in a fixed-width `numpy` array, with vectorized
+    case conversions, searches and (masked) assignments.
+
+    As `numpy.str_`, the strings cannot end with "\\0" characters, which are dropped.
+    """
+    def __init__(self, strings: Iterable[str] = ()) -> None:
+        self._array = MutableStringArray._to_array(strings)
+
+    def __getitem__(self, key: Any) -> "str | MutableStringArray":
+        if isinstance(key, (int, np.integer)):
+            return str(self._array[key])
+
+        string_array = MutableStringArray()
+        string_array._array = self._array[key].copy()
+        return string_array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __repr__(self) -> str:
+        return f"MutableStringArray({self.to_list()})"
+
+    def __setitem__(self, key: Any, value: "str | Iterable[str]") -> None:
+        """Assign `value` to the strings selected by `key`, which may be an index, a
+        slice, an array of indices or a boolean mask: a single string is assigned to all
+        of the selected strings, otherwise one string each.
+        """
+        if isinstance(value, str):
+            values = np.array(value)
+        else:
+            values = MutableStringArray._to_array(value)
+
+        self._assign(key, values)
+
+    @property
+    def width(self) -> int:
+        """The number of characters of the longest string the array can hold without
+        being widened.
+        """
+        return self._array.dtype.itemsize // np.dtype("U1").itemsize
+
+    def find(self,
+             substr: str,
+             start: int | None = None,
+             end: int | None = None) -> npt.NDArray[np.int64]:
+        """Return the lowest index where `substr` is found in each string, -1 on failure.
+        Optional arguments `start` and `end` are interpreted as in slice notation, for
+        each string.
+
+        Parameters
+        ----------
+        substr : str
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+        npt.NDArray[np.int64]
+        """
+        if not isinstance(substr, str):
+            err_msg = ("Find operation for MutableStringArray objects is possible only "
+                       f"with strings, given value of type \"{type(substr)}\"!")
+            raise RuntimeError(err_msg)
+
+        found = np.char.find(self._array, substr, 0 if start is None else start, end)
+        return found.astype(np.int64)
+
+    def lower(self, mask: Any = None) -> None:
+        """Convert to lowercase all the strings, or the ones selected by `mask`, which may
+        be a boolean mask, an array of indices or a slice.
+
+        Parameters
+        ----------
+        mask : Any, optional default to None
+        """
+        self._convert(np.char.lower, ("A", "Z"), mask)
+
+    def to_list(self) -> list[str]:
+        """Return the strings as a list of Python `str`.
+
+        Returns
+        -------
+        list[str]
+        """
+        return self._array.tolist()
+
+    def upper(self, mask: Any = None) -> None:
+        """Convert to uppercase all the strings, or the ones selected by `mask`, which may
+        be a boolean mask, an array of indices or a slice.
+
+        Parameters
+        ----------
+        mask : Any, optional default to None
+        """
+        self._convert(np.char.upper, ("a", "z"), mask)
+
+    def _assign(self, key: Any, values: npt.NDArray[np.str_]) -> None:
+        """Assign `values` to the strings selected by `key`, widening the array if the
+        values are wider.
+        """
+        if values.dtype.itemsize > self._array.dtype.itemsize:
+            self._array = self._array.astype(values.dtype)
+
+        self._array[key] = values
+
+    def _convert(self,
+                 function: Callable[[npt.NDArray[np.str_]], npt.NDArray[np.str_]],
+                 letters: tuple[str, str],
+                 mask: Any) -> None:
+        """Replace the strings selected by `mask` with `function` applied to them, where
+        `function` converts the ASCII letters in the range `letters` to the other case.
+        """
+        key = slice(None) if mask is None else mask
+        selected = np.array(self._array[key], ndmin=1)
+        if not selected.size:
+            return
+
+        # The ASCII letters are converted directly in the code points of all the strings,
+        # so that `function` is applied to the strings holding other characters only.
+        codes = selected.view(np.uint32).reshape(len(selected), -1)
+        first, last = (ord(letter) for letter in letters)
+        is_letter = (codes - np.uint32(first)) <= np.uint32(last - first)
+        codes ^= is_letter.view(np.uint8).astype(np.uint32) << np.uint32(5)
+        self._assign(key, selected.reshape(np.shape(self._array[key])))
+
+        others = (codes > 0x7F).any(axis=1)
+        if not others.any():
+            return
+
+        # `numpy` truncates the converted strings to the width of the array, which the
+        # case conversion of a non-ASCII character may exceed.
+        width = selected.dtype.itemsize // np.dtype("U1").itemsize
+        converted = function(selected[others].astype(f"<U{width * MAX_CASE_EXPANSION}"))
+        converted = converted.astype(f"<U{max(np.char.str_len(converted).max(), 1)}")
+        indices = np.arange(len(self._array))[key]
+        self._assign(np.array(indices, ndmin=1)[others], converted)
+
+    @staticmethod
+    def _to_array(strings: Iterable[str]) -> npt.NDArray[np.str_]:
+        """Return the fixed-width array of `strings`, checking that they are strings.
+        """
+        if isinstance(strings, MutableStringArray):
+            return strings._array.copy()
+
+        if isinstance(strings, np.ndarray) and strings.dtype.kind == "U":
+            return strings.astype(strings.dtype, copy=True).ravel()
+
+        strings = list(strings)
+        for string in strings:
+            if not isinstance(string, str):
+                err_msg = ("MutableStringArray objects can hold only strings, given "
+                           f"value of type \"{type(string)}\"!")
+                raise RuntimeError(err_msg)
+
+        return np.array(strings, dtype=np.str_) if strings else np.array([], dtype="<U1")
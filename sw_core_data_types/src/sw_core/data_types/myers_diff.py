@@ -0,0 +1,197 @@
+"""
+MyersDiff
+---------
+
+The `diff` function computes the edit script turning a text into another one.
+
+The script is the shortest one, found by the O(ND) algorithm of Myers, N being the length
+of the texts and D the number of inserted and deleted characters: the cost grows with the
+size of the changes rather than with the length of the texts. Moreover, the common prefix
+and suffix of the texts are skipped at first and the runs of equal characters (the
+"snakes" of the algorithm) are measured comparing slices, so that a few edits in a large
+text are found without scanning it one character at a time in Python.
+
+The script is a list of hunks (start, stop, replacement), each one replacing the range
+[start, stop) of the old text with the replacement, in the format of
+`MutableString.apply_patches`.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+
+# third party library imports
+
+# local library specific imports
+
+
+# Default maximum number of inserted and deleted characters searched by `diff`: the memory
+# taken by the search grows as the square of this number.
+DEFAULT_MAX_DISTANCE = 1 << 11
+
+# A hunk, as (start, stop, replacement): the range [start, stop) of the old text is
+# replaced with replacement.
+Hunk = tuple[int, int, str]
+
+
+def diff(old: str, new: str, max_distance: int = DEFAULT_MAX_DISTANCE) -> list[Hunk]:
+    """Return the hunks, sorted and not overlapping, turning `old` into `new`. The hunks
+    are the shortest edit script, unless more than `max_distance` characters should be
+    inserted and deleted: then the whole range between the common prefix and the common
+    suffix of the texts is replaced by a single hunk.
+
+    Parameters
+    ----------
+    old : str
+    new : str
+    max_distance : int, optional default to DEFAULT_MAX_DISTANCE
+
+    Returns
+    -------
+    list[Hunk]
+    """
+    prefix = _snake(old, new, 0, 0)
+    if prefix == len(old) == len(new):
+        return []
+
+    suffix = _reverse_snake(old, new, len(old), len(new), prefix)
+    old_middle = old[prefix:len(old) - suffix]
+    new_middle = new[prefix:len(new) - suffix]
+    if not old_middle or not new_middle:
+        return [(prefix, prefix + len(old_middle), new_middle)]
+
+    edits = _shortest_edits(old_middle, new_middle, max_distance)
+    if edits is None:
+        return [(prefix, prefix + len(old_middle), new_middle)]
+
+    # The consecutive edits of the same range are merged into a single hunk.
+    hunks: list[tuple[int, int, list[str]]] = []
+    for x, y, inserted in edits:
+        if hunks and hunks[-1][1] == x:
+            start, stop, pieces = hunks[-1]
+        else:
+            start, stop, pieces = x, x, []
+            hunks.append((start, stop, pieces))
+
+        if inserted:
+            pieces.append(new_middle[y])
+        else:
+            hunks[-1] = (start, stop + 1, pieces)
+
+    return [(prefix + start, prefix + stop, "".join(pieces))
+            for start, stop, pieces in hunks]
+
+
+def _reverse_snake(first: str, second: str, x: int, y: int, limit: int) -> int:
+    """Return the number of equal characters ending at `first[x]` and `second[y]`
+    excluded, going backwards by at most `x - limit` and `y - limit` characters.
+    """
+    length = min(x, y) - limit
+    low, size = 0, 1
+    while low < length:
+        high = min(low + size, length)
+        if first[x - high:x - low] != second[y - high:y - low]:
+            break
+
+        low, size = high, size * 2
+    else:
+        return low
+
+    high -= 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[x - middle:x - low] == second[y - middle:y - low]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def _shortest_edits(old: str,
+                    new: str,
+                    max_distance: int) -> list[tuple[int, int, bool]] | None:
+    """Return the shortest edit script turning `old` into `new`, as the sorted list of
+    edits (x, y, inserted): the insertion of `new[y]` before `old[x]` if inserted is True,
+    the deletion of `old[x]` otherwise. None if the script is longer than `max_distance`.
+    """
+    n, m = len(old), len(new)
+
+    # For each diagonal k, the furthest x reached on it, and the copies of it before each
+    # step, to trace back the path.
+    furthest = {1: 0}
+    trace = []
+    for d in range(min(n + m, max_distance) + 1):
+        trace.append(furthest.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and furthest[k - 1] < furthest[k + 1]):
+                x = furthest[k + 1]
+            else:
+                x = furthest[k - 1] + 1
+
+            x += _snake(old, new, x, x - k)
+            furthest[k] = x
+            if x >= n and x - k >= m:
+                return _trace_back(trace, n, m)
+
+    return None
+
+
+def _snake(first: str, second: str, x: int, y: int) -> int:
+    """Return the number of equal characters starting at `first[x]` and `second[y]`,
+    comparing slices of doubling length and then bisecting the first unequal one.
+    """
+    length = min(len(first) - x, len(second) - y)
+    if length <= 0 or first[x] != second[y]:
+        return 0
+
+    low, size = 0, 1
+    while low < length:
+        high = min(low + size, length)
+        if first[x + low:x + high] != second[y + low:y + high]:
+            break
+
+        low, size = high, size * 2
+    else:
+        return low
+
+    high -= 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[x + low:x + middle] == second[y + low:y + middle]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def _trace_back(trace: list[dict[int, int]],
+                n: int,
+                m: int) -> list[tuple[int, int, bool]]:
+    """Return the edits of the path found by `_shortest_edits`, from its end at (`n`,
+    `m`) back to the start, sorted.
+    """
+    edits = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        furthest = trace[d]
+        k = x - y
+        if k == -d or (k != d and furthest[k - 1] < furthest[k + 1]):
+            x = furthest[k + 1]
+            y = x - k - 1
+            edits.append((x, y, True))
+        else:
+            x = furthest[k - 1]
+            y = x - k + 1
+            edits.append((x, y, False))
+
+    edits.reverse()
+    return edits
@@ -0,0 +1,149 @@
+"""
+PatternMatcher
+--------------
+
+The `PatternMatcher` class finds all the occurrences of many patterns in a single pass
+over a text, by means of the Aho-Corasick automaton.
+
+The automaton is compiled once from the patterns and it can be reused to scan any number
+of texts: `compile_patterns` keeps the most recently used automata, so that scanning many
+`MutableString` objects for the same patterns compiles them only once.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+# third party library imports
+
+# local library specific imports
+
+
+class PatternMatcher:
+    """The Aho-Corasick automaton of a set of patterns: scanning a text of length n is
+    O(n + number of occurrences), whatever the number of patterns.
+    """
+    def __init__(self, patterns: Iterable[str]) -> None:
+        # The patterns, without duplicates, in the given order.
+        self.patterns = tuple(dict.fromkeys(patterns))
+
+        for pattern in self.patterns:
+            if not isinstance(pattern, str) or not pattern:
+                err_msg = ("PatternMatcher objects can be created only from non-empty "
+                           f"strings, given \"{pattern}\"!")
+                raise RuntimeError(err_msg)
+
+        # The transitions of each state, by character, and the indices of the patterns
+        # ending at each state.
+        self._transitions: list[dict[str, int]] = [{}]
+        self._outputs: list[tuple[int, ...]] = [()]
+        self._build()
+
+    def find_all(self,
+                 text: str,
+                 start: int | None = None,
+                 end: int | None = None) -> list[tuple[int, str]]:
+        """Return all the occurrences, overlapping ones included, of the patterns within
+        `text[start:end]` as (index, pattern) tuples, sorted by index and then by length
+        of the pattern. Optional arguments `start` and `end` are interpreted as in slice
+        notation.
+
+        Parameters
+        ----------
+        text : str
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+
+        Returns
+        -------
+        list[tuple[int, str]]
+        """
+        occurrences = list(self.finditer(text, start, end))
+        occurrences.sort(key=lambda occurrence: (occurrence[0], len(occurrence[1])))
+        return occurrences
+
+    def finditer(self,
+                 text: str,
+                 start: int | None = None,
+                 end: int | None = None) -> Iterator[tuple[int, str]]:
+        """Yield all the occurrences, overlapping ones included, of the patterns within
+        `text[start:end]` as (index, pattern) tuples, in the order in which they end.
+        Optional arguments `start` and `end` are interpreted as in slice notation.
+
+        Parameters
+        ----------
+        text : str
+        start: int | None, optional default to None
+        end: int | None, optional default to None
+        """
+        start, end, _ = slice(start, end).indices(len(text))
+        transitions = self._transitions
+        outputs = self._outputs
+        patterns = self.patterns
+
+        state = 0
+        for index, character in enumerate(text[start:end], start + 1):
+            state = transitions[state].get(character, 0)
+            for pattern_index in outputs[state]:
+                pattern = patterns[pattern_index]
+                yield index - len(pattern), pattern
+
+    def _build(self) -> None:
+        """Build the automaton: the trie of the patterns, completed with the transitions
+        of the failure links so that scanning a character is a single lookup.
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+
+        for pattern_index, pattern in enumerate(self.patterns):
+            state = 0
+            for character in pattern:
+                if character not in transitions[state]:
+                    transitions[state][character] = len(transitions)
+                    transitions.append({})
+                    outputs.append(())
+
+                state = transitions[state][character]
+
+            outputs[state] += (pattern_index,)
+
+        # Visit the trie breadth first, so that the failure state of each state (the
+        # longest proper suffix which is in the trie) is complete before the state.
+        trie = [dict(state_transitions) for state_transitions in transitions]
+        failures = [0] * len(transitions)
+        queue = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            outputs[state] += outputs[failure]
+            transitions[state] = {**transitions[failure], **trie[state]}
+
+            for character, child in trie[state].items():
+                failures[child] = transitions[failure].get(character, 0)
+                queue.append(child)
+
+
+@lru_cache(maxsize=64)
+def compile_patterns(patterns: tuple[str, ...]) -> PatternMatcher:
+    """Return the `PatternMatcher` of the given patterns, reusing the most recently
+    compiled ones.
+
+    Parameters
+    ----------
+    patterns : tuple[str, ...]
+
+    Returns
+    -------
+    PatternMatcher
+    """
+    return PatternMatcher(patterns)
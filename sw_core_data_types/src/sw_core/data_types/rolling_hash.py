@@ -0,0 +1,110 @@
+"""
+RollingHash
+-----------
+
+The `RollingHash` class gives the fingerprint of any substring of a Python `str` in O(1).
+
+The fingerprint of the characters c_0 ... c_(m-1) is the polynomial hash
+sum((c_i + 1) * B^i) mod p, computed for two primes p, so that two different substrings
+have the same fingerprint with probability about m / 2^62. The table of the prefix hashes
+is built with `numpy` in O(n), after which the fingerprint of a range is the difference of
+two prefix hashes, shifted back to the start of the text. The bases B are chosen at random
+once per process, so that colliding texts cannot be crafted in advance, and therefore the
+fingerprints can be compared within the same process only.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+
+# third party library imports
+import numpy as np
+import numpy.typing as npt
+
+# local library specific imports
+
+
+# The primes of the two polynomial hashes, small enough that the product of two residues
+# fits in an unsigned 64 bits integer.
+MODULI = (2_147_483_647, 2_147_483_629)
+
+# The bases of the two polynomial hashes, chosen at random once per process.
+BASES = tuple(random.SystemRandom().randrange(1 << 20, modulus - 1) for modulus in MODULI)
+
+
+class RollingHash:
+    """The table of the prefix hashes of a Python `str`, which must not change while the
+    table is in use.
+    """
+    def __init__(self, text: str) -> None:
+        # The code points are shifted by 1, so that "\0" characters count.
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"),
+                              dtype="<u4").astype(np.uint64) + 1
+
+        self._length = len(text)
+
+        # For each modulus, the hashes of the prefixes text[:i] and the powers of the
+        # inverse of the base.
+        self._prefixes: list[npt.NDArray[np.uint64]] = []
+        self._inverse_powers: list[npt.NDArray[np.uint64]] = []
+        for modulus, base in zip(MODULI, BASES):
+            prefixes = np.zeros(len(text) + 1, dtype=np.uint64)
+            terms = codes * _powers(base, len(text), modulus) % modulus
+            np.cumsum(terms, out=prefixes[1:])
+            self._prefixes.append(prefixes % modulus)
+
+            inverse = pow(base, -1, modulus)
+            self._inverse_powers.append(_powers(inverse, len(text), modulus))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def range_hash(self, start: int, stop: int) -> int:
+        """Return the fingerprint of the characters in the range [`start`, `stop`), which
+        does not depend on the position of the range.
+
+        Parameters
+        ----------
+        start : int
+        stop : int
+
+        Returns
+        -------
+        int
+        """
+        if start >= stop:
+            return 0
+
+        fingerprint = 0
+        for modulus, prefixes, inverse_powers in zip(MODULI,
+                                                     self._prefixes,
+                                                     self._inverse_powers):
+            difference = (int(prefixes[stop]) - int(prefixes[start])) % modulus
+            fingerprint = (fingerprint * modulus +
+                           difference * int(inverse_powers[start]) % modulus)
+
+        return fingerprint
+
+
+def _powers(base: int, length: int, modulus: int) -> npt.NDArray[np.uint64]:
+    """Return the array of base^i mod `modulus` for i in [0, `length`), computed doubling
+    the filled part of the array at each step.
+    """
+    powers = np.ones(length, dtype=np.uint64)
+    size = 1
+    factor = base % modulus
+    while size < length:
+        count = min(size, length - size)
+        powers[size:size + count] = powers[:count] * np.uint64(factor) % modulus
+        factor = factor * factor % modulus
+        size *= 2
+
+    return powers
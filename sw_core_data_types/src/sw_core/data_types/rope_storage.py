@@ -0,0 +1,253 @@
+"""
+RopeStorage
+-----------
+
+The rope storage engine of the `MutableString` class.
+
+The content is split in chunks of text (the leaves) held by a height-balanced (AVL) binary
+tree, in which every node knows the length of the text below it. Reading a character and
+replacing, inserting or deleting a range of any length only visit the nodes along a path
+from the root, that is, they are O(log n) in the length of the content.
+
+The nodes are never changed once created: an edit builds new nodes along the visited path
+and shares all the others with the previous tree.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+from sys import getsizeof
+from typing import Iterator, Union
+
+# third party library imports
+
+# local library specific imports
+from .string_storage import StringStorage
+
+
+# Maximum number of characters of a leaf: smaller leaves are merged up to this size.
+MAX_LEAF_LENGTH = 1024
+
+
+class _Leaf:
+    """A chunk of text of the rope.
+    """
+    __slots__ = ("height", "length", "text")
+
+    def __init__(self, text: str) -> None:
+        self.height = 0
+        self.length = len(text)
+        self.text = text
+
+
+class _Node:
+    """An inner node of the rope, joining two non-empty subtrees.
+    """
+    __slots__ = ("height", "left", "length", "right")
+
+    def __init__(self, left: "_Rope", right: "_Rope") -> None:
+        self.height = max(left.height, right.height) + 1
+        self.left = left
+        self.length = left.length + right.length
+        self.right = right
+
+
+_Rope = Union[_Leaf, _Node]
+
+
+def build(string: str) -> _Rope | None:
+    """Return a balanced rope holding `string`, None if `string` is empty.
+    """
+    leaves = [_Leaf(string[index:index + MAX_LEAF_LENGTH])
+              for index in range(0, len(string), MAX_LEAF_LENGTH)]
+
+    def _build(first: int, last: int) -> _Rope:
+        if last - first == 1:
+            return leaves[first]
+
+        middle = (first + last) // 2
+        return _Node(_build(first, middle), _build(middle, last))
+
+    return _build(0, len(leaves)) if leaves else None
+
+
+def concat(left: _Rope | None, right: _Rope | None) -> _Rope | None:
+    """Return the rope holding the text of `left` followed by the text of `right`.
+    """
+    if left is None:
+        return right
+
+    if right is None:
+        return left
+
+    if isinstance(left, _Leaf) and isinstance(right, _Leaf):
+        if left.length + right.length <= MAX_LEAF_LENGTH:
+            return _Leaf(left.text + right.text)
+
+    if isinstance(left, _Node) and left.height > right.height + 1:
+        return _balance(left.left, concat(left.right, right))
+
+    if isinstance(right, _Node) and right.height > left.height + 1:
+        return _balance(concat(left, right.left), right.right)
+
+    return _Node(left, right)
+
+
+def leaves(rope: _Rope | None, start: int = 0, stop: int | None = None) -> Iterator[str]:
+    """Yield the chunks of text of `rope` in the range [`start`, `stop`).
+    """
+    if rope is None:
+        return
+
+    if stop is None:
+        stop = rope.length
+
+    # Stack of (subtree, offset of the subtree in the rope).
+    stack: list[tuple[_Rope, int]] = [(rope, 0)]
+    while stack:
+        node, offset = stack.pop()
+        if offset >= stop or offset + node.length <= start:
+            continue
+
+        if isinstance(node, _Leaf):
+            if start <= offset and offset + node.length <= stop:
+                yield node.text
+            else:
+                yield node.text[max(start - offset, 0):stop - offset]
+
+            continue
+
+        stack.append((node.right, offset + node.left.length))
+        stack.append((node.left, offset))
+
+
+def split(rope: _Rope | None, index: int) -> tuple[_Rope | None, _Rope | None]:
+    """Return the ropes holding the text of `rope` before and after `index`.
+    """
+    if rope is None:
+        return None, None
+
+    if index <= 0:
+        return None, rope
+
+    if index >= rope.length:
+        return rope, None
+
+    if isinstance(rope, _Leaf):
+        return _Leaf(rope.text[:index]), _Leaf(rope.text[index:])
+
+    if index <= rope.left.length:
+        left, right = split(rope.left, index)
+        return left, concat(right, rope.right)
+
+    left, right = split(rope.right, index - rope.left.length)
+    return concat(rope.left, left), right
+
+
+def _balance(left: _Rope | None, right: _Rope | None) -> _Rope | None:
+    """Return the rope joining `left` and `right`, whose heights differ by 2 at most,
+    rotating the nodes if needed to restore the balance.
+    """
+    if left is None or right is None:
+        return concat(left, right)
+
+    if isinstance(left, _Node) and left.height > right.height + 1:
+        if left.left.height < left.right.height:
+            inner = left.right
+            assert isinstance(inner, _Node)
+            return _Node(_Node(left.left, inner.left), _Node(inner.right, right))
+
+        return _Node(left.left, _Node(left.right, right))
+
+    if isinstance(right, _Node) and right.height > left.height + 1:
+        if right.right.height < right.left.height:
+            inner = right.left
+            assert isinstance(inner, _Node)
+            return _Node(_Node(left, inner.left), _Node(inner.right, right.right))
+
+        return _Node(_Node(left, right.left), right.right)
+
+    return _Node(left, right)
+
+
+class RopeStorage(StringStorage):
+    """Storage engine holding the content in a rope, so that replacing, inserting and
+    deleting ranges of any length is O(log n). The `str` returned by `to_string` is built
+    lazily and cached until the next mutation.
+
+    The copies share all the nodes: an edit of a copy only builds the O(log n) nodes
+    along the edited path, so that the memory taken by the copies is proportional to
+    their edits.
+    """
+    def __init__(self, string: str = "") -> None:
+        self._rope = build(string)
+
+        # The materialized content, None if it has to be rebuilt.
+        self._string: str | None = None
+
+    def __len__(self) -> int:
+        return 0 if self._rope is None else self._rope.length
+
+    def copy(self) -> "RopeStorage":
+        copy = RopeStorage()
+        copy._rope = self._rope
+        copy._string = self._string
+        return copy
+
+    def get_item(self, index: int) -> str:
+        if self._string is not None:
+            return self._string[index]
+
+        node = self._rope
+        while isinstance(node, _Node):
+            if index < node.left.length:
+                node = node.left
+            else:
+                index -= node.left.length
+                node = node.right
+
+        assert node is not None
+        return node.text[index]
+
+    def get_range(self, start: int, stop: int) -> str:
+        if self._string is not None:
+            return self._string[start:stop]
+
+        return "".join(leaves(self._rope, start, stop))
+
+    def load(self, string: str) -> None:
+        self._rope = build(string)
+        self._string = None
+
+    def memory_usage(self) -> int:
+        usage = 0 if self._string is None else getsizeof(self._string)
+        stack = [] if self._rope is None else [self._rope]
+        while stack:
+            node = stack.pop()
+            usage += getsizeof(node)
+            if isinstance(node, _Leaf):
+                usage += getsizeof(node.text)
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+        return usage
+
+    def replace(self, start: int, stop: int, value: str) -> None:
+        left, rest = split(self._rope, start)
+        _, right = split(rest, stop - start)
+        self._rope = concat(concat(left, build(value)), right)
+        self._string = None
+
+    def to_string(self) -> str:
+        if self._string is None:
+            self._string = "".join(leaves(self._rope))
+
+        return self._string
@@ -0,0 +1,321 @@
+"""
+SharedMemoryStorage
+-------------------
+
+The shared memory storage engine of the `MutableString` class.
+
+The content is held in a block of `multiprocessing.shared_memory`, so that other processes
+can attach to it by name and read it without the content being pickled and copied: a
+`MutableString` held by this storage is pickled as the name of its block only, therefore
+it can be given as it is to the workers of a `multiprocessing` pool.
+
+The block starts with a header holding the length of the content and the number of bytes
+per character, followed by the code points, 1, 2 or 4 bytes each as chosen from the
+content when the block is created. As for memory-mapped files, the length of the content
+and the width of the characters cannot change, so that only the edits keeping the length
+are possible. A process attached to a block can be restricted to read it, or to write only
+a range of it, so that several workers can write disjoint ranges at the same time.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import mmap
+import os
+import struct
+import sys
+import weakref
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+# third party library imports
+
+# local library specific imports
+from .string_storage import (StringStorage, decode_code_points, encode_code_points,
+                             narrowest_typecode, widest_typecode)
+
+
+# Number of characters read at a time by `SharedMemoryStorage.find` and converted at a
+# time by `SharedMemoryStorage.convert`.
+CHUNK_LENGTH = 1 << 20
+
+# The header of a block: the length of the content and the number of bytes per character.
+HEADER = struct.Struct("=QQ")
+
+# The modes in which a block can be attached to.
+ATTACH_MODES = ("r", "r+")
+
+# Only the owner removes a block: the blocks attached to are not registered with the
+# resource tracker, which would remove them when the attached process exits. Before Python
+# 3.13, the POSIX blocks are attached to by `_UntrackedSharedMemory` instead, while the
+# Windows ones are never registered.
+ATTACH_OPTIONS = {"track": False} if sys.version_info >= (3, 13) else {}
+
+
+class SharedMemoryStorage(StringStorage):
+    """Storage engine holding the content in a block of shared memory.
+
+    The process creating the block owns it: its storage removes the block when closed,
+    which must therefore happen after the other processes are done with it. The storages
+    attached to the block by name only release their own mapping when closed.
+    """
+    def __init__(self, string: str = "", name: str | None = None) -> None:
+        typecode = narrowest_typecode(string)
+        encoded = encode_code_points(string, typecode)
+        size = HEADER.size + len(encoded) * encoded.itemsize
+
+        # A block cannot be empty, but the header is always there.
+        self._memory = SharedMemory(name, create=True, size=size)
+        self._owner = True
+        self._track()
+        try:
+            HEADER.pack_into(self._memory.buf, 0, len(string), encoded.itemsize)
+            self._memory.buf[HEADER.size:size] = memoryview(encoded).cast("B")
+            self._setup(typecode, len(string), "r+", 0, len(string))
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __reduce__(self) -> tuple[Callable[..., "SharedMemoryStorage"], tuple[Any, ...]]:
+        # Another process attaches to the block instead of receiving a copy of it.
+        mode = "r" if self._readonly else "r+"
+        return SharedMemoryStorage.attach, (self.name, mode, self._start, self._stop)
+
+    @property
+    def name(self) -> str:
+        """The name of the block, by which other processes attach to it.
+        """
+        return self._memory.name
+
+    @classmethod
+    def attach(cls,
+               name: str,
+               mode: str = "r",
+               start: int = 0,
+               stop: int | None = None) -> "SharedMemoryStorage":
+        """Return a storage attached to the existing block `name`. In mode "r" the
+        content can only be read, in mode "r+" the characters in the range [`start`,
+        `stop`) can be written, too.
+        """
+        if mode not in ATTACH_MODES:
+            err_msg = (f"Unknown mode \"{mode}\", available ones are: "
+                       f"{', '.join(ATTACH_MODES)}!")
+            raise RuntimeError(err_msg)
+
+        storage = cls.__new__(cls)
+        storage._memory = _attach_block(name)
+        storage._owner = False
+        storage._track()
+
+        length, itemsize = HEADER.unpack_from(storage._memory.buf, 0)
+        typecode = {1: "B", 2: "H"}.get(itemsize, widest_typecode())
+        start, stop, _ = slice(start, stop).indices(length)
+        storage._setup(typecode, length, mode, start, max(start, stop))
+        return storage
+
+    def close(self) -> None:
+        """Release the block, removing it if this storage created it.
+        """
+        if self._memory is None:
+            return
+
+        self._finalizer()
+        self._memory = None
+
+    def convert(self, start: int, stop: int, function: Callable[[str], str]) -> int:
+        """Apply `function`, which must convert each character independently of the others
+        (as `str.lower` and `str.upper` do), to the characters in the range [`start`,
+        `stop`), one chunk at a time. The characters that `function` would convert to more
+        characters or to characters wider than the block allows are left unchanged.
+        """
+        for chunk_start in range(start, stop, CHUNK_LENGTH):
+            chunk_stop = min(chunk_start + CHUNK_LENGTH, stop)
+            chunk = self.get_range(chunk_start, chunk_stop)
+            converted = self._convert_chunk(chunk, function)
+            if converted != chunk:
+                self.replace(chunk_start, chunk_stop, converted)
+
+        return stop
+
+    def find(self, substr: str, start: int | None = None, end: int | None = None) -> int:
+        # Even an empty string is not found past the end, as with `str.find`.
+        if start is not None and start > len(self):
+            return -1
+
+        start, end, _ = slice(start, end).indices(len(self))
+        if len(substr) > end - start:
+            return -1
+
+        # The consecutive chunks overlap by one character less than `substr`, so that each
+        # occurrence is entirely in at least one chunk.
+        step = max(CHUNK_LENGTH, len(substr))
+        for chunk_start in range(start, max(end - len(substr), start) + 1, step):
+            chunk_stop = min(chunk_start + step + len(substr) - 1, end)
+            index = self.get_range(chunk_start, chunk_stop).find(substr)
+            if index != -1:
+                return chunk_start + index
+
+        return -1
+
+    def get_item(self, index: int) -> str:
+        return chr(self._data[index])
+
+    def get_range(self, start: int, stop: int) -> str:
+        itemsize = self._data.itemsize
+        return decode_code_points(self._bytes[start * itemsize:stop * itemsize],
+                                  self._typecode)
+
+    def load(self, string: str) -> None:
+        self.replace(0, len(self), string)
+
+    def memory_usage(self) -> int:
+        """Return the size of the block, which is shared with the other processes
+        attached to it.
+        """
+        return self._memory.size
+
+    def replace(self, start: int, stop: int, value: str) -> None:
+        if len(value) != stop - start:
+            err_msg = ("The length of shared memory MutableString objects cannot change, "
+                       "the replacement string must have the same length of the range!")
+            raise RuntimeError(err_msg)
+
+        if not value:
+            return
+
+        if self._readonly:
+            raise RuntimeError("The MutableString is attached to shared memory in "
+                               "read-only mode!")
+
+        if start < self._start or stop > self._stop:
+            err_msg = (f"The range [{start}, {stop}) is out of the writable range "
+                       f"[{self._start}, {self._stop}) of the shared memory!")
+            raise RuntimeError(err_msg)
+
+        try:
+            encoded = encode_code_points(value, self._typecode)
+        except UnicodeEncodeError as error:
+            err_msg = (f"The shared memory holds {self._data.itemsize} bytes per "
+                       f"character, given \"{value[error.start:error.end]}\"!")
+            raise RuntimeError(err_msg) from error
+
+        self._data[start:stop] = encoded
+
+    def to_string(self) -> str:
+        return self.get_range(0, len(self))
+
+    def _convert_chunk(self, chunk: str, function: Callable[[str], str]) -> str:
+        """Return `function(chunk)`, leaving unchanged the characters that `function`
+        would convert to more characters or to characters wider than the block allows.
+        """
+        converted = function(chunk)
+        if len(converted) == len(chunk) and self._fits(converted):
+            return converted
+
+        characters = []
+        for character in chunk:
+            converted = function(character)
+            if len(converted) == 1 and self._fits(converted):
+                characters.append(converted)
+            else:
+                characters.append(character)
+
+        return "".join(characters)
+
+    def _fits(self, string: str) -> bool:
+        """Return True if the characters of `string` fit the width of the block.
+        """
+        return array(narrowest_typecode(string)).itemsize <= self._data.itemsize
+
+    def _setup(self,
+               typecode: str,
+               length: int,
+               mode: str,
+               start: int,
+               stop: int) -> None:
+        """Set up the views of the content of the block and the writable range.
+        """
+        itemsize = array(typecode).itemsize
+        self._typecode = typecode
+        self._length = length
+        self._bytes = self._memory.buf[HEADER.size:HEADER.size + length * itemsize]
+        self._data = self._bytes.cast(typecode)
+        self._views[:] = [self._data, self._bytes]
+        self._readonly = mode == "r"
+        self._start = start
+        self._stop = stop
+
+    def _track(self) -> None:
+        """Release the block when the storage is garbage collected without being closed,
+        or at exit, removing it if this storage created it.
+        """
+        # The views set up later are released as well.
+        self._views: list[memoryview] = []
+        self._finalizer = weakref.finalize(self, _release_block, self._memory,
+                                           self._views, self._owner)
+
+
+class _UntrackedSharedMemory(SharedMemory):
+    """An existing POSIX block of shared memory, attached to without registering it with
+    the resource tracker, as `SharedMemory(name, track=False)` does with Python >= 3.13.
+
+    Unregistering the block after `SharedMemory(name)` is not an option: the processes
+    started by `multiprocessing` share the resource tracker of the owner, whose own
+    registration would be removed.
+    """
+    def __init__(self, name: str) -> None:
+        # The steps of `SharedMemory.__init__` attaching to a POSIX block, but the
+        # registration, setting the same attributes.
+        self._name = "/" + name
+        self._fd = shared_memory._posixshmem.shm_open(  # type: ignore[attr-defined]
+            self._name, self._flags, mode=self._mode)
+        try:
+            self._size = os.fstat(self._fd).st_size
+            self._mmap = mmap.mmap(self._fd, self._size)
+        except OSError:
+            os.close(self._fd)
+            self._fd = -1
+            raise
+
+        self._buf = memoryview(self._mmap)
+
+
+def _attach_block(name: str) -> SharedMemory:
+    """Return the existing block `name`, not registered with the resource tracker.
+    """
+    if ATTACH_OPTIONS or os.name != "posix":
+        return SharedMemory(name, **ATTACH_OPTIONS)
+
+    return _UntrackedSharedMemory(name)
+
+
+def _release_block(memory: SharedMemory, views: list[memoryview], owner: bool) -> None:
+    """Release the `views` of the block of `memory` and close it, removing it if `owner`.
+    A block already removed, e.g. by the resource tracker of another process, is ignored.
+    """
+    # The views of the block must be released before the block is closed.
+    for view in views:
+        view.release()
+
+    memory.close()
+    if not owner:
+        return
+
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        # `unlink` unregisters the block only once removed.
+        name = memory._name  # type: ignore[attr-defined]
+        resource_tracker.unregister(name, "shared_memory")
@@ -0,0 +1,350 @@
+"""
+StringStorage
+-------------
+
+The storage engines used by the `MutableString` class to hold its content.
+
+Each engine implements the same small set of primitives (read a character, read a range,
+replace a range and materialize the whole content), so that the `MutableString` API does
+not depend on how the characters are actually stored:
+    - `StrStorage` keeps the content in an immutable Python `str`, every edit rebuilds it;
+    - `ArrayStorage` keeps the content in a mutable array of code points, so that edits
+      are done in place.
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import re
+from abc import ABC, abstractmethod
+from array import array
+from sys import byteorder, getsizeof
+from typing import Callable
+
+# third party library imports
+
+# local library specific imports
+
+
+# Typecode of the array items able to hold any Unicode code point (4 bytes).
+_UCS4_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+# Codec used to convert a UCS-4 array from and to a Python `str`.
+_UCS4_CODEC = "utf-32-le" if byteorder == "little" else "utf-32-be"
+
+# Codec used to convert a UCS-2 array (2 bytes per item) from and to a Python `str`.
+_UCS2_CODEC = "utf-16-le" if byteorder == "little" else "utf-16-be"
+
+# Matches the characters which a UCS-2 array cannot hold.
+_NOT_UCS2 = re.compile("[\ud800-\udfff\U00010000-\U0010ffff]")
+
+
+def decode_code_points(data: array | memoryview, typecode: str) -> str:
+    """Return the `str` equivalent to the given array of code points, whose items are of
+    the given `typecode`.
+    """
+    if typecode == "B":
+        return str(data, "latin-1")
+
+    if typecode == "H":
+        return str(data, _UCS2_CODEC)
+
+    return str(data, _UCS4_CODEC, "surrogatepass")
+
+
+def encode_code_points(string: str, typecode: str | None = None) -> array:
+    """Return the array of code points equivalent to `string`. If `typecode` is not given,
+    the narrowest one able to hold all the characters is chosen.
+
+    Raises
+    ------
+    UnicodeEncodeError
+        If `typecode` is given and it cannot hold all the characters.
+    """
+    if typecode is None:
+        typecode = narrowest_typecode(string)
+
+    if typecode == "B":
+        return array("B", string.encode("latin-1"))
+
+    encoded = array(typecode)
+    if typecode == "H":
+        # UTF-16 would encode the characters out of the BMP as surrogate pairs, and the
+        # lone surrogates must not be paired when decoding, so neither can be UCS-2.
+        match = _NOT_UCS2.search(string)
+        if match is not None:
+            raise UnicodeEncodeError("ucs-2", string, match.start(), match.end(),
+                                     "character not in UCS-2")
+
+        encoded.frombytes(string.encode(_UCS2_CODEC))
+        return encoded
+
+    encoded.frombytes(string.encode(_UCS4_CODEC, "surrogatepass"))
+    return encoded
+
+
+def narrowest_typecode(string: str) -> str:
+    """Return the typecode of the narrowest array items able to hold all the characters
+    of `string`: 1 byte for Latin-1, 2 bytes for the BMP except the surrogates, 4 bytes
+    otherwise.
+    """
+    if not string or max(string) <= "\xff":
+        return "B"
+
+    if _NOT_UCS2.search(string) is None:
+        return "H"
+
+    return _UCS4_TYPECODE
+
+
+def widest_typecode() -> str:
+    """Return the typecode of the array items able to hold any Unicode code point.
+    """
+    return _UCS4_TYPECODE
+
+
+class StringStorage(ABC):
+    """The base class of the `MutableString` storage engines.
+
+    The indices given to the methods of this class are always non-negative and already
+    clipped to the length of the content: the checks are in charge of `MutableString`.
+    """
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of characters of the content.
+        """
+
+    def append(self, value: str) -> None:
+        """Append `value` to the content.
+        """
+        self.replace(len(self), len(self), value)
+
+    def close(self) -> None:
+        """Release the resources held by the storage, if any.
+        """
+
+    def copy(self) -> "StringStorage":
+        """Return a copy of the storage. The copy may share the content with the storage,
+        as long as an edit of one of them does not change the other.
+        """
+        return StrStorage(self.to_string())
+
+    def convert(self, start: int, stop: int, function: Callable[[str], str]) -> int:
+        """Replace the characters in the range [`start`, `stop`) with the result of
+        `function` applied to them and return the index after the last replaced character.
+        """
+        value = function(self.get_range(start, stop))
+        if start == 0 and stop == len(self):
+            self.load(value)
+        else:
+            self.replace(start, stop, value)
+
+        return start + len(value)
+
+    def find(self, substr: str, start: int | None = None, end: int | None = None) -> int:
+        """Return the lowest index where `substr` is found, -1 on failure.
+        """
+        return self.to_string().find(substr, start, end)
+
+    def flush(self) -> None:
+        """Write the content to the file holding it, if any.
+        """
+
+    @abstractmethod
+    def get_item(self, index: int) -> str:
+        """Return the character at position `index`.
+        """
+
+    @abstractmethod
+    def get_range(self, start: int, stop: int) -> str:
+        """Return the characters in the range [`start`, `stop`).
+        """
+
+    @abstractmethod
+    def load(self, string: str) -> None:
+        """Replace the whole content with `string`.
+        """
+
+    def memory_usage(self) -> int:
+        """Return the number of bytes of memory taken by the content, including the cached
+        `str`, if any.
+        """
+        return getsizeof(self.to_string())
+
+    @abstractmethod
+    def replace(self, start: int, stop: int, value: str) -> None:
+        """Replace the characters in the range [`start`, `stop`) with `value`.
+        """
+
+    def startswith(self, prefix: str, start: int, stop: int) -> bool:
+        """Return True if the characters in the range [`start`, `stop`) start with
+        `prefix`.
+        """
+        if start + len(prefix) > stop:
+            return False
+
+        return self.get_range(start, start + len(prefix)) == prefix
+
+    @abstractmethod
+    def to_string(self) -> str:
+        """Return the whole content as `str`.
+        """
+
+
+class StrStorage(StringStorage):
+    """Storage engine holding the content in an immutable Python `str`.
+
+    The appended strings are collected and joined at the next read of the content, so that
+    building a content by many appends takes amortized O(1) time per character.
+    """
+    def __init__(self, string: str = "") -> None:
+        self._string = string
+
+        # The strings appended to `self._string`, to be joined at the next read.
+        self._pending: list[str] = []
+        self._length = len(string)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, value: str) -> None:
+        self._pending.append(value)
+        self._length += len(value)
+
+    def copy(self) -> "StrStorage":
+        return StrStorage(self.to_string())
+
+    def find(self, substr: str, start: int | None = None, end: int | None = None) -> int:
+        return self.to_string().find(substr, start, end)
+
+    def get_item(self, index: int) -> str:
+        return self.to_string()[index]
+
+    def get_range(self, start: int, stop: int) -> str:
+        return self.to_string()[start:stop]
+
+    def load(self, string: str) -> None:
+        self._string = string
+        self._pending = []
+        self._length = len(string)
+
+    def memory_usage(self) -> int:
+        return getsizeof(self._string) + sum(map(getsizeof, self._pending))
+
+    def replace(self, start: int, stop: int, value: str) -> None:
+        string = self.to_string()
+        self._string = string[:start] + value + string[stop:]
+        self._length = len(self._string)
+
+    def startswith(self, prefix: str, start: int, stop: int) -> bool:
+        return self.to_string().startswith(prefix, start, stop)
+
+    def to_string(self) -> str:
+        if self._pending:
+            self._string = "".join([self._string, *self._pending])
+            self._pending = []
+
+        return self._string
+
+
+class ArrayStorage(StringStorage):
+    """Storage engine holding the content in a mutable `array` of code points.
+
+    The width of the items is chosen from the content, as CPython does for `str`: 1 byte
+    if all the characters are Latin-1, 2 bytes if they are in the Basic Multilingual
+    Plane, 4 bytes otherwise. Writing a character wider than the current width converts
+    the array to the narrowest width able to hold it. The `str` returned by `to_string` is
+    built lazily and cached until the next mutation.
+
+    The copies share the array until one of them is edited (copy-on-write).
+    """
+    def __init__(self, string: str = "") -> None:
+        self._array = encode_code_points(string)
+
+        # Whether the array may be shared with a copy, and then it must be copied before
+        # being edited.
+        self._shared = False
+
+        # The materialized content, None if it has to be rebuilt.
+        self._string: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def copy(self) -> "ArrayStorage":
+        copy = ArrayStorage()
+        copy._array = self._array
+        copy._shared = self._shared = True
+        copy._string = self._string
+        return copy
+
+    def get_item(self, index: int) -> str:
+        if self._string is not None:
+            return self._string[index]
+
+        return chr(self._array[index])
+
+    def get_range(self, start: int, stop: int) -> str:
+        if self._string is not None:
+            return self._string[start:stop]
+
+        return decode_code_points(memoryview(self._array)[start:stop],
+                                  self._array.typecode)
+
+    def load(self, string: str) -> None:
+        self._array = encode_code_points(string)
+        self._shared = False
+        self._string = None
+
+    def memory_usage(self) -> int:
+        cache = 0 if self._string is None else getsizeof(self._string)
+        return getsizeof(self._array) + cache
+
+    def replace(self, start: int, stop: int, value: str) -> None:
+        if self._shared:
+            self._array = self._array[:]
+            self._shared = False
+
+        if len(value) == 1 and stop - start == 1:
+            code_point = ord(value)
+            if code_point > 0xFF:
+                typecode = narrowest_typecode(value)
+                if array(typecode).itemsize > self._array.itemsize:
+                    self._widen(value)
+
+            self._array[start] = code_point
+            self._string = None
+            return
+
+        try:
+            encoded = encode_code_points(value, self._array.typecode)
+        except UnicodeEncodeError:
+            self._widen(value)
+            encoded = encode_code_points(value, self._array.typecode)
+
+        self._array[start:stop] = encoded
+        self._string = None
+
+    def to_string(self) -> str:
+        if self._string is None:
+            self._string = decode_code_points(self._array, self._array.typecode)
+
+        return self._string
+
+    def _widen(self, value: str) -> None:
+        """Convert the array to the narrowest items able to hold both the content and
+        `value`, it must be called before the content is changed since it relies on the
+        cached `str`, if any.
+        """
+        typecode = narrowest_typecode(value)
+        if array(typecode).itemsize < self._array.itemsize:
+            typecode = self._array.typecode
+
+        self._array = encode_code_points(self.to_string(), typecode)
@@ -0,0 +1,144 @@
+"""
+SuffixArray
+-----------
+
+The `SuffixArray` class is a substring search index over a Python `str`.
+
+It holds the starting indices of all the suffixes of the text, sorted in lexicographic
+order, so that all the occurrences of a pattern are found by a binary search in
+O(m log n), m being the length of the pattern and n the length of the text, instead of
+scanning the whole text. The array is built with the prefix doubling algorithm, vectorized
+with `numpy`, in O(n log^2 n).
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+
+# third party library imports
+import numpy as np
+import numpy.typing as npt
+
+# local library specific imports
+
+
+class SuffixArray:
+    """A substring search index over a Python `str`, which must not change while the index
+    is in use.
+    """
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._suffixes = SuffixArray._sort_suffixes(text)
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    def find(self, pattern: str, start: int = 0, end: int | None = None) -> int:
+        """Return the lowest index of `pattern` contained within the range [`start`,
+        `end`) of the text, -1 on failure.
+
+        Parameters
+        ----------
+        pattern : str
+            A non-empty pattern.
+        start : int, optional default to 0
+        end : int | None, optional default to None, meaning the end of the text
+        """
+        if end is None:
+            end = len(self._text)
+
+        positions = self._occurrences(pattern)
+        positions = positions[(positions >= start) & (positions + len(pattern) <= end)]
+        return int(positions.min()) if positions.size else -1
+
+    def find_all(self, pattern: str, start: int = 0, end: int | None = None) -> list[int]:
+        """Return the sorted indices of all the occurrences of `pattern`, overlapping ones
+        included, contained within the range [`start`, `end`) of the text.
+
+        Parameters
+        ----------
+        pattern : str
+            A non-empty pattern.
+        start : int, optional default to 0
+        end : int | None, optional default to None, meaning the end of the text
+        """
+        if end is None:
+            end = len(self._text)
+
+        positions = self._occurrences(pattern)
+        positions = positions[(positions >= start) & (positions + len(pattern) <= end)]
+        positions.sort()
+        return positions.tolist()
+
+    def _occurrences(self, pattern: str) -> npt.NDArray[np.int64]:
+        """Return the unsorted indices of all the occurrences of `pattern`.
+        """
+        text = self._text
+        suffixes = self._suffixes
+        length = len(pattern)
+
+        # The first suffix not less than the pattern.
+        low, high = 0, len(suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            index = suffixes[middle]
+            if text[index:index + length] < pattern:
+                low = middle + 1
+            else:
+                high = middle
+
+        first = low
+
+        # The first suffix not starting with the pattern.
+        high = len(suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            index = suffixes[middle]
+            if text[index:index + length] == pattern:
+                low = middle + 1
+            else:
+                high = middle
+
+        return suffixes[first:low]
+
+    @staticmethod
+    def _sort_suffixes(text: str) -> npt.NDArray[np.int64]:
+        """Return the starting indices of the suffixes of `text` in lexicographic order.
+
+        At each step the suffixes are sorted by their first 2k characters, as pairs of
+        ranks of their first k characters and of the k characters after them.
+        """
+        length = len(text)
+        if length == 0:
+            return np.empty(0, dtype=np.int64)
+
+        rank = np.frombuffer(text.encode("utf-32-le", "surrogatepass"),
+                             dtype="<u4").astype(np.int64)
+        step = 1
+        while True:
+            # The rank of a suffix shorter than step characters is -1: it comes first.
+            following = np.full(length, -1, dtype=np.int64)
+            following[:max(length - step, 0)] = rank[step:]
+
+            suffixes = np.lexsort((following, rank))
+            sorted_rank = rank[suffixes]
+            sorted_following = following[suffixes]
+            is_new = np.empty(length, dtype=np.int64)
+            is_new[0] = 0
+            is_new[1:] = ((sorted_rank[1:] != sorted_rank[:-1]) |
+                          (sorted_following[1:] != sorted_following[:-1]))
+
+            rank = np.empty(length, dtype=np.int64)
+            rank[suffixes] = np.cumsum(is_new)
+
+            if rank[suffixes[-1]] == length - 1 or step >= length:
+                return suffixes.astype(np.int64)
+
+            step *= 2
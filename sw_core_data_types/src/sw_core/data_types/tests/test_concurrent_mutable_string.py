@@ -0,0 +1,158 @@
+"""
+ConcurrentMutableStringTestSuite
+--------------------------------
+
+Tests for the `ConcurrentMutableString` and `ReadWriteLock` classes.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import threading
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..concurrent_mutable_string import ConcurrentMutableString, ReadWriteLock
+from ..mutable_string import STORAGE_TYPES
+
+
+class ConcurrentMutableStringTestSuite(unittest.TestCase):
+    """
+    Tests for the `ConcurrentMutableString` and `ReadWriteLock` classes.
+    """
+    def test_batch(self) -> None:
+        """Tests that the readers see either none or all of the edits of `batch`.
+        """
+        for storage in STORAGE_TYPES:
+            string = ConcurrentMutableString("a" * 64, storage)
+            seen = set()
+            done = threading.Event()
+
+            def read() -> None:
+                while not done.is_set():
+                    seen.add(string[:])
+                    seen.add(string.split("|")[0])
+
+            readers = [threading.Thread(target=read) for _ in range(4)]
+            for reader in readers:
+                reader.start()
+
+            for letter in "bcdefgh":
+                with string.batch():
+                    for index in range(len(string)):
+                        string[index] = letter
+
+            done.set()
+            for reader in readers:
+                reader.join()
+
+            with self.subTest(storage=storage):
+                self.assertTrue(seen <= {letter * 64 for letter in "abcdefgh"})
+                self.assertEqual(string, "h" * 64)
+
+        with self.subTest():
+            string = ConcurrentMutableString("abc")
+            string.use_journal()
+            with string.batch():
+                string.upper()
+                string.append("d")
+
+            self.assertEqual(string, "ABCd")
+            self.assertTrue(string.undo())
+            self.assertEqual(string, "abc")
+
+    def test_copy(self) -> None:
+        """Tests that the copies of a `ConcurrentMutableString` are concurrent as well.
+        """
+        string = ConcurrentMutableString("key = value")
+        with self.subTest():
+            copy = string.copy()
+            self.assertIs(type(copy), ConcurrentMutableString)
+            self.assertIsNot(copy._lock, string._lock)
+
+        with self.subTest():
+            with string.share() as shared:
+                self.assertIs(type(shared), ConcurrentMutableString)
+                self.assertEqual(len(shared), len(string))
+
+    def test_concurrent_edits(self) -> None:
+        """Tests that edits of many threads at the same time are all kept.
+        """
+        for storage in STORAGE_TYPES:
+            string = ConcurrentMutableString(storage=storage)
+
+            def write(letter: str) -> None:
+                for _ in range(500):
+                    string.append(letter)
+                    string.find(letter)
+
+            writers = [threading.Thread(target=write, args=(letter,))
+                       for letter in "abcd"]
+            for writer in writers:
+                writer.start()
+
+            for writer in writers:
+                writer.join()
+
+            with self.subTest(storage=storage):
+                self.assertEqual(len(string), 2000)
+                self.assertEqual(sorted(string.to_string()), sorted("abcd" * 500))
+
+    def test_read_write_lock(self) -> None:
+        """Tests that the readers share the lock, and that a writer excludes them.
+        """
+        lock = ReadWriteLock()
+        with self.subTest():
+            inside = threading.Barrier(2, timeout=5)
+
+            def read() -> None:
+                with lock.read():
+                    inside.wait()
+
+            reader = threading.Thread(target=read)
+            reader.start()
+            with lock.read():
+                inside.wait()
+
+            reader.join()
+
+        with self.subTest():
+            events = []
+            writing = threading.Event()
+
+            def write() -> None:
+                with lock.write():
+                    writing.set()
+                    threading.Event().wait(0.05)
+                    events.append("write")
+
+            writer = threading.Thread(target=write)
+            writer.start()
+            writing.wait()
+            with lock.read():
+                events.append("read")
+
+            writer.join()
+            self.assertEqual(events, ["write", "read"])
+
+        with self.subTest():
+            with lock.write():
+                with lock.write(), lock.read():
+                    pass
+
+        with self.subTest():
+            with lock.read():
+                with lock.read():
+                    with self.assertRaises(RuntimeError):
+                        with lock.write():
+                            pass
@@ -0,0 +1,55 @@
+"""
+DirtyRangesTestSuite
+--------------------
+
+Tests for the `DirtyRanges` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..dirty_ranges import DirtyRanges
+
+
+class DirtyRangesTestSuite(unittest.TestCase):
+    """
+    Tests for the `DirtyRanges` class.
+    """
+    def test_add(self) -> None:
+        """Tests for the `add` method.
+        """
+        dirty_ranges = DirtyRanges()
+
+        with self.subTest():
+            dirty_ranges.add(10, 12, 12)
+            dirty_ranges.add(2, 3, 5)
+            self.assertEqual(dirty_ranges.ranges(), [(2, 5), (12, 14)])
+
+        with self.subTest():
+            dirty_ranges.add(20, 25, 20)
+            self.assertEqual(dirty_ranges.ranges(), [(2, 5), (12, 14), (20, 20)])
+
+        with self.subTest():
+            dirty_ranges.add(5, 5, 6)
+            self.assertEqual(dirty_ranges.ranges(), [(2, 6), (13, 15), (21, 21)])
+
+        with self.subTest():
+            dirty_ranges.add(4, 14, 4)
+            self.assertEqual(dirty_ranges.ranges(), [(2, 5), (11, 11)])
+
+        with self.subTest():
+            dirty_ranges.clear()
+            self.assertEqual(len(dirty_ranges), 0)
@@ -0,0 +1,104 @@
+"""
+EditJournalTestSuite
+--------------------
+
+Tests for the `EditJournal` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..edit_journal import EditJournal
+
+
+class EditJournalTestSuite(unittest.TestCase):
+    """
+    Tests for the `EditJournal` class.
+    """
+    def test_group(self) -> None:
+        """Tests for the `group` method.
+        """
+        journal = EditJournal()
+        with journal.group():
+            journal.record(0, "a", "A")
+            with journal.group():
+                journal.record(5, "b", "B")
+
+        with self.subTest():
+            self.assertEqual(journal.undo_count, 1)
+
+        with self.subTest():
+            self.assertEqual(journal.undo(), ((0, "a", "A"), (5, "b", "B")))
+
+    def test_invalid_max_size(self) -> None:
+        """Tests that a negative maximum size raises an exception.
+        """
+        with self.assertRaises(RuntimeError):
+            EditJournal(-1)
+
+    def test_max_size(self) -> None:
+        """Tests that the oldest steps are evicted beyond the maximum size.
+        """
+        journal = EditJournal(max_size=6)
+        journal.record(0, "ab", "cd")
+        journal.record(0, "c", "e")
+        journal.record(0, "e", "f")
+
+        with self.subTest():
+            self.assertEqual((journal.undo_count, journal.size), (2, 4))
+
+        with self.subTest():
+            journal.record(0, "0123456", "")
+            self.assertEqual((journal.undo_count, journal.size), (0, 0))
+
+    def test_record(self) -> None:
+        """Tests for the `record` method, which trims the unchanged characters.
+        """
+        journal = EditJournal()
+
+        with self.subTest():
+            journal.record(10, "first string", "first String")
+            self.assertEqual(journal.undo(), ((16, "s", "S"),))
+
+        with self.subTest():
+            journal.record(0, "aaaa", "aa")
+            self.assertEqual(journal.undo(), ((2, "aa", ""),))
+
+        with self.subTest():
+            journal.record(0, "same", "same")
+            self.assertIsNone(journal.undo())
+
+    def test_undo_redo(self) -> None:
+        """Tests for the `undo` and `redo` methods.
+        """
+        journal = EditJournal()
+        journal.record(0, "a", "b")
+        journal.record(1, "c", "d")
+
+        with self.subTest():
+            self.assertEqual(journal.undo(), ((1, "c", "d"),))
+
+        with self.subTest():
+            self.assertEqual(journal.redo(), ((1, "c", "d"),))
+
+        with self.subTest():
+            self.assertIsNone(journal.redo())
+
+        with self.subTest():
+            journal.undo()
+            journal.record(2, "e", "f")
+            self.assertEqual((journal.undo_count, journal.redo_count, journal.size),
+                             (2, 0, 4))
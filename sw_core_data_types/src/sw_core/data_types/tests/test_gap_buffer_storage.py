@@ -0,0 +1,100 @@
+"""
+GapBufferStorageTestSuite
+-------------------------
+
+Tests for the `GapBufferStorage` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+
+# third party library imports
+
+# local library specific imports
+from . import test_string_storage
+from ..gap_buffer_storage import GapBufferStorage
+
+
+class GapBufferStorageTestSuite(test_string_storage.StrStorageTestSuite):
+    """
+    Tests for the `GapBufferStorage` class.
+    """
+    storage_type = GapBufferStorage
+
+    def test_cursor(self) -> None:
+        """Tests that the gap follows the edits.
+        """
+        storage = GapBufferStorage("abcdef")
+
+        with self.subTest():
+            self.assertEqual(storage.cursor, 6)
+
+        with self.subTest():
+            storage.replace(2, 2, "12")
+            self.assertEqual(storage.cursor, 4)
+
+        with self.subTest():
+            storage.replace(1, 3, "")
+            self.assertEqual(storage.cursor, 1)
+
+        with self.subTest():
+            self.assertEqual(storage.to_string(), "a2cdef")
+
+    def test_get_range_across_gap(self) -> None:
+        """Tests for the `get_range` method, with ranges across the gap.
+        """
+        storage = GapBufferStorage("abcdef")
+        storage.replace(3, 3, "123")
+        storage.replace(3, 6, "")
+
+        with self.subTest():
+            self.assertEqual(storage.get_range(1, 5), "bcde")
+
+        with self.subTest():
+            self.assertEqual(storage.get_item(4), "e")
+
+    def test_random_edits(self) -> None:
+        """Tests that random edits of any length match the `str` equivalent.
+        """
+        generator = random.Random(0)
+        expected = "".join(generator.choice("abc\n") for _ in range(5000))
+        storage = GapBufferStorage(expected)
+
+        position = 0
+        for _ in range(1000):
+            start = min(len(expected), max(0, position + generator.randrange(-20, 20)))
+            stop = min(len(expected), start + generator.randrange(5))
+            value = generator.choice(["", "x", "yy", "zzzz"])
+            storage.replace(start, stop, value)
+            expected = expected[:start] + value + expected[stop:]
+            position = start + len(value)
+
+        with self.subTest():
+            self.assertEqual(storage.to_string(), expected)
+
+        with self.subTest():
+            self.assertEqual(len(storage), len(expected))
+
+    def test_same_length_edits_in_place(self) -> None:
+        """Tests that replacements of the same length do not move the gap.
+        """
+        storage = GapBufferStorage("abcdef")
+        storage.replace(3, 3, "123")
+        storage.replace(0, 2, "AB")
+        storage.replace(7, 9, "EF")
+
+        with self.subTest():
+            self.assertEqual(storage.cursor, 6)
+
+        with self.subTest():
+            self.assertEqual(storage.to_string(), "ABc123dEF")
@@ -0,0 +1,73 @@
+"""
+LineIndexTestSuite
+------------------
+
+Tests for the `LineIndex` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..line_index import LineIndex
+from ..string_storage import StrStorage
+
+
+class LineIndexTestSuite(unittest.TestCase):
+    """
+    Tests for the `LineIndex` class.
+    """
+    def test_line_column(self) -> None:
+        """Tests for the `line_column` method.
+        """
+        index = LineIndex(StrStorage("ab\ncd\r\n\ne"))
+
+        with self.subTest():
+            self.assertEqual([index.line_column(offset) for offset in range(10)],
+                             [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (1, 3),
+                              (2, 0), (3, 0), (3, 1)])
+
+        with self.subTest():
+            self.assertEqual(len(LineIndex(StrStorage("ab\n"))), 2)
+
+    def test_line_offset(self) -> None:
+        """Tests for the `line_offset` method.
+        """
+        index = LineIndex(StrStorage("ab\ncd\r\n\ne"))
+        self.assertEqual([index.line_offset(line) for line in range(len(index))],
+                         [0, 3, 7, 8])
+
+    def test_update(self) -> None:
+        """Tests that the `update` method gives the same index as a new one, after random
+        edits.
+        """
+        generator = random.Random(0)
+        storage = StrStorage("".join(generator.choice("ab\r\n") for _ in range(200)))
+        index = LineIndex(storage)
+
+        for _ in range(500):
+            start = generator.randrange(len(storage) + 1)
+            stop = generator.randrange(start, min(start + 5, len(storage)) + 1)
+            length = generator.randrange(5)
+            value = "".join(generator.choice("ab\r\n") for _ in range(length))
+            storage.replace(start, stop, value)
+            index.update(storage, start, stop, start + len(value))
+
+            expected = LineIndex(storage)
+            with self.subTest(string=storage.to_string()):
+                self.assertEqual([index.line_offset(line) for line in range(len(index))],
+                                 [expected.line_offset(line)
+                                  for line in range(len(expected))])
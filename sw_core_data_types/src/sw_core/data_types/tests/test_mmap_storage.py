@@ -0,0 +1,212 @@
+"""
+MmapStorageTestSuite
+--------------------
+
+Tests for the `MmapStorage` class and for the memory-mapped `MutableString` objects.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import tempfile
+import unittest
+from pathlib import Path
+
+# third party library imports
+
+# local library specific imports
+from .. import mmap_storage
+from ..mmap_storage import MmapStorage
+from ..mutable_string import MutableString
+
+
+class MmapStorageTestSuite(unittest.TestCase):
+    """
+    Tests for the `MmapStorage` class.
+    """
+    def setUp(self) -> None:
+        """Creates a temporary file to be mapped by each test.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "input_deck.txt"
+        self.path.write_bytes(b"key_1 = value\nkey_2 = Stra\xdfe\n")
+
+    def test_apply_patches(self) -> None:
+        """Tests for the `apply_patches` method, whose patches must keep their length.
+        """
+        with MutableString.open(self.path) as string:
+            with self.subTest():
+                string.use_journal()
+                string.checkpoint()
+                string.apply_patches([(14, 17, "KEY"), (0, 3, "KEY")])
+                self.assertEqual(string.dirty_ranges(), [(0, 3), (14, 17)])
+                self.assertTrue(string.undo())
+                self.assertEqual(string, "key_1 = value\nkey_2 = Stra\xdfe\n")
+
+            for tracked in (False, True):
+                if not tracked:
+                    string.use_journal(False)
+
+                with self.subTest(tracked=tracked):
+                    with self.assertRaises(RuntimeError):
+                        string.apply_patches([(0, 3, "KEYS"), (5, 6, "")])
+
+                    self.assertEqual(string, "key_1 = value\nkey_2 = Stra\xdfe\n")
+
+    def test_close(self) -> None:
+        """Tests that `close` writes the edits to the file.
+        """
+        with MutableString.open(self.path) as string:
+            string[8:13] = "VALUE"
+
+        self.assertEqual(self.path.read_bytes(), b"key_1 = VALUE\nkey_2 = Stra\xdfe\n")
+
+    def test_convert(self) -> None:
+        """Tests for the `convert` method, one chunk at a time.
+        """
+        self.path.write_bytes(b"abc \xdf\xff\xb5 " * 10)
+        storage = MmapStorage(self.path)
+        self.addCleanup(storage.close)
+
+        with self.subTest():
+            original_chunk_length = mmap_storage.CONVERSION_CHUNK_LENGTH
+            mmap_storage.CONVERSION_CHUNK_LENGTH = 7
+            try:
+                self.assertEqual(storage.convert(0, 24, str.upper), 24)
+            finally:
+                mmap_storage.CONVERSION_CHUNK_LENGTH = original_chunk_length
+
+        with self.subTest():
+            # The upper case of "\xdf", "\xff" and "\xb5" is not a single Latin-1 character.
+            self.assertEqual(storage.get_range(0, 24), "ABC \xdf\xff\xb5 " * 3)
+
+        with self.subTest():
+            self.assertEqual(storage.get_range(24, 32), "abc \xdf\xff\xb5 ")
+
+    def test_empty_file(self) -> None:
+        """Tests the mapping of an empty file.
+        """
+        self.path.write_bytes(b"")
+        with MutableString.open(self.path) as string:
+            with self.subTest():
+                self.assertEqual(len(string), 0)
+
+            with self.subTest():
+                self.assertEqual(string.find("a"), -1)
+
+            with self.subTest():
+                self.assertEqual(string, "")
+
+    def test_find(self) -> None:
+        """Tests for the `find` method.
+        """
+        with MutableString.open(self.path, "r") as string:
+            with self.subTest():
+                self.assertEqual(string.find("key"), 0)
+
+            with self.subTest():
+                self.assertEqual(string.find("key", 1), 14)
+
+            with self.subTest():
+                self.assertEqual(string.find("Straße"), 22)
+
+            with self.subTest():
+                self.assertEqual(string.find("€"), -1)
+
+            with self.subTest():
+                self.assertEqual((string.find("", 29), string.find("", 30)), (29, -1))
+
+    def test_get_item(self) -> None:
+        """Tests for the `__getitem__` method.
+        """
+        with MutableString.open(self.path, "r") as string:
+            with self.subTest():
+                self.assertEqual(string[8], "v")
+
+            with self.subTest():
+                self.assertEqual(string[-3], "ß")
+
+            with self.subTest():
+                self.assertEqual(string[22:28], "Straße")
+
+    def test_invalid_mode(self) -> None:
+        """Tests that the mode must be "r" or "r+".
+        """
+        with self.assertRaises(RuntimeError):
+            MutableString.open(self.path, "w")
+
+    def test_lower_upper(self) -> None:
+        """Tests the case conversions.
+        """
+        with MutableString.open(self.path) as string:
+            with self.subTest():
+                string.upper()
+                self.assertEqual(string, "KEY_1 = VALUE\nKEY_2 = STRAßE\n")
+
+            with self.subTest():
+                string.lower()
+                self.assertEqual(string, "key_1 = value\nkey_2 = straße\n")
+
+            with self.subTest():
+                string.capitalize()
+                self.assertEqual(string, "Key_1 = value\nkey_2 = straße\n")
+
+    def test_read_only(self) -> None:
+        """Tests that a file mapped in read-only mode cannot be edited.
+        """
+        with MutableString.open(self.path, "r") as string:
+            with self.assertRaises(RuntimeError):
+                string[0] = "K"
+
+    def test_restore(self) -> None:
+        """Tests that `restore` writes the snapshot back to the file.
+        """
+        with MutableString.open(self.path) as string:
+            snapshot = string.snapshot()
+            string.upper()
+            string.restore(snapshot)
+
+        self.assertEqual(self.path.read_bytes(), b"key_1 = value\nkey_2 = Stra\xdfe\n")
+
+    def test_set_item(self) -> None:
+        """Tests for the `__setitem__` method, which must keep the length.
+        """
+        with MutableString.open(self.path) as string:
+            with self.subTest():
+                string[0:3] = "KEY"
+                string[27] = "E"
+                string.flush()
+                self.assertEqual(self.path.read_bytes(),
+                                 b"KEY_1 = value\nkey_2 = Stra\xdfE\n")
+
+            with self.assertRaises(RuntimeError):
+                string[0:3] = "K"
+
+            with self.assertRaises(RuntimeError):
+                string[0] = "€"
+
+            with self.assertRaises(RuntimeError):
+                string.insert(0, "K")
+
+    def test_undo_redo(self) -> None:
+        """Tests that the edits rejected by the storage are not recorded by the journal.
+        """
+        with MutableString.open(self.path) as string:
+            string.use_journal()
+            string[0:3] = "KEY"
+            with self.assertRaises(RuntimeError):
+                string[0:3] = "K"
+
+            with self.subTest():
+                self.assertTrue(string.undo())
+                self.assertEqual(string, "key_1 = value\nkey_2 = Stra\xdfe\n")
+                self.assertFalse(string.undo())
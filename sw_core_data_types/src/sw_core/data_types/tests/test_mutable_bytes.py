@@ -0,0 +1,218 @@
+"""
+MutableBytesTestSuite
+---------------------
+
+Tests for the `MutableBytes` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import io
+import sys
+import unittest
+
+# third party library imports
+import numpy as np
+
+# local library specific imports
+from ..mutable_bytes import MutableBytes
+
+
+class MutableBytesTestSuite(unittest.TestCase):
+    """
+    Tests for the `MutableBytes` class.
+    """
+    def test_add(self) -> None:
+        """Tests for the `__add__` method.
+        """
+        data = MutableBytes(b"abc")
+
+        with self.subTest():
+            self.assertEqual(data + b"d", b"abcd")
+
+        with self.subTest():
+            self.assertEqual(data + MutableBytes(b"d"), b"abcd")
+
+        with self.assertRaises(RuntimeError):
+            data + "d"  # type: ignore[operator]
+
+    @unittest.skipIf(sys.version_info < (3, 12), "the buffer protocol needs Python 3.12")
+    def test_buffer_protocol(self) -> None:
+        """Tests that the content is exposed through the buffer protocol.
+        """
+        data = MutableBytes(b"\x01\x00\x02\x00")
+
+        with self.subTest():
+            self.assertEqual(np.frombuffer(data, dtype="<u2").tolist(), [1, 2])
+
+        with self.subTest():
+            with memoryview(data) as view:
+                view[0] = 3
+            self.assertEqual(data, b"\x03\x00\x02\x00")
+
+    def test_capitalize(self) -> None:
+        """Tests for the `capitalize` method.
+        """
+        data = MutableBytes(b"aBC \xe9")
+        data.capitalize()
+
+        self.assertEqual(data, b"Abc \xe9")
+
+    def test_delete(self) -> None:
+        """Tests for the `delete` method.
+        """
+        data = MutableBytes(b"abcdef")
+        data.delete(1, 3)
+
+        self.assertEqual(data, b"adef")
+
+    def test_find(self) -> None:
+        """Tests for the `find` method.
+        """
+        data = MutableBytes(b"first bytes")
+
+        with self.subTest():
+            self.assertEqual(data.find(b"st"), 3)
+
+        with self.subTest():
+            self.assertEqual(data.find(ord("t"), 5), 8)
+
+        with self.subTest():
+            self.assertEqual(data.find(b"ci"), -1)
+
+    def test_get_item(self) -> None:
+        """Tests for the `__getitem__` method.
+        """
+        data = MutableBytes(b"abc")
+
+        with self.subTest():
+            self.assertEqual(data[0], ord("a"))
+
+        with self.subTest():
+            self.assertEqual(data[-1], ord("c"))
+
+        with self.subTest():
+            self.assertEqual(data[0:2], b"ab")
+
+        with self.assertRaises(IndexError):
+            data[3]
+
+    def test_init(self) -> None:
+        """Tests for the `__init__` method.
+        """
+        with self.subTest():
+            self.assertEqual(MutableBytes(), b"")
+
+        with self.subTest():
+            self.assertEqual(MutableBytes(memoryview(b"abc")), b"abc")
+
+        with self.assertRaises(RuntimeError):
+            MutableBytes("abc")  # type: ignore[arg-type]
+
+    def test_insert(self) -> None:
+        """Tests for the `insert` method.
+        """
+        data = MutableBytes(b"ac")
+        data.insert(1, b"b")
+
+        self.assertEqual(data, b"abc")
+
+    def test_lower_upper(self) -> None:
+        """Tests for the `lower` and `upper` methods.
+        """
+        data = MutableBytes(b"aBc \xc9")
+
+        with self.subTest():
+            data.lower()
+            self.assertEqual(data, b"abc \xc9")
+
+        with self.subTest():
+            data.upper()
+            self.assertEqual(data, b"ABC \xc9")
+
+        with self.subTest():
+            data.lower(1, -2)
+            self.assertEqual(data, b"Abc \xc9")
+
+    def test_set_item(self) -> None:
+        """Tests for the `__setitem__` method.
+        """
+        data = MutableBytes(b"abcdef")
+
+        with self.subTest():
+            data[0] = ord("A")
+            self.assertEqual(data, b"Abcdef")
+
+        with self.subTest():
+            data[1:3] = b"BC"
+            self.assertEqual(data, b"ABCdef")
+
+        with self.subTest():
+            data[-1] = b"F"
+            self.assertEqual(data, b"ABCdeF")
+
+        with self.subTest():
+            data[3:5] = b""
+            self.assertEqual(data, b"ABCF")
+
+        with self.assertRaises(RuntimeError):
+            data[0] = "a"  # type: ignore[assignment]
+
+    def test_split(self) -> None:
+        """Tests for the `split` method.
+        """
+        data = MutableBytes(b"a b,c  d")
+
+        with self.subTest():
+            self.assertEqual(data.split(), [b"a", b"b,c", b"d"])
+
+        with self.subTest():
+            self.assertEqual(data.split(b","), [b"a b", b"c  d"])
+
+    def test_strip(self) -> None:
+        """Tests for the `strip`, `lstrip` and `rstrip` methods.
+        """
+        data = MutableBytes(b"  abc  ")
+
+        with self.subTest():
+            self.assertEqual(data.lstrip(), (2, 7))
+            self.assertEqual(data, b"abc  ")
+
+        with self.subTest():
+            self.assertEqual(data.rstrip(), (0, 3))
+            self.assertEqual(data, b"abc")
+
+        with self.subTest():
+            self.assertEqual(data.strip(b"ac"), (1, 2))
+            self.assertEqual(data, b"b")
+
+    def test_to_memoryview(self) -> None:
+        """Tests for the `to_memoryview` method.
+        """
+        data = MutableBytes(b"abc")
+        stream = io.BytesIO()
+
+        with data.to_memoryview() as view:
+            with self.subTest():
+                stream.write(view)
+                self.assertEqual(stream.getvalue(), b"abc")
+
+            with self.subTest():
+                view[0] = ord("A")
+                self.assertEqual(data, b"Abc")
+
+            with self.assertRaises(BufferError):
+                data.insert(0, b"0")
+
+        with self.subTest():
+            self.assertEqual(np.frombuffer(data.to_memoryview(), dtype=np.uint8).sum(),
+                             ord("A") + ord("b") + ord("c"))
@@ -16,12 +16,27 @@ __email__ = "studio.w.engineers@gmail.com"
 __status__ "Release to manufacturing"
 """
 # standard library imports
+import copy as copy_module
+import io
+import pickle
+import re
+import tempfile
 import unittest
+from pathlib import Path
 
 # third party library imports
 
 # local library specific imports
-from ..mutable_string import MutableString
+from .. import mutable_string
+from ..mutable_string import STORAGE_TYPES, MutableString, compile_regex
+from ..pattern_matcher import PatternMatcher
+
+
+def double_vowels(text: str) -> str:
+    """Return `text` with the vowels doubled, changing the length, as a picklable
+    function for the worker processes of `MutableString.transform`.
+    """
+    return re.sub("[aeiou]", lambda match: match.group() * 2, text)
 
 
 class MutableStringTestSuite(unittest.TestCase):
@@ -39,6 +54,78 @@ class MutableStringTestSuite(unittest.TestCase):
         with self.subTest():
             self.assertFalse(string + "a" == "acc")
 
+    def test_append(self) -> None:
+        """Tests for the `append`, `extend`, `__iadd__` and `write` methods.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("abc", storage=storage)
+            string.append("d")
+            string.extend(["e", "", "€"])
+            string += "g"
+            print("h", 1, file=string)
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string, "abcde€gh 1\n")
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.write("ij"), 2)
+                self.assertEqual((string[-1], len(string)), ("j", 13))
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                string.append(1)  # type: ignore[arg-type]
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                string.extend(["a", 1])  # type: ignore[list-item]
+
+    def test_apply_patches(self) -> None:
+        """Tests for the `apply_patches` method.
+        """
+        string = MutableString("key_1 = 1, key_2 = 2")
+
+        with self.subTest():
+            string.apply_patches([(19, 20, "22"), (0, 5, "K1"), (11, 11, "new, ")])
+            self.assertEqual(string, "K1 = 1, new, key_2 = 22")
+
+        with self.subTest():
+            string.apply_patches([])
+            self.assertEqual(string, "K1 = 1, new, key_2 = 22")
+
+        with self.subTest():
+            string.apply_patches([(0, 0, "a"), (0, 0, "b"), (0, 2, "")])
+            self.assertEqual(string, "ab = 1, new, key_2 = 22")
+
+        with self.assertRaises(RuntimeError):
+            string.apply_patches([(0, 5, "a"), (4, 6, "b")])
+
+        with self.assertRaises(RuntimeError):
+            string.apply_patches([(20, 30, "a")])
+
+        with self.assertRaises(RuntimeError):
+            string.apply_patches([(0, 1, 1)])  # type: ignore[list-item]
+
+        with self.subTest():
+            self.assertEqual(string, "ab = 1, new, key_2 = 22")
+
+        for storage in STORAGE_TYPES:
+            string = MutableString("key_1 = 1\nkey_2 = 2\nkey_3 = 3\n", storage=storage)
+            string.use_journal()
+            string.checkpoint()
+            string.line_offset(0)
+
+            with self.subTest(storage=storage):
+                string.apply_patches([(8, 9, "1\n"), (18, 19, ""), (28, 30, "33")])
+                self.assertEqual(string, "key_1 = 1\n\nkey_2 = \nkey_3 = 33")
+                self.assertEqual(string.dirty_ranges(), [(8, 10), (19, 19), (28, 30)])
+                self.assertEqual([string.line_offset(line) for line in range(4)],
+                                 [0, 10, 11, 20])
+
+            with self.subTest(storage=storage):
+                self.assertTrue(string.undo())
+                self.assertEqual(string, "key_1 = 1\nkey_2 = 2\nkey_3 = 3\n")
+                self.assertFalse(string.undo())
+
     def test_capitalize(self) -> None:
         """Tests for the `capitalize` method.
         """
@@ -47,6 +134,68 @@ class MutableStringTestSuite(unittest.TestCase):
 
         self.assertEqual(string, "Abc")
 
+    def test_case_conversion_range(self) -> None:
+        """Tests for the `lower`, `upper` and `capitalize` methods restricted to a range.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("abc def ghi", storage=storage)
+
+            with self.subTest(storage=storage):
+                string.upper(4, 7)
+                self.assertEqual(string, "abc DEF ghi")
+
+            with self.subTest(storage=storage):
+                string.upper(-3)
+                string.lower(None, 5)
+                self.assertEqual(string, "abc dEF GHI")
+
+            with self.subTest(storage=storage):
+                string.capitalize(4, 7)
+                string.capitalize(9, 4)
+                self.assertEqual(string, "abc Def GHI")
+
+    def test_dirty_ranges(self) -> None:
+        """Tests for the `checkpoint`, `dirty_ranges`, `subscribe` and `unsubscribe`
+        methods.
+        """
+        string = MutableString("key_1 = 1\nkey_2 = 2\n")
+        edits = []
+
+        def callback(start: int, stop: int, new_stop: int) -> None:
+            edits.append((start, stop, new_stop))
+
+        with self.subTest():
+            self.assertEqual(string.dirty_ranges(), [(0, 20)])
+
+        with self.subTest():
+            string.checkpoint()
+            string.subscribe(callback)
+            string[8:9] = "10"
+            string.upper(0, 3)
+            string.delete(11, 16)
+            self.assertEqual(string.dirty_ranges(), [(0, 3), (8, 10), (11, 11)])
+
+        with self.subTest():
+            self.assertEqual(edits, [(8, 9, 10), (0, 3, 3), (11, 16, 11)])
+
+        with self.subTest():
+            string.unsubscribe(callback)
+            string.checkpoint()
+            string.append("key_3 = 3")
+            self.assertEqual((string.dirty_ranges(), len(edits)), ([(16, 25)], 3))
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                string.unsubscribe(print)
+
+        with self.subTest():
+            string = MutableString("a" + "-" * 100_000 + "a")
+            string.checkpoint()
+            string.subscribe(callback)
+            string.sub("a", "bb")
+            self.assertEqual(string.dirty_ranges(), [(0, 2), (100_002, 100_004)])
+            self.assertEqual(edits[-2:], [(0, 1, 2), (100_002, 100_003, 100_004)])
+
     def test_equal(self) -> None:
         """Tests for the rich comparison `__eq__` method.
         """
@@ -58,6 +207,100 @@ class MutableStringTestSuite(unittest.TestCase):
         with self.subTest():
             self.assertFalse(string == "acc")
 
+    def test_copy(self) -> None:
+        """Tests for the `copy` method.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("abc def", storage=storage)
+            copy = string.copy()
+            copy[0] = "A"
+            string.upper()
+
+            with self.subTest(storage=storage):
+                self.assertEqual((string, copy), ("ABC DEF", "Abc def"))
+
+        for storage in STORAGE_TYPES:
+            for function in (copy_module.copy, copy_module.deepcopy):
+                string = MutableString("abc def", storage=storage)
+                copy = function(string)
+                copy[0] = "X"
+
+                with self.subTest(storage=storage, function=function.__name__):
+                    self.assertEqual((string, copy), ("abc def", "Xbc def"))
+
+    def test_count(self) -> None:
+        """Tests for the `count` method.
+        """
+        string = MutableString("aaaa ab aa")
+
+        with self.subTest():
+            self.assertEqual(string.count("aa"), 3)
+
+        with self.subTest():
+            self.assertEqual(string.count("a", 2, -1), 4)
+
+        string.use_search_index()
+        with self.subTest():
+            self.assertEqual(string.count("aa"), 3)
+
+        with self.subTest():
+            self.assertEqual(string.count("a", 2, -1), 4)
+
+        with self.subTest():
+            self.assertEqual(string.count(""), 11)
+
+    def test_delete(self) -> None:
+        """Tests for the `delete` method.
+        """
+        string = MutableString("abc def ghi")
+
+        with self.subTest():
+            string.delete(3, 7)
+            self.assertEqual(string, "abc ghi")
+
+        with self.subTest():
+            string.delete(-2)
+            self.assertEqual(string, "abc g")
+
+        with self.subTest():
+            string.delete(end=1)
+            self.assertEqual(string, "bc g")
+
+        with self.subTest():
+            string.delete(3, 1)
+            self.assertEqual(string, "bc g")
+
+    def test_diff(self) -> None:
+        """Tests for the `diff` and `apply_diff` methods.
+        """
+        old = "".join(f"key_{index} = value\n" for index in range(1000))
+        new = old.replace("key_10 =", "KEY_10 :=").replace("key_999", "last")
+        for storage in STORAGE_TYPES:
+            string = MutableString(old, storage)
+            string.use_journal()
+            hunks = string.diff(MutableString(new))
+
+            with self.subTest(storage=storage):
+                self.assertEqual(hunks, [(140, 143, "KEY"), (147, 147, ":"),
+                                         (len(old) - 16, len(old) - 9, "last")])
+
+            with self.subTest(storage=storage):
+                string.checkpoint()
+                string.apply_diff(hunks)
+                self.assertEqual(string.to_string(), new)
+                self.assertEqual(string.dirty_ranges(), [(140, 143), (147, 148),
+                                                         (len(old) - 15, len(old) - 11)])
+
+            with self.subTest(storage=storage):
+                string.undo()
+                self.assertEqual(string.to_string(), old)
+
+        with self.assertRaises(RuntimeError):
+            MutableString("abc").diff(1)  # type: ignore
+
+        with self.assertRaises(RuntimeError):
+            MutableString("abc").apply_diff([(2, 3, "C"), (0, 1, "A")])
+
     def test_empty_string(self) -> None:
         """Tests for the empty string.
         """
@@ -73,6 +316,77 @@ class MutableStringTestSuite(unittest.TestCase):
         with self.subTest():
             self.assertEqual(string.find("ci"), -1)
 
+    def test_find_all(self) -> None:
+        """Tests for the `find_all` method.
+        """
+        string = MutableString("aaaa ab aa")
+
+        with self.subTest():
+            self.assertEqual(string.find_all("aa"), [0, 1, 2, 8])
+
+        with self.subTest():
+            self.assertEqual(string.find_all("a", -5), [5, 8, 9])
+
+        with self.assertRaises(RuntimeError):
+            string.find_all("")
+
+    def test_finditer(self) -> None:
+        """Tests for the `finditer` method.
+        """
+        string = MutableString("key_1 = 1, key_22 = 22")
+
+        with self.subTest():
+            matches = string.finditer(r"(\w+) = (\d+)")
+            self.assertEqual([match.groups() for match in matches],
+                             [("key_1", "1"), ("key_22", "22")])
+
+        with self.subTest():
+            matches = string.finditer(r"\d+", 5, -3)
+            self.assertEqual([match.span() for match in matches], [(8, 9), (15, 17)])
+
+    def test_find_many(self) -> None:
+        """Tests for the `find_many` method.
+        """
+        string = MutableString("key_1 = 1, key_2 = 2")
+
+        with self.subTest():
+            self.assertEqual(string.find_many(["key", "=", "1"]),
+                             [(0, "key"), (4, "1"), (6, "="), (8, "1"), (11, "key"),
+                              (17, "=")])
+
+        with self.subTest():
+            self.assertEqual(string.find_many(PatternMatcher(["key"]), 1), [(11, "key")])
+
+    def test_from_file(self) -> None:
+        """Tests for the `from_file` and `readinto` methods.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "input_deck.txt"
+        content = "key_1 = value\r\nkey_2 = Straße\n" * 5
+        path.write_bytes(content.encode("utf-8"))
+
+        for storage in STORAGE_TYPES:
+            with self.subTest(storage=storage):
+                string = MutableString.from_file(path, 4, storage)
+                self.assertEqual(string, content)
+
+        with self.subTest():
+            string = MutableString("# deck\n")
+            string.use_journal()
+            self.assertEqual(string.readinto(io.StringIO(content), 3), len(content))
+            self.assertEqual(string, "# deck\n" + content)
+            self.assertTrue(string.undo())
+            self.assertEqual(string, "# deck\n")
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                MutableString().readinto(io.BytesIO(b"key"))
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                MutableString().readinto(io.StringIO(content), 0)
+
     def test_get_item_int(self) -> None:
         """Tests for the `__getitem__` method, with `int` input.
         """
@@ -110,6 +424,32 @@ class MutableStringTestSuite(unittest.TestCase):
         with self.subTest():
             self.assertEqual(string[1:6:2], "bdf")
 
+        with self.subTest():
+            self.assertEqual(string[::-2], "fdb")
+
+        with self.subTest():
+            self.assertEqual(string[4:2], "")
+
+    def test_insert(self) -> None:
+        """Tests for the `insert` method.
+        """
+        string = MutableString("ac")
+
+        with self.subTest():
+            string.insert(1, "b")
+            self.assertEqual(string, "abc")
+
+        with self.subTest():
+            string.insert(-1, "--")
+            self.assertEqual(string, "ab--c")
+
+        with self.subTest():
+            string.insert(10, "d")
+            self.assertEqual(string, "ab--cd")
+
+        with self.assertRaises(RuntimeError):
+            string.insert(0, 1)  # type: ignore[arg-type]
+
     def test_iterable(self) -> None:
         """Tests for the `__hash__` method.
         """
@@ -125,6 +465,79 @@ class MutableStringTestSuite(unittest.TestCase):
                 self.assertEqual(item, expected_values[count])
             count += 1
 
+    def test_iter_lines(self) -> None:
+        """Tests for the `iter_lines` method.
+        """
+        string = MutableString("first\nsecond\r\n\nlast")
+        lines = string.iter_lines()
+
+        with self.subTest():
+            self.assertEqual(next(lines), "first")
+
+        with self.subTest():
+            self.assertEqual(list(lines), ["second", "", "last"])
+
+        with self.subTest():
+            self.assertEqual(list(string.iter_lines(keepends=True)),
+                             ["first\n", "second\r\n", "\n", "last"])
+
+        with self.subTest():
+            self.assertEqual(list(MutableString("a\n").iter_lines()), ["a"])
+
+    def test_iter_split(self) -> None:
+        """Tests for the `iter_split` method.
+        """
+        string = MutableString("This is a separated.string")
+
+        with self.subTest():
+            self.assertEqual(next(string.iter_split(" ")), "This")
+
+        with self.subTest():
+            self.assertEqual(list(string.iter_split(" ", 2)),
+                             ["This", "is", "a separated.string"])
+
+        with self.subTest():
+            self.assertEqual(list(string.iter_split()),
+                             ["This", "is", "a", "separated.string"])
+
+    def test_len(self) -> None:
+        """Tests for the `__len__` method.
+        """
+        with self.subTest():
+            self.assertEqual(len(MutableString()), 0)
+
+        with self.subTest():
+            self.assertEqual(len(MutableString("abc")), 3)
+
+    def test_line_column(self) -> None:
+        """Tests for the `line_column` and `line_offset` methods.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("key_1 = 1\nkey_2 = 2\n", storage=storage)
+
+            with self.subTest(storage=storage):
+                self.assertEqual((string.line_column(14), string.line_offset(1)),
+                                 ((1, 4), 10))
+
+            with self.subTest(storage=storage):
+                string.insert(0, "# comment\n")
+                string[-2:] = "22\r\nkey_3 = 3"
+                self.assertEqual((string.line_column(24), string.line_column(32)),
+                                 ((2, 4), (3, 0)))
+
+            with self.subTest(storage=storage):
+                string.delete(0, 10)
+                self.assertEqual([string.line_offset(line) for line in range(3)],
+                                 [0, 10, 22])
+
+        with self.subTest():
+            with self.assertRaises(IndexError):
+                string.line_column(len(string) + 1)
+
+        with self.subTest():
+            with self.assertRaises(IndexError):
+                string.line_offset(3)
+
     def test_lower(self) -> None:
         """Tests for the `lower` method.
         """
@@ -146,6 +559,64 @@ class MutableStringTestSuite(unittest.TestCase):
         """
         self.assertEqual(MutableString("ABC") * 3, "ABCABCABC")
 
+    def test_pickle(self) -> None:
+        """Tests that only the content of a `MutableString` is pickled.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("key = value\n" * 100, storage)
+            string.use_journal()
+            string.subscribe(lambda start, stop, new_stop: None)
+            string.upper(0, 3)
+            string.line_column(10)
+            unpickled = pickle.loads(pickle.dumps(string))
+
+            with self.subTest(storage=storage):
+                self.assertIs(type(unpickled), MutableString)
+                self.assertEqual(unpickled, string.to_string())
+                self.assertFalse(unpickled.undo())
+
+    def test_range_equals(self) -> None:
+        """Tests for the `range_equals` method.
+        """
+        string = MutableString("key = value\nkey = other")
+        other = MutableString("# key = value", storage="rope")
+
+        with self.subTest():
+            self.assertTrue(string.range_equals(other, 0, 11, 2))
+
+        with self.subTest():
+            self.assertTrue(string.range_equals(string, 0, 6, 12))
+
+        with self.subTest():
+            self.assertFalse(string.range_equals(other, 0, 12, 2))
+
+        with self.subTest():
+            other[-5:] = "other"
+            self.assertTrue(string.range_equals(other, -11, None, -11))
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                string.range_equals("key")  # type: ignore[arg-type]
+
+    def test_range_hash(self) -> None:
+        """Tests for the `range_hash` method and for the cached hash.
+        """
+        string = MutableString("abc abc")
+
+        with self.subTest():
+            self.assertEqual(string.range_hash(0, 3), string.range_hash(-3))
+
+        with self.subTest():
+            string[4] = "A"
+            self.assertNotEqual(string.range_hash(0, 3), string.range_hash(-3))
+
+        with self.subTest():
+            self.assertEqual(hash(string), hash("abc Abc"))
+
+        with self.subTest():
+            string.upper()
+            self.assertEqual(hash(string), hash("ABC ABC"))
+
     def test_rstrip(self) -> None:
         """Tests for the `rstrip` method.
         """
@@ -154,6 +625,50 @@ class MutableStringTestSuite(unittest.TestCase):
 
         self.assertEqual(string, "  ABC")
 
+    def test_strip(self) -> None:
+        """Tests for the `strip` method.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString(" \n ABC \t ", storage=storage)
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.strip(), (3, 6))
+                self.assertEqual(string, "ABC")
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.strip("AC"), (1, 2))
+                self.assertEqual(string, "B")
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.strip("B"), (1, 1))
+                self.assertEqual(string, "")
+
+        with self.subTest():
+            string = MutableString("x" * 10_000 + "a" + "x" * 10_000)
+            self.assertEqual(string.strip("x"), (10_000, 10_001))
+
+        with self.subTest():
+            string = MutableString("  ABC  ")
+            self.assertEqual((string.lstrip(), string.rstrip()), ((2, 7), (0, 3)))
+
+    def test_sub(self) -> None:
+        """Tests for the `sub` method.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("a = 1, b = 22, c = 333", storage=storage)
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.sub(r"(\w) = (\d+)", r"\2 = \1", 2), 2)
+                self.assertEqual(string, "1 = a, 22 = b, c = 333")
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.sub(r"\d+", lambda match: str(len(match[0]))), 3)
+                self.assertEqual(string, "1 = a, 2 = b, c = 3")
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.sub("x*", "-"), 20)
+                self.assertEqual(string, re.sub("x*", "-", "1 = a, 2 = b, c = 3"))
+
     def test_to_string_method(self) -> None:
         """Test for the `to_string` method.
         """
@@ -165,6 +680,26 @@ class MutableStringTestSuite(unittest.TestCase):
         with self.subTest():
             self.assertTrue(mutable_string.to_string(), "ABC")
 
+    def test_search(self) -> None:
+        """Tests for the `search` method.
+        """
+        string = MutableString("key_1 = Value")
+
+        with self.subTest():
+            self.assertEqual(string.search(r"\d").start(), 4)
+
+        with self.subTest():
+            self.assertIsNone(string.search("value"))
+
+        with self.subTest():
+            self.assertEqual(string.search("value", flags=re.IGNORECASE).span(), (8, 13))
+
+        with self.subTest():
+            self.assertIsNone(string.search(r"^key", 1))
+
+        with self.subTest():
+            self.assertIs(compile_regex(r"\d+"), compile_regex(r"\d+"))
+
     def test_set(self) -> None:
         """Tests for the `__setitem__` method.
         """
@@ -219,14 +754,49 @@ class MutableStringTestSuite(unittest.TestCase):
             string[:] = "123 456 789"
             self.assertEqual(string, "123 456 789")
 
-        with self.assertRaises(RuntimeError):
+        with self.subTest():
+            string[1:5] = "1"
+            self.assertEqual(string, "1156 789")
+
+        with self.subTest():
+            string[5:5] = "0"
+            self.assertEqual(string, "1156 0789")
+
+        with self.subTest():
             string[13:14] = "D"
+            self.assertEqual(string, "1156 0789D")
 
         with self.assertRaises(RuntimeError):
             string[0:4:2] = "123"
 
-        with self.assertRaises(RuntimeError):
-            string[1:5] = "123"
+    def test_snapshot(self) -> None:
+        """Tests for the `snapshot` and `restore` methods.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("abc def " * 500, storage=storage)
+            snapshot = string.snapshot()
+            string[4:7] = "ghi jkl"
+            string.delete(0, 100)
+            edited = string.to_string()
+
+            with self.subTest(storage=storage):
+                self.assertEqual(snapshot, "abc def " * 500)
+
+            with self.subTest(storage=storage):
+                string.restore(snapshot)
+                self.assertEqual(string, "abc def " * 500)
+
+            with self.subTest(storage=storage):
+                string.insert(0, ">")
+                string.restore(snapshot)
+                self.assertEqual((string, len(snapshot)), ("abc def " * 500, 4000))
+
+            with self.subTest(storage=storage):
+                self.assertNotEqual(edited, string)
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                string.restore("abc def")  # type: ignore[arg-type]
 
     def test_split(self) -> None:
         """Tests for the `split` method.
@@ -245,6 +815,144 @@ class MutableStringTestSuite(unittest.TestCase):
         with self.subTest():
             self.assertEqual(string.split(), ["This", "is", "a", "separated.string"])
 
+    def test_storage(self) -> None:
+        """Tests for the `storage` option of the initializer.
+        """
+        string = MutableString("abc def", storage="array")
+
+        with self.subTest():
+            string[0] = "1"
+            string[4:7] = "DEF"
+            self.assertEqual(string, "1bc DEF")
+
+        with self.subTest():
+            string[-1] = "€"
+            self.assertEqual(string.to_string(), "1bc DE€")
+
+        with self.subTest():
+            string.upper()
+            self.assertEqual(string[1:3], "BC")
+
+        with self.subTest():
+            string = MutableString("abc def", storage="rope")
+            string[4:7] = "ghi jkl"
+            string.insert(0, ">")
+            string.delete(4, 5)
+            self.assertEqual(string, ">abcghi jkl")
+
+        with self.subTest():
+            string = MutableString("abc", storage="gap")
+            for index, character in enumerate("def"):
+                string.insert(3 + index, character)
+            self.assertEqual(string, "abcdef")
+
+        with self.assertRaises(RuntimeError):
+            MutableString("abc", storage="unknown")
+
+    def test_use_search_index(self) -> None:
+        """Tests for the `use_search_index` method.
+        """
+        string = MutableString("first string")
+        string.use_search_index()
+
+        with self.subTest():
+            self.assertEqual(string.find("in"), 9)
+
+        with self.subTest():
+            self.assertEqual(string.find("in", 0, -3), -1)
+
+        with self.subTest():
+            self.assertEqual(string.find_all("st"), [3, 6])
+
+        with self.subTest():
+            string[0:5] = "last"
+            self.assertEqual(string.find_all("st"), [2, 5])
+
+        with self.subTest():
+            string.use_search_index(False)
+            self.assertEqual(string.find("in"), 8)
+
+    def test_transform(self) -> None:
+        """Tests for the `transform` method, with several chunks and worker processes.
+        """
+        original_chunk_length = mutable_string.TRANSFORM_CHUNK_LENGTH
+        mutable_string.TRANSFORM_CHUNK_LENGTH = 8
+        self.addCleanup(setattr, mutable_string, "TRANSFORM_CHUNK_LENGTH",
+                        original_chunk_length)
+
+        content = "key_1 = value\nkey_2 = Straße\n\nlast line" * 5
+        for storage in STORAGE_TYPES:
+            for function in (str.upper, double_vowels):
+                for workers in (1, 3):
+                    with self.subTest(storage=storage, workers=workers):
+                        string = MutableString(content, storage)
+                        string.transform(function, workers)
+                        self.assertEqual(string.to_string(), function(content))
+
+        with self.subTest():
+            calls = []
+            MutableString(content).transform(lambda text: calls.append(text) or text, 1)
+            self.assertTrue(all(chunk.endswith("\n") for chunk in calls[:-1]))
+            self.assertEqual("".join(calls), content)
+
+        with self.subTest():
+            with MutableString(content).share() as string:
+                string.transform(str.lower, 2)
+                self.assertEqual(string.to_string(), content.lower())
+
+        with self.assertRaises(RuntimeError):
+            MutableString(content).transform("upper")  # type: ignore
+
+        with self.assertRaises(RuntimeError):
+            MutableString(content).transform(str.upper, separator="")
+
+    def test_undo_redo(self) -> None:
+        """Tests for the `undo` and `redo` methods.
+        """
+        for storage in STORAGE_TYPES:
+            string = MutableString("  First STRING  ", storage=storage)
+
+            with self.subTest(storage=storage):
+                self.assertFalse(string.undo())
+
+            string.use_journal()
+            string[2:7] = "1st"
+            string.capitalize()
+            string.lstrip()
+            string.rstrip()
+            string.insert(0, ">")
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string, ">1st string")
+
+            with self.subTest(storage=storage):
+                history = []
+                while string.undo():
+                    history.append(string.to_string())
+
+                self.assertEqual(history, ["1st string", "1st string  ", "  1st string  ",
+                                           "  1st STRING  ", "  First STRING  "])
+
+            with self.subTest(storage=storage):
+                self.assertTrue(string.redo())
+                self.assertTrue(string.redo())
+                self.assertEqual(string, "  1st string  ")
+
+            with self.subTest(storage=storage):
+                string.upper()
+                self.assertFalse(string.redo())
+                self.assertTrue(string.undo())
+                self.assertEqual(string, "  1st string  ")
+
+        with self.subTest():
+            content = "a" + "-" * 100_000 + "a"
+            string = MutableString(content)
+            string.use_journal()
+            string.sub("a", "b")
+            self.assertEqual(string._journal.size, 4)
+            self.assertTrue(string.undo())
+            self.assertEqual(string, content)
+
     def test_upper(self) -> None:
         """Tests for the `upper` method.
         """
@@ -252,3 +960,41 @@ class MutableStringTestSuite(unittest.TestCase):
         string.upper()
 
         self.assertEqual(string, "ABC")
+
+    def test_write_range(self) -> None:
+        """Tests for the `write_range` method.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "input_deck.txt"
+
+        for encoding in ("latin-1", "utf-8", "utf-16-le"):
+            path.write_bytes("key_1 = Straße\nkey_2 = value\n".encode(encoding))
+            string = MutableString.from_file(path, encoding=encoding)
+            string.checkpoint()
+            string.upper(0, 5)
+            string[23:28] = "VALUE"
+
+            with self.subTest(encoding=encoding):
+                with open(path, "r+b") as fileobj:
+                    for start, stop in string.dirty_ranges():
+                        self.assertEqual(string.write_range(fileobj, start, stop,
+                                                            encoding), stop - start)
+
+                self.assertEqual(path.read_bytes().decode(encoding), string)
+
+        with self.subTest():
+            with self.assertRaises(RuntimeError):
+                MutableString("key").write_range(io.StringIO())
+
+    def test_write_to(self) -> None:
+        """Tests for the `write_to` method.
+        """
+        content = "key_1 = value\nkey_2 = Straße\n" * 5
+        for storage in STORAGE_TYPES:
+            string = MutableString(content, storage)
+            fileobj = io.StringIO()
+
+            with self.subTest(storage=storage):
+                self.assertEqual(string.write_to(fileobj, 7), len(content))
+                self.assertEqual(fileobj.getvalue(), content)
@@ -0,0 +1,153 @@
+"""
+MutableStringArrayTestSuite
+---------------------------
+
+Tests for the `MutableStringArray` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import unittest
+
+# third party library imports
+import numpy as np
+
+# local library specific imports
+from ..mutable_string_array import MutableStringArray
+
+
+LABELS = ["Node_1", "ELEMENT", "straße", "", "ﬃx", "Tag 😀"]
+
+
+class MutableStringArrayTestSuite(unittest.TestCase):
+    """
+    Tests for the `MutableStringArray` class.
+    """
+    def test_find(self) -> None:
+        """Tests for the `find` method.
+        """
+        strings = MutableStringArray(LABELS)
+        for substr in ("E", "e", "", "ß", "😀", "missing"):
+            for start, end in ((None, None), (1, None), (1, 4), (-3, None), (7, None)):
+                with self.subTest(substr=substr, start=start, end=end):
+                    self.assertEqual(strings.find(substr, start, end).tolist(),
+                                     [label.find(substr, start, end) for label in LABELS])
+
+        with self.assertRaises(RuntimeError):
+            strings.find(1)  # type: ignore
+
+    def test_get_item(self) -> None:
+        """Tests for the `__getitem__` method.
+        """
+        strings = MutableStringArray(LABELS)
+
+        with self.subTest():
+            self.assertEqual([strings[index] for index in range(len(strings))], LABELS)
+
+        with self.subTest():
+            self.assertEqual(strings[1:3].to_list(), LABELS[1:3])
+
+        with self.subTest():
+            mask = np.array([True, False, True, False, False, True])
+            self.assertEqual(strings[mask].to_list(), [LABELS[0], LABELS[2], LABELS[5]])
+
+    def test_init(self) -> None:
+        """Tests for the `__init__` method.
+        """
+        with self.subTest():
+            self.assertEqual(MutableStringArray(LABELS).to_list(), LABELS)
+
+        with self.subTest():
+            self.assertEqual(len(MutableStringArray()), 0)
+
+        with self.subTest():
+            strings = MutableStringArray(LABELS)
+            self.assertEqual(MutableStringArray(strings).to_list(), LABELS)
+
+        with self.assertRaises(RuntimeError):
+            MutableStringArray(["a", 1])  # type: ignore
+
+    def test_lower_upper(self) -> None:
+        """Tests for the `lower` and `upper` methods.
+        """
+        for method in ("lower", "upper"):
+            with self.subTest(method=method):
+                strings = MutableStringArray(LABELS)
+                getattr(strings, method)()
+                self.assertEqual(strings.to_list(),
+                                 [getattr(label, method)() for label in LABELS])
+
+            with self.subTest(method=method):
+                labels = ["Node", "ELEM", "x_1"] * 3
+                strings = MutableStringArray(labels)
+                getattr(strings, method)()
+                self.assertEqual(strings.to_list(),
+                                 [getattr(label, method)() for label in labels])
+
+    def test_masked_conversion(self) -> None:
+        """Tests for the `lower` and `upper` methods applied to the masked strings only.
+        """
+        mask = np.array([False, True, True, False, True, False])
+        strings = MutableStringArray(LABELS)
+        strings.upper(mask)
+
+        with self.subTest():
+            self.assertEqual(strings.to_list(),
+                             [label.upper() if selected else label
+                              for label, selected in zip(LABELS, mask)])
+
+        with self.subTest():
+            strings = MutableStringArray(LABELS)
+            strings.lower(slice(None, None, 2))
+            self.assertEqual(strings.to_list(),
+                             [label.lower() if index % 2 == 0 else label
+                              for index, label in enumerate(LABELS)])
+
+    def test_set_item(self) -> None:
+        """Tests for the `__setitem__` method, widening the array if needed.
+        """
+        strings = MutableStringArray(["a", "b", "c", "d"])
+
+        with self.subTest():
+            strings[1] = "a much longer label"
+            self.assertEqual(strings.to_list(), ["a", "a much longer label", "c", "d"])
+
+        with self.subTest():
+            strings[::2] = ["x", "y"]
+            self.assertEqual(strings.to_list(), ["x", "a much longer label", "y", "d"])
+
+        with self.subTest():
+            strings[strings.find("y") == 0] = "z"
+            self.assertEqual(strings.to_list(), ["x", "a much longer label", "z", "d"])
+
+        with self.subTest():
+            strings[np.array([0, 3])] = "€"
+            self.assertEqual(strings.to_list(), ["€", "a much longer label", "z", "€"])
+
+        with self.assertRaises(RuntimeError):
+            strings[0:2] = ["a", None]  # type: ignore
+
+    def test_width(self) -> None:
+        """Tests for the `width` property.
+        """
+        strings = MutableStringArray(["ab", "c"])
+
+        with self.subTest():
+            self.assertEqual(strings.width, 2)
+
+        with self.subTest():
+            strings[1] = "cdef"
+            self.assertEqual(strings.width, 4)
+
+        with self.subTest():
+            strings[1] = ""
+            self.assertEqual(strings.width, 4)
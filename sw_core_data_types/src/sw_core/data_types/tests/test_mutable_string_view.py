@@ -0,0 +1,205 @@
+"""
+MutableStringViewTestSuite
+--------------------------
+
+Tests for the `MutableStringView` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from .. import mutable_string
+from ..mutable_string import STORAGE_TYPES, MutableString
+
+
+class MutableStringViewTestSuite(unittest.TestCase):
+    """
+    Tests for the `MutableStringView` class.
+    """
+    def test_edits_of_the_owner(self) -> None:
+        """Tests that the view reflects the edits of its `MutableString`.
+        """
+        string = MutableString("abc def")
+        view = string.view(4)
+
+        with self.subTest():
+            string[4:7] = "DEF"
+            self.assertEqual(view, "DEF")
+
+        with self.subTest():
+            string.delete(5)
+            self.assertEqual(view, "D")
+
+    def test_equal(self) -> None:
+        """Tests for the rich comparison `__eq__` method.
+        """
+        string = MutableString("abc abc")
+
+        with self.subTest():
+            self.assertTrue(string.view(0, 3) == "abc")
+
+        with self.subTest():
+            self.assertTrue(string.view(0, 3) == string.view(4))
+
+        with self.subTest():
+            self.assertTrue(MutableString("abc") == string.view(4))
+
+        with self.subTest():
+            self.assertFalse(string.view(0, 3) == "ab")
+
+        with self.subTest():
+            self.assertFalse(string.view(0, 3) == "abd")
+
+    def test_find(self) -> None:
+        """Tests for the `find` method.
+        """
+        view = MutableString("in first string").view(3, 8)
+
+        with self.subTest():
+            self.assertEqual(view.find("rst"), 2)
+
+        with self.subTest():
+            self.assertEqual(view.find("in"), -1)
+
+        with self.subTest():
+            self.assertEqual(view.find("r", 2), 2)
+
+        with self.subTest():
+            self.assertEqual(view.find("st", 0, -1), -1)
+
+        with self.subTest():
+            self.assertEqual((view.find("", 5), view.find("", 6)), (5, -1))
+
+        with self.subTest():
+            self.assertEqual(MutableString("").view().find("", 4), -1)
+
+    def test_get_item(self) -> None:
+        """Tests for the `__getitem__` method.
+        """
+        view = MutableString("abcdef").view(1, 5)
+
+        with self.subTest():
+            self.assertEqual(view[0], "b")
+
+        with self.subTest():
+            self.assertEqual(view[-1], "e")
+
+        with self.subTest():
+            self.assertEqual(view[1:3], "cd")
+
+        for storage in STORAGE_TYPES:
+            view = MutableString("abcdef", storage).view(1, 5)
+            with self.subTest(storage=storage):
+                self.assertEqual((view[3], view[-4], view[-3:], view[1:], view[::-2]),
+                                 ("e", "b", "cde", "cde", "ec"))
+
+            with self.subTest(storage=storage):
+                with self.assertRaises(IndexError):
+                    view[4]
+
+            with self.subTest(storage=storage):
+                with self.assertRaises(TypeError):
+                    view["a"]
+
+    def test_iter_lines(self) -> None:
+        """Tests for the `iter_lines` method.
+        """
+        view = MutableString("first\nsecond\nthird").view(6)
+
+        self.assertEqual(list(view.iter_lines()), ["second", "third"])
+
+    def test_iter_chunks(self) -> None:
+        """Tests that `iter_lines` and `iter_split` read the content one chunk at a time,
+        with lines, line breaks and words across the chunks.
+        """
+        original = mutable_string.ITER_CHUNK_LENGTH
+        self.addCleanup(setattr, mutable_string, "ITER_CHUNK_LENGTH", original)
+
+        generator = random.Random(0)
+        for chunk_length in (1, 2, 3, 7, 64):
+            mutable_string.ITER_CHUNK_LENGTH = chunk_length
+            for storage in STORAGE_TYPES:
+                pieces = ["a", "bc", " ", "  ", "\n", "\r", "\r\n"]
+                text = "".join(generator.choice(pieces) for _ in range(60))
+                view = MutableString(text, storage).view(2)
+                expected = text[2:]
+                with self.subTest(chunk_length=chunk_length, storage=storage):
+                    self.assertEqual(list(view.iter_lines()), expected.splitlines())
+                    self.assertEqual(list(view.iter_lines(True)),
+                                     expected.splitlines(True))
+                    self.assertEqual(list(view.iter_split()), expected.split())
+                    self.assertEqual(list(view.iter_split(None, 3)),
+                                     expected.split(None, 3))
+
+        with self.subTest():
+            string = MutableString("first line\nsecond line", "array")
+            list(string.iter_lines())
+            list(string.iter_split())
+            self.assertIsNone(string._storage._string)
+
+    def test_len(self) -> None:
+        """Tests for the `__len__` method.
+        """
+        string = MutableString("abcdef")
+
+        with self.subTest():
+            self.assertEqual(len(string.view(1, 4)), 3)
+
+        with self.subTest():
+            self.assertEqual(len(string.view(-2)), 2)
+
+        with self.subTest():
+            self.assertEqual(len(string.view(4, 2)), 0)
+
+    def test_split(self) -> None:
+        """Tests for the `split` method.
+        """
+        view = MutableString("> This is a  separated.string <").view(2, -2)
+
+        with self.subTest():
+            self.assertEqual(view.split(" "), ["This", "is", "a", "", "separated.string"])
+
+        with self.subTest():
+            self.assertEqual(view.split(), ["This", "is", "a", "separated.string"])
+
+        with self.subTest():
+            self.assertEqual(view.split(None, 2), ["This", "is", "a  separated.string"])
+
+        with self.subTest():
+            self.assertEqual(view.split(".", 0), ["This is a  separated.string"])
+
+        with self.assertRaises(ValueError):
+            view.split("")
+
+    def test_storages(self) -> None:
+        """Tests the views on the content of all the storage engines.
+        """
+        for storage in ["array", "gap", "rope", "str"]:
+            view = MutableString("key = value", storage=storage).view(6)
+            with self.subTest(storage=storage):
+                self.assertEqual(view.to_string(), "value")
+
+    def test_to_string(self) -> None:
+        """Test for the `to_string` method.
+        """
+        view = MutableString("abcdef").view(1, 3)
+
+        with self.subTest():
+            self.assertTrue(isinstance(view.to_string(), str))
+
+        with self.subTest():
+            self.assertEqual(view.to_string(), "bc")
@@ -0,0 +1,80 @@
+"""
+MyersDiffTestSuite
+------------------
+
+Tests for the `diff` function.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import difflib
+import random
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..myers_diff import Hunk, diff
+
+
+def apply(old: str, hunks: list[Hunk]) -> str:
+    """Return `old` with the `hunks` applied.
+    """
+    pieces = []
+    previous_stop = 0
+    for start, stop, replacement in hunks:
+        pieces.append(old[previous_stop:start])
+        pieces.append(replacement)
+        previous_stop = stop
+
+    pieces.append(old[previous_stop:])
+    return "".join(pieces)
+
+
+class MyersDiffTestSuite(unittest.TestCase):
+    """
+    Tests for the `diff` function.
+    """
+    def test_diff(self) -> None:
+        """Tests for the `diff` function.
+        """
+        for old, new, expected in (("abc", "abc", []),
+                                   ("", "abc", [(0, 0, "abc")]),
+                                   ("abc", "", [(0, 3, "")]),
+                                   ("key = value", "key = VALUE", [(6, 11, "VALUE")]),
+                                   ("abcabba", "cbabac", [(0, 2, ""), (3, 3, "b"),
+                                                          (5, 6, ""), (7, 7, "c")])):
+            with self.subTest(old=old, new=new):
+                self.assertEqual(diff(old, new), expected)
+
+    def test_max_distance(self) -> None:
+        """Tests that a single hunk replaces the changed range beyond `max_distance`.
+        """
+        self.assertEqual(diff("xabcx", "xcbax", 2), [(1, 4, "cba")])
+
+    def test_shortest(self) -> None:
+        """Tests that the hunks of random texts turn the old one into the new one, and
+        that they are the shortest edit script.
+        """
+        generator = random.Random(0)
+        for _ in range(300):
+            old = "".join(generator.choice("abc") for _ in range(generator.randrange(30)))
+            new = "".join(generator.choice("abc") for _ in range(generator.randrange(30)))
+            hunks = diff(old, new)
+
+            matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+            common = sum(block.size for block in matcher.get_matching_blocks())
+            with self.subTest(old=old, new=new):
+                self.assertEqual(apply(old, hunks), new)
+                self.assertLessEqual(sum(stop - start + len(replacement)
+                                         for start, stop, replacement in hunks),
+                                     len(old) + len(new) - 2 * common)
@@ -0,0 +1,81 @@
+"""
+PatternMatcherTestSuite
+-----------------------
+
+Tests for the `PatternMatcher` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..pattern_matcher import PatternMatcher, compile_patterns
+
+
+class PatternMatcherTestSuite(unittest.TestCase):
+    """
+    Tests for the `PatternMatcher` class.
+    """
+    def test_compile_patterns(self) -> None:
+        """Tests that `compile_patterns` reuses the compiled matchers.
+        """
+        self.assertIs(compile_patterns(("a", "b")), compile_patterns(("a", "b")))
+
+    def test_find_all(self) -> None:
+        """Tests for the `find_all` method.
+        """
+        matcher = PatternMatcher(["he", "she", "his", "hers", "he"])
+
+        with self.subTest():
+            self.assertEqual(matcher.patterns, ("he", "she", "his", "hers"))
+
+        with self.subTest():
+            self.assertEqual(matcher.find_all("ushers"),
+                             [(1, "she"), (2, "he"), (2, "hers")])
+
+        with self.subTest():
+            self.assertEqual(matcher.find_all("ushers", 2), [(2, "he"), (2, "hers")])
+
+        with self.subTest():
+            self.assertEqual(matcher.find_all("ushers", 0, -1), [(1, "she"), (2, "he")])
+
+        with self.subTest():
+            self.assertEqual(matcher.find_all(""), [])
+
+    def test_invalid_patterns(self) -> None:
+        """Tests that the patterns must be non-empty strings.
+        """
+        with self.assertRaises(RuntimeError):
+            PatternMatcher(["a", ""])
+
+        with self.assertRaises(RuntimeError):
+            PatternMatcher(["a", 1])  # type: ignore[list-item]
+
+    def test_random_texts(self) -> None:
+        """Tests that the occurrences match the ones found by `str.startswith`.
+        """
+        generator = random.Random(0)
+        patterns = ["a", "ab", "bab", "abab", "bb", "ba\nb", "\n"]
+        matcher = PatternMatcher(patterns)
+        for _ in range(50):
+            length = generator.randrange(300)
+            text = "".join(generator.choice("ab\n") for _ in range(length))
+            expected = sorted(((index, pattern) for pattern in patterns
+                               for index in range(len(text))
+                               if text.startswith(pattern, index)),
+                              key=lambda occurrence: (occurrence[0], len(occurrence[1])))
+            with self.subTest(text=text):
+                self.assertEqual(matcher.find_all(text), expected)
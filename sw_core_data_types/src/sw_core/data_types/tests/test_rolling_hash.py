@@ -0,0 +1,67 @@
+"""
+RollingHashTestSuite
+--------------------
+
+Tests for the `RollingHash` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..rolling_hash import RollingHash
+
+
+class RollingHashTestSuite(unittest.TestCase):
+    """
+    Tests for the `RollingHash` class.
+    """
+    def test_range_hash(self) -> None:
+        """Tests for the `range_hash` method.
+        """
+        text = "abcabc\0é😀abc\0é😀"
+        rolling_hash = RollingHash(text)
+
+        with self.subTest():
+            self.assertEqual(rolling_hash.range_hash(0, 3), rolling_hash.range_hash(3, 6))
+
+        with self.subTest():
+            self.assertEqual(rolling_hash.range_hash(3, 9),
+                             RollingHash("abc\0é😀").range_hash(0, 6))
+
+        with self.subTest():
+            self.assertNotEqual(rolling_hash.range_hash(5, 6),
+                                rolling_hash.range_hash(5, 7))
+
+        with self.subTest():
+            self.assertEqual(rolling_hash.range_hash(4, 4), 0)
+
+    def test_distinct_substrings(self) -> None:
+        """Tests that the substrings have the same fingerprint if and only if they are
+        equal.
+        """
+        generator = random.Random(0)
+        text = "".join(generator.choice("ab") for _ in range(2000))
+        rolling_hash = RollingHash(text)
+
+        pairs = {(text[start:stop], rolling_hash.range_hash(start, stop))
+                 for start in range(0, 1900, 3) for stop in (start + 3, start + 50)}
+
+        with self.subTest():
+            self.assertEqual(len({substring for substring, _ in pairs}), len(pairs))
+
+        with self.subTest():
+            self.assertEqual(len({fingerprint for _, fingerprint in pairs}), len(pairs))
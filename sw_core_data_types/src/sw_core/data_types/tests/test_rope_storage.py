@@ -0,0 +1,98 @@
+"""
+RopeStorageTestSuite
+--------------------
+
+Tests for the `RopeStorage` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+
+# third party library imports
+
+# local library specific imports
+from . import test_string_storage
+from .. import rope_storage
+from ..rope_storage import RopeStorage
+
+
+class RopeStorageTestSuite(test_string_storage.StrStorageTestSuite):
+    """
+    Tests for the `RopeStorage` class.
+    """
+    storage_type = RopeStorage
+
+    def assert_balanced(self, rope: object) -> None:
+        """Check the heights, the lengths and the balance of all the nodes of `rope`.
+        """
+        if not isinstance(rope, rope_storage._Node):
+            return
+
+        self.assertEqual(rope.height, max(rope.left.height, rope.right.height) + 1)
+        self.assertEqual(rope.length, rope.left.length + rope.right.length)
+        self.assertLessEqual(abs(rope.left.height - rope.right.height), 1)
+        self.assert_balanced(rope.left)
+        self.assert_balanced(rope.right)
+
+    def test_build(self) -> None:
+        """Tests that a long content is split in balanced leaves.
+        """
+        string = "abcdefghij" * 1000
+        storage = RopeStorage(string)
+
+        with self.subTest():
+            self.assertEqual(storage.to_string(), string)
+
+        with self.subTest():
+            self.assert_balanced(storage._rope)
+
+        with self.subTest():
+            self.assertTrue(all(len(leaf) <= rope_storage.MAX_LEAF_LENGTH
+                                for leaf in rope_storage.leaves(storage._rope)))
+
+    def test_random_edits(self) -> None:
+        """Tests that random edits of any length match the `str` equivalent and that the
+        rope stays balanced.
+        """
+        generator = random.Random(0)
+        expected = "".join(generator.choice("abc\n") for _ in range(20000))
+        storage = RopeStorage(expected)
+
+        for _ in range(500):
+            start = generator.randrange(len(expected) + 1)
+            stop = min(len(expected), start + generator.randrange(50))
+            value = "x" * generator.randrange(3000)
+            storage.replace(start, stop, value)
+            expected = expected[:start] + value + expected[stop:]
+
+        with self.subTest():
+            self.assertEqual(storage.to_string(), expected)
+
+        with self.subTest():
+            self.assertEqual(storage.get_range(100, 5000), expected[100:5000])
+
+        with self.subTest():
+            self.assertEqual(storage.get_item(12345), expected[12345])
+
+        with self.subTest():
+            self.assert_balanced(storage._rope)
+
+    def test_shared_nodes(self) -> None:
+        """Tests that an edit does not change the nodes of the previous rope.
+        """
+        string = "abcdefghij" * 1000
+        storage = RopeStorage(string)
+        previous = storage._rope
+        storage.replace(10, 20, "")
+
+        self.assertEqual("".join(rope_storage.leaves(previous)), string)
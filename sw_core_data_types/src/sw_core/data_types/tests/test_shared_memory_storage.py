@@ -0,0 +1,280 @@
+"""
+SharedMemoryStorageTestSuite
+----------------------------
+
+Tests for the `SharedMemoryStorage` class and for the `MutableString` objects in shared
+memory.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import gc
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+# third party library imports
+
+# local library specific imports
+from .. import shared_memory_storage
+from ..mutable_string import MutableString
+from ..shared_memory_storage import SharedMemoryStorage
+
+
+def upper_range(name: str, start: int, end: int) -> str:
+    """Convert to uppercase the range [`start`, `end`) of the shared `MutableString`
+    `name` and return the whole content, as seen by a worker process.
+    """
+    with MutableString.attach(name, "r+", start, end) as string:
+        string.upper(start, end)
+        return string.to_string()
+
+
+class SharedMemoryStorageTestSuite(unittest.TestCase):
+    """
+    Tests for the `SharedMemoryStorage` class.
+    """
+    def test_attach(self) -> None:
+        """Tests for the `attach` method.
+        """
+        for content in ("key = value", "key = €", "key = 😀", ""):
+            with MutableString(content).share() as string:
+                with MutableString.attach(string.shared_memory_name) as attached:
+                    with self.subTest(content=content):
+                        self.assertEqual((len(attached), attached.to_string()),
+                                         (len(content), content))
+
+                    with self.subTest(content=content):
+                        string[0:3] = content[0:3].upper()
+                        self.assertEqual(attached[0:3], content[0:3].upper())
+
+        with self.subTest():
+            with MutableString("abc").share() as string:
+                with self.assertRaises(RuntimeError):
+                    MutableString.attach(string.shared_memory_name, "w")
+
+    def test_attach_other_process(self) -> None:
+        """Tests that a process attaching to a block, without being started by the owner,
+        does not remove the block on exit.
+        """
+        source = Path(__file__).parents[3]
+        environment = dict(os.environ, PYTHONPATH=str(source))
+        with MutableString("key = value").share() as string:
+            name = string.shared_memory_name
+            code = ("from sw_core.data_types.mutable_string import MutableString\n"
+                    f"with MutableString.attach({name!r}) as string:\n"
+                    "    print(string.to_string(), end='')\n")
+            for _ in range(2):
+                result = subprocess.run([sys.executable, "-c", code], env=environment,
+                                        capture_output=True, text=True, check=True)
+                with self.subTest():
+                    self.assertEqual(result.stdout, "key = value")
+
+            with MutableString.attach(string.shared_memory_name) as attached:
+                with self.subTest():
+                    self.assertEqual(attached.to_string(), "key = value")
+
+    def test_attach_untracked(self) -> None:
+        """Tests that attaching to a block does not register it with the resource tracker,
+        nor replace `resource_tracker.register`, which the other threads may be using.
+        """
+        registered = []
+        original_register = resource_tracker.register
+        self.addCleanup(setattr, resource_tracker, "register", original_register)
+
+        def register(name: str, rtype: str) -> None:
+            registered.append(name)
+            original_register(name, rtype)
+
+        resource_tracker.register = register
+        with MutableString("key = value").share() as string:
+            with MutableString.attach(string.shared_memory_name) as attached:
+                with self.subTest():
+                    self.assertIs(resource_tracker.register, register)
+                    self.assertEqual(attached.to_string(), "key = value")
+
+        with self.subTest():
+            self.assertEqual(len(registered), 1 if os.name == "posix" else 0)
+
+    @unittest.skipUnless(os.name == "posix", "Blocks are removed by name on POSIX only")
+    def test_close(self) -> None:
+        """Tests that `close` tolerates a block already removed.
+        """
+        string = MutableString("key = value").share()
+        shared_memory._posixshmem.shm_unlink(string._storage._memory._name)
+        string.close()
+
+    def test_convert(self) -> None:
+        """Tests for the `convert` method, one chunk at a time.
+        """
+        original_chunk_length = shared_memory_storage.CHUNK_LENGTH
+        shared_memory_storage.CHUNK_LENGTH = 3
+        self.addCleanup(setattr, shared_memory_storage, "CHUNK_LENGTH",
+                        original_chunk_length)
+
+        storage = SharedMemoryStorage("abc \xdf\xff\xb5 " * 3)
+        self.addCleanup(storage.close)
+
+        with self.subTest():
+            self.assertEqual(storage.convert(0, 21, str.upper), 21)
+            self.assertEqual(storage.to_string(), "ABC \xdf\xff\xb5 " * 3)
+
+        with self.subTest():
+            storage.convert(0, 21, str.lower)
+            self.assertEqual(storage.to_string(), "abc \xdf\xff\xb5 " * 3)
+
+    def test_find(self) -> None:
+        """Tests for the `find` method, across the chunks.
+        """
+        original_chunk_length = shared_memory_storage.CHUNK_LENGTH
+        shared_memory_storage.CHUNK_LENGTH = 4
+        self.addCleanup(setattr, shared_memory_storage, "CHUNK_LENGTH",
+                        original_chunk_length)
+
+        content = "key_1 = value\nkey_2 = Straße\n"
+        storage = SharedMemoryStorage(content)
+        self.addCleanup(storage.close)
+
+        for substr in ("key", "value", "ße\n", "\nkey_2", "", "missing", content):
+            for start, end in ((None, None), (1, None), (3, 20), (20, 3), (40, None)):
+                with self.subTest(substr=substr, start=start, end=end):
+                    self.assertEqual(storage.find(substr, start, end),
+                                     content.find(substr, start, end))
+
+    def test_garbage_collected(self) -> None:
+        """Tests that the block of a storage garbage collected without being closed is
+        removed.
+        """
+        string = MutableString("key = value").share()
+        name = string.shared_memory_name
+        del string
+        gc.collect()
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name)
+
+    def test_pickle(self) -> None:
+        """Tests that a shared `MutableString` is pickled as the name of its block.
+        """
+        content = "key = value" * 1000
+        with MutableString(content).share() as string:
+            data = pickle.dumps(string)
+            with pickle.loads(data) as unpickled:
+                with self.subTest():
+                    self.assertLess(len(data), 1000)
+
+                with self.subTest():
+                    self.assertEqual(unpickled.to_string(), content)
+
+                with self.subTest():
+                    unpickled[0:3] = "KEY"
+                    self.assertEqual(string[0:3], "KEY")
+
+        with MutableString(content).share() as string:
+            string.use_search_index()
+            string.use_journal()
+            string.subscribe(lambda start, stop, new_stop: None)
+            string.range_hash(0, 3)
+            string.line_column(10)
+            string.find("value")
+            with self.subTest():
+                self.assertLess(len(pickle.dumps(string)), 1000)
+
+    def test_read_only(self) -> None:
+        """Tests that a content attached in read-only mode cannot be edited.
+        """
+        with MutableString("key = value").share() as string:
+            with MutableString.attach(string.shared_memory_name) as attached:
+                with self.assertRaises(RuntimeError):
+                    attached[0] = "K"
+
+    def test_set_item(self) -> None:
+        """Tests for the `__setitem__` method, which must keep the length and the width.
+        """
+        with MutableString("key = value").share() as string:
+            with self.subTest():
+                string[0:3] = "KEY"
+                string[-1] = "é"
+                self.assertEqual(string.to_string(), "KEY = valué")
+
+            with self.assertRaises(RuntimeError):
+                string[0:3] = "K"
+
+            with self.assertRaises(RuntimeError):
+                string[0] = "€"
+
+            with self.assertRaises(RuntimeError):
+                string.insert(0, "K")
+
+    def test_shared_memory_name(self) -> None:
+        """Tests for the `shared_memory_name` property.
+        """
+        with self.subTest():
+            self.assertIsNone(MutableString("abc").shared_memory_name)
+
+        with self.subTest():
+            with MutableString("abc").share() as string:
+                self.assertIsInstance(string.shared_memory_name, str)
+
+    def test_undo_redo(self) -> None:
+        """Tests that the edits rejected by the storage are not recorded by the journal.
+        """
+        with MutableString("key = value").share() as string:
+            string.use_journal()
+            string[0:3] = "KEY"
+            with self.assertRaises(RuntimeError):
+                string[0] = "€"
+
+            with self.subTest():
+                self.assertTrue(string.undo())
+                self.assertEqual(string.to_string(), "key = value")
+                self.assertFalse(string.undo())
+
+    def test_workers(self) -> None:
+        """Tests that worker processes write disjoint ranges of the same content.
+        """
+        content = "abcdefgh" * 1000
+        ranges = [(0, 2000), (2000, 4000), (4000, 8000)]
+        with MutableString(content).share() as string:
+            with multiprocessing.Pool(3) as pool:
+                results = pool.starmap(upper_range,
+                                       [(string.shared_memory_name, start, end)
+                                        for start, end in ranges])
+
+            with self.subTest():
+                self.assertEqual(string.to_string(), content.upper())
+
+            for result, (start, end) in zip(results, ranges):
+                with self.subTest(start=start, end=end):
+                    self.assertEqual(result[start:end], content[start:end].upper())
+
+    def test_write_range(self) -> None:
+        """Tests that a content attached in read-write mode can be edited only in the
+        given range.
+        """
+        with MutableString("key = value").share() as string:
+            name = string.shared_memory_name
+            with MutableString.attach(name, "r+", 6, None) as attached:
+                with self.subTest():
+                    attached.upper(6)
+                    self.assertEqual(string.to_string(), "key = VALUE")
+
+                with self.assertRaises(RuntimeError):
+                    attached[0:3] = "KEY"
+
+                with self.assertRaises(RuntimeError):
+                    attached.upper()
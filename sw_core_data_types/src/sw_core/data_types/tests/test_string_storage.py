@@ -0,0 +1,235 @@
+"""
+StringStorageTestSuite
+----------------------
+
+Tests for the `MutableString` storage engines.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..string_storage import ArrayStorage, StringStorage, StrStorage
+
+
+class StrStorageTestSuite(unittest.TestCase):
+    """
+    Tests for the `StrStorage` class. The tests are inherited by the suites of the other
+    storage engines, which only need to override `storage_type`.
+    """
+    storage_type: type[StringStorage] = StrStorage
+
+    def test_abstract(self) -> None:
+        """Tests that only the storage engines implementing all the primitives can be
+        created.
+        """
+        with self.assertRaises(TypeError):
+            StringStorage()  # type: ignore[abstract]
+
+    def test_append(self) -> None:
+        """Tests for the `append` method.
+        """
+        storage = self.storage_type("abc")
+        storage.append("de")
+        storage.append("€")
+
+        with self.subTest():
+            self.assertEqual((len(storage), storage.get_item(5)), (6, "€"))
+
+        with self.subTest():
+            storage.append("f")
+            self.assertEqual(storage.get_range(2, 7), "cde€f")
+
+        with self.subTest():
+            storage.append("g")
+            storage.load("xyz")
+            self.assertEqual(storage.to_string(), "xyz")
+
+    def test_copy(self) -> None:
+        """Tests for the `copy` method.
+        """
+        storage = self.storage_type("abc def")
+        copy = storage.copy()
+
+        with self.subTest():
+            copy.replace(0, 1, "A")
+            self.assertEqual(storage.to_string(), "abc def")
+            self.assertEqual(copy.to_string(), "Abc def")
+
+        with self.subTest():
+            storage.replace(4, 7, "€")
+            self.assertEqual(storage.to_string(), "abc €")
+            self.assertEqual(copy.to_string(), "Abc def")
+
+        with self.subTest():
+            storage.copy().load("xyz")
+            self.assertEqual(storage.to_string(), "abc €")
+
+    def test_find(self) -> None:
+        """Tests for the `find` method.
+        """
+        storage = self.storage_type("first string")
+
+        with self.subTest():
+            self.assertEqual(storage.find("in"), 9)
+
+        with self.subTest():
+            self.assertEqual(storage.find("i", 2), 9)
+
+        with self.subTest():
+            self.assertEqual(storage.find("in", 0, 9), -1)
+
+    def test_get_item(self) -> None:
+        """Tests for the `get_item` method.
+        """
+        storage = self.storage_type("aé€😀")
+        self.assertEqual([storage.get_item(index) for index in range(4)],
+                         ["a", "é", "€", "😀"])
+
+    def test_get_range(self) -> None:
+        """Tests for the `get_range` method.
+        """
+        storage = self.storage_type("abcdef")
+
+        with self.subTest():
+            self.assertEqual(storage.get_range(1, 4), "bcd")
+
+        with self.subTest():
+            self.assertEqual(storage.get_range(3, 3), "")
+
+    def test_len(self) -> None:
+        """Tests for the `__len__` method.
+        """
+        with self.subTest():
+            self.assertEqual(len(self.storage_type()), 0)
+
+        with self.subTest():
+            self.assertEqual(len(self.storage_type("a€😀")), 3)
+
+    def test_load(self) -> None:
+        """Tests for the `load` method.
+        """
+        storage = self.storage_type("abc")
+        storage.load("a€😀 def")
+
+        self.assertEqual(storage.to_string(), "a€😀 def")
+
+    def test_memory_usage(self) -> None:
+        """Tests for the `memory_usage` method.
+        """
+        storage = self.storage_type("abc" * 1000)
+        storage.to_string()
+        self.assertGreaterEqual(storage.memory_usage(), 3000)
+
+    def test_replace(self) -> None:
+        """Tests for the `replace` method.
+        """
+        storage = self.storage_type("abcdef")
+
+        with self.subTest():
+            storage.replace(0, 1, "1")
+            self.assertEqual(storage.to_string(), "1bcdef")
+
+        with self.subTest():
+            storage.replace(1, 3, "23")
+            self.assertEqual(storage.to_string(), "123def")
+
+        with self.subTest():
+            storage.replace(6, 6, "gh")
+            self.assertEqual(storage.to_string(), "123defgh")
+
+        with self.subTest():
+            storage.replace(3, 8, "4")
+            self.assertEqual(storage.to_string(), "1234")
+
+    def test_replace_wide_characters(self) -> None:
+        """Tests for the `replace` method with characters outside Latin-1.
+        """
+        storage = self.storage_type("abc")
+
+        with self.subTest():
+            storage.replace(1, 2, "€")
+            self.assertEqual(storage.to_string(), "a€c")
+
+        with self.subTest():
+            storage.replace(2, 3, "😀")
+            self.assertEqual(storage.to_string(), "a€😀")
+
+        with self.subTest():
+            storage.replace(0, 1, "é")
+            self.assertEqual(storage.to_string(), "é€😀")
+
+
+class ArrayStorageTestSuite(StrStorageTestSuite):
+    """
+    Tests for the `ArrayStorage` class.
+    """
+    storage_type = ArrayStorage
+
+    def test_item_width(self) -> None:
+        """Tests that the width of the items is chosen from the content.
+        """
+        with self.subTest():
+            self.assertEqual(ArrayStorage("abcé")._array.itemsize, 1)
+
+        with self.subTest():
+            self.assertEqual(ArrayStorage("abc€")._array.itemsize, 2)
+
+        with self.subTest():
+            self.assertEqual(ArrayStorage("abc😀")._array.itemsize, 4)
+
+        with self.subTest():
+            self.assertEqual(ArrayStorage("abc\ud83d")._array.itemsize, 4)
+
+    def test_memory_usage_width(self) -> None:
+        """Tests that the memory usage follows the width of the items.
+        """
+        for string, width in (("abc" * 1000, 1), ("ab€" * 1000, 2), ("ab😀" * 1000, 4)):
+            with self.subTest(width=width):
+                usage = ArrayStorage(string).memory_usage()
+                self.assertEqual(round(usage / len(string)), width)
+
+    def test_widening(self) -> None:
+        """Tests that writing a wide character widens the items.
+        """
+        storage = ArrayStorage("abc")
+
+        with self.subTest():
+            storage.replace(0, 1, "€")
+            self.assertEqual((storage._array.itemsize, storage.to_string()), (2, "€bc"))
+
+        with self.subTest():
+            storage.replace(1, 2, "é")
+            self.assertEqual((storage._array.itemsize, storage.to_string()), (2, "€éc"))
+
+        with self.subTest():
+            storage.replace(2, 3, "😀!")
+            self.assertEqual((storage._array.itemsize, storage.to_string()), (4, "€é😀!"))
+
+    def test_to_string_cache(self) -> None:
+        """Tests that `to_string` is cached until the next mutation.
+        """
+        storage = ArrayStorage("abc")
+        string = storage.to_string()
+
+        with self.subTest():
+            self.assertIs(storage.to_string(), string)
+
+        storage.replace(0, 1, "d")
+        with self.subTest():
+            self.assertEqual(storage.to_string(), "dbc")
+
+        with self.subTest():
+            self.assertIs(storage.to_string(), storage.to_string())
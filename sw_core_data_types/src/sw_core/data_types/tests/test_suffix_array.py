@@ -0,0 +1,85 @@
+"""
+SuffixArrayTestSuite
+--------------------
+
+Tests for the `SuffixArray` class.
+
+
+__author__ = "Studio W Engineers"
+
+__version__ = "0.0.1"
+
+__maintainer__ = "Studio W Engineers"
+
+__email__ = "studio.w.engineers@gmail.com"
+
+__status__ "Release to manufacturing"
+"""
+# standard library imports
+import random
+import unittest
+
+# third party library imports
+
+# local library specific imports
+from ..suffix_array import SuffixArray
+
+
+class SuffixArrayTestSuite(unittest.TestCase):
+    """
+    Tests for the `SuffixArray` class.
+    """
+    def test_empty_text(self) -> None:
+        """Tests the index of the empty string.
+        """
+        index = SuffixArray("")
+
+        with self.subTest():
+            self.assertEqual(index.find("a"), -1)
+
+        with self.subTest():
+            self.assertEqual(index.find_all("a"), [])
+
+    def test_find(self) -> None:
+        """Tests for the `find` method.
+        """
+        index = SuffixArray("first string")
+
+        with self.subTest():
+            self.assertEqual(index.find("in"), 9)
+
+        with self.subTest():
+            self.assertEqual(index.find("ci"), -1)
+
+        with self.subTest():
+            self.assertEqual(index.find("st", 4), 6)
+
+        with self.subTest():
+            self.assertEqual(index.find("st", 0, 4), -1)
+
+    def test_find_all(self) -> None:
+        """Tests for the `find_all` method.
+        """
+        index = SuffixArray("aaa€aa😀aaaa")
+
+        with self.subTest():
+            self.assertEqual(index.find_all("aa"), [0, 1, 4, 7, 8, 9])
+
+        with self.subTest():
+            self.assertEqual(index.find_all("a😀a"), [5])
+
+        with self.subTest():
+            self.assertEqual(index.find_all("aa", 1, 9), [1, 4, 7])
+
+    def test_random_texts(self) -> None:
+        """Tests that the occurrences match the ones found by `str.find`.
+        """
+        generator = random.Random(0)
+        for _ in range(50):
+            text = "".join(generator.choice("ab\n") for _ in range(generator.randrange(300)))
+            index = SuffixArray(text)
+            for pattern in ["a", "ab", "ba", "aab", "\nb", "bbb"]:
+                expected = [position for position in range(len(text))
+                            if text.startswith(pattern, position)]
+                with self.subTest(text=text, pattern=pattern):
+                    self.assertEqual(index.find_all(pattern), expected)